@@ -1,26 +1,31 @@
 from trainml.trainml import TrainML
+from trainml.pipeline import Pipeline
 import asyncio
 
 
 trainml_client = TrainML()
 
-# Create the dataset
-dataset = asyncio.run(
-    trainml_client.datasets.create(
+# Completed stages are saved to the state file, so re-running this script
+# after a failure resumes from the stage that failed
+pipeline = Pipeline(trainml_client, state_file="training_inference.json")
+
+
+@pipeline.stage()
+async def dataset(trainml):
+    dataset = await trainml.datasets.create(
         name="Example Dataset",
         source_type="aws",
         source_uri="s3://trainml-examples/data/cifar10",
     )
-)
-
-print(dataset)
+    print(dataset)
+    # Watch the log output, attach will return when data transfer is complete
+    await dataset.attach()
+    return dataset.id
 
-# Watch the log output, attach will return when data transfer is complete
-asyncio.run(dataset.attach())
 
-# Create the job
-training_job = asyncio.run(
-    trainml_client.jobs.create(
+@pipeline.stage(depends=["dataset"])
+async def training(trainml, dataset):
+    training_job = await trainml.jobs.create(
         name="Example Training Job",
         type="training",
         gpu_types=["rtx2080ti", "rtx3090"],
@@ -29,33 +34,34 @@ training_job = asyncio.run(
         workers=[
             "python training/image-classification/resnet_cifar.py --epochs 10 --optimizer adam --batch-size 128",
         ],
-        data=dict(
-            datasets=[dataset.id], output_type="trainml", output_uri="model"
-        ),
+        data=dict(datasets=[dataset], output_type="trainml", output_uri="model"),
         model=dict(
             source_type="git",
             source_uri="https://github.com/trainML/examples.git",
         ),
     )
-)
-print(training_job)
-
-# Watch the log output, attach will return when the training job stops
-asyncio.run(training_job.attach())
+    print(training_job)
+    # Watch the log output, attach will return when the training job stops
+    await training_job.attach()
+    # Get the trained model id from the workers
+    training_job = await training_job.refresh()
+    return dict(
+        job=training_job.id, model=training_job.workers[0].get("output_uuid")
+    )
 
-# Get the trained model id from the workers
-training_job = asyncio.run(training_job.refresh())
 
-model = asyncio.run(
-    trainml_client.models.get(training_job.workers[0].get("output_uuid"))
-)
+@pipeline.stage(depends=["training"])
+async def model(trainml, training):
+    model = await trainml.models.get(training["model"])
+    # Ensure the model is ready to use
+    await model.wait_for("ready")
+    return model.id
 
-# Ensure the model is ready to use
-asyncio.run(model.wait_for("ready"))
 
-# Use the model in an inference job on new data
-inference_job = asyncio.run(
-    trainml_client.jobs.create(
+@pipeline.stage(depends=["model"])
+async def inference(trainml, model):
+    # Use the model in an inference job on new data
+    inference_job = await trainml.jobs.create(
         name="Example Inference Job",
         type="inference",
         gpu_types=["rtx2080ti", "rtx3090"],
@@ -70,18 +76,29 @@ inference_job = asyncio.run(
             output_type="aws",
             output_uri="s3://trainml-examples/output/model_predictions",
         ),
-        model=dict(source_type="trainml", source_uri=model.id),
+        model=dict(source_type="trainml", source_uri=model),
+    )
+    print(inference_job)
+    # Watch the log output, attach will return when the inference job stops
+    await inference_job.attach()
+    return inference_job.id
+
+
+async def cleanup(outputs):
+    # (Optional) Cleanup
+    training_job = await trainml_client.jobs.get(outputs["training"]["job"])
+    inference_job = await trainml_client.jobs.get(outputs["inference"])
+    model = await trainml_client.models.get(outputs["model"])
+    dataset = await trainml_client.datasets.get(outputs["dataset"])
+    await asyncio.gather(
+        training_job.remove(),
+        inference_job.remove(),
+        model.remove(),
+        dataset.remove(),
     )
-)
-print(inference_job)
+    pipeline.reset()
 
-# Watch the log output, attach will return when the training job stops
-asyncio.run(inference_job.attach())
 
-# (Optional) Cleanup
-asyncio.gather(
-    training_job.remove(),
-    inference_job.remove(),
-    model.remove(),
-    dataset.remove(),
-)
+outputs = asyncio.run(pipeline.run())
+print(outputs)
+asyncio.run(cleanup(outputs))
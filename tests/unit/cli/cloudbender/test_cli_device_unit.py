@@ -36,3 +36,30 @@ def test_list_no_provider(runner, mock_devices):
         )
         result = runner.invoke(specimen, ["list"])
         assert result.exit_code != 0
+
+
+def test_remove(runner):
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.cloudbender = AsyncMock()
+        mock_trainml.cloudbender.devices = AsyncMock()
+        device = AsyncMock(id="dev-id-1")
+        with patch(
+            "trainml.cli.TrainMLRunner.find", return_value=device
+        ) as mock_find:
+            result = runner.invoke(
+                specimen,
+                args=[
+                    "remove",
+                    "--provider=prov-id-1",
+                    "--region=reg-id-1",
+                    device.id,
+                ],
+            )
+        assert result.exit_code == 0
+        mock_find.assert_called_once_with(
+            device.id,
+            mock_trainml.cloudbender.devices,
+            provider_uuid="prov-id-1",
+            region_uuid="reg-id-1",
+        )
+        device.remove.assert_called_once()
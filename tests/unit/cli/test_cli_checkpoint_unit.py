@@ -31,7 +31,7 @@ def test_list(runner, mock_my_checkpoints):
         mock_trainml.checkpoints.list.assert_called_once()
 
 
-def test_attach_success(runner, mock_my_checkpoints):
+def test_attach_success(runner, mock_my_checkpoints, monkeypatch):
     """Test attach command success (lines 32-38)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
 
@@ -47,7 +47,9 @@ def test_attach_success(runner, mock_my_checkpoints):
         async def attach_async():
             return None
 
-        checkpoint.attach = Mock(return_value=attach_async())
+        monkeypatch.setattr(
+            type(checkpoint), "attach", Mock(return_value=attach_async())
+        )
 
         with patch("trainml.cli.search_by_id_name", return_value=checkpoint):
             result = runner.invoke(specimen, ["attach", "1"])
@@ -71,7 +73,7 @@ def test_attach_not_found(runner, mock_my_checkpoints):
             assert "Cannot find specified checkpoint" in result.output
 
 
-def test_connect_with_attach(runner, mock_my_checkpoints):
+def test_connect_with_attach(runner, mock_my_checkpoints, monkeypatch):
     """Test connect command with attach (lines 56-65, attach=True)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
 
@@ -89,8 +91,12 @@ def test_connect_with_attach(runner, mock_my_checkpoints):
         async def attach_async():
             return None
 
-        checkpoint.connect = Mock(return_value=connect_async())
-        checkpoint.attach = Mock(return_value=attach_async())
+        monkeypatch.setattr(
+            type(checkpoint), "connect", Mock(return_value=connect_async())
+        )
+        monkeypatch.setattr(
+            type(checkpoint), "attach", Mock(return_value=attach_async())
+        )
 
         with patch("trainml.cli.search_by_id_name", return_value=checkpoint):
             result = runner.invoke(specimen, ["connect", "1"])
@@ -99,7 +105,7 @@ def test_connect_with_attach(runner, mock_my_checkpoints):
             checkpoint.attach.assert_called_once()
 
 
-def test_connect_no_attach(runner, mock_my_checkpoints):
+def test_connect_no_attach(runner, mock_my_checkpoints, monkeypatch):
     """Test connect command without attach (lines 56-65, attach=False)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
 
@@ -114,7 +120,9 @@ def test_connect_no_attach(runner, mock_my_checkpoints):
         async def connect_async():
             return None
 
-        checkpoint.connect = Mock(return_value=connect_async())
+        monkeypatch.setattr(
+            type(checkpoint), "connect", Mock(return_value=connect_async())
+        )
 
         with patch("trainml.cli.search_by_id_name", return_value=checkpoint):
             result = runner.invoke(specimen, ["connect", "--no-attach", "1"])
@@ -138,7 +146,9 @@ def test_connect_not_found(runner, mock_my_checkpoints):
             assert "Cannot find specified checkpoint" in result.output
 
 
-def test_create_with_connect_and_attach(runner, tmp_path, mock_my_checkpoints):
+def test_create_with_connect_and_attach(
+    runner, tmp_path, mock_my_checkpoints, monkeypatch
+):
     """Test create command with connect and attach (lines 103-115)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
         checkpoint = mock_my_checkpoints[0]
@@ -149,8 +159,12 @@ def test_create_with_connect_and_attach(runner, tmp_path, mock_my_checkpoints):
         async def attach_async():
             return None
 
-        checkpoint.connect = Mock(return_value=connect_async())
-        checkpoint.attach = Mock(return_value=attach_async())
+        monkeypatch.setattr(
+            type(checkpoint), "connect", Mock(return_value=connect_async())
+        )
+        monkeypatch.setattr(
+            type(checkpoint), "attach", Mock(return_value=attach_async())
+        )
 
         async def create_async(**kwargs):
             return checkpoint
@@ -171,7 +185,9 @@ def test_create_with_connect_and_attach(runner, tmp_path, mock_my_checkpoints):
         checkpoint.attach.assert_called_once()
 
 
-def test_create_with_connect_no_attach(runner, tmp_path, mock_my_checkpoints):
+def test_create_with_connect_no_attach(
+    runner, tmp_path, mock_my_checkpoints, monkeypatch
+):
     """Test create command with connect but no attach (lines 103-115)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
         checkpoint = mock_my_checkpoints[0]
@@ -179,7 +195,9 @@ def test_create_with_connect_no_attach(runner, tmp_path, mock_my_checkpoints):
         async def connect_async():
             return None
 
-        checkpoint.connect = Mock(return_value=connect_async())
+        monkeypatch.setattr(
+            type(checkpoint), "connect", Mock(return_value=connect_async())
+        )
 
         async def create_async(**kwargs):
             return checkpoint
@@ -238,7 +256,7 @@ def test_list_public(runner, mock_my_checkpoints):
         instance.checkpoints.list_public.assert_called_once()
 
 
-def test_remove_success(runner, mock_my_checkpoints):
+def test_remove_success(runner, mock_my_checkpoints, monkeypatch):
     """Test remove command success (lines 192-201)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
 
@@ -253,7 +271,9 @@ def test_remove_success(runner, mock_my_checkpoints):
         async def remove_async():
             return None
 
-        checkpoint.remove = Mock(return_value=remove_async())
+        monkeypatch.setattr(
+            type(checkpoint), "remove", Mock(return_value=remove_async())
+        )
 
         with patch("trainml.cli.search_by_id_name", return_value=checkpoint):
             result = runner.invoke(specimen, ["remove", "1"])
@@ -277,7 +297,7 @@ def test_remove_not_found(runner, mock_my_checkpoints):
             assert "Cannot find specified checkpoint" in result.output
 
 
-def test_rename_success(runner, mock_my_checkpoints):
+def test_rename_success(runner, mock_my_checkpoints, monkeypatch):
     """Test rename command success (lines 214-223)."""
     with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
         checkpoint = mock_my_checkpoints[0]
@@ -285,7 +305,9 @@ def test_rename_success(runner, mock_my_checkpoints):
         async def rename_async():
             return None
 
-        checkpoint.rename = Mock(return_value=rename_async())
+        monkeypatch.setattr(
+            type(checkpoint), "rename", Mock(return_value=rename_async())
+        )
 
         async def get_async(checkpoint_id):
             return checkpoint
@@ -1,7 +1,8 @@
+import io
 import re
 import json
 import click
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from pytest import mark, fixture, raises
 
 pytestmark = [mark.cli, mark.unit, mark.jobs]
@@ -18,3 +19,273 @@ def test_list(runner, mock_jobs):
         print(result)
         assert result.exit_code == 0
         mock_trainml.jobs.list.assert_called_once()
+
+
+def test_list_csv(runner, mock_jobs):
+    output = io.StringIO()
+    with (
+        patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml,
+        patch("trainml.cli.stdout", new=output),
+    ):
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.list = AsyncMock(return_value=mock_jobs)
+        result = runner.invoke(
+            specimen,
+            [
+                "list",
+                "--format",
+                "csv",
+                "-F",
+                "job_uuid",
+                "-F",
+                "resources.gpu_count",
+            ],
+        )
+        assert result.exit_code == 0
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "job_uuid,resources.gpu_count"
+    assert len(lines) == len(mock_jobs) + 1
+
+
+def test_list_parquet_requires_file(runner, mock_jobs):
+    with (
+        patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml,
+        patch("trainml.cli.stdout", new=io.StringIO()),
+    ):
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.list = AsyncMock(return_value=mock_jobs)
+        result = runner.invoke(specimen, ["list", "--format", "parquet"])
+        assert result.exit_code != 0
+
+
+def test_list_parquet_rejects_stdout(runner, mock_jobs):
+    ## the default --output-file - is stdout, with a binary buffer
+    class StdoutBuffer(io.BytesIO):
+        name = "<stdout>"
+
+    terminal = io.TextIOWrapper(StdoutBuffer(), encoding="utf-8")
+    with (
+        patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml,
+        patch("trainml.cli.stdout", new=terminal),
+        patch("trainml.utils.records.write_parquet") as write_parquet,
+    ):
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.list = AsyncMock(return_value=mock_jobs)
+        result = runner.invoke(specimen, ["list", "--format", "parquet"])
+        assert result.exit_code != 0
+        assert "--output-file" in result.output
+        write_parquet.assert_not_called()
+
+
+def test_list_parquet_to_file(runner, mock_jobs, tmp_path):
+    with (
+        open(tmp_path / "jobs.parquet", "w") as output,
+        patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml,
+        patch("trainml.cli.stdout", new=output),
+        patch("trainml.utils.records.write_parquet") as write_parquet,
+    ):
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.list = AsyncMock(return_value=mock_jobs)
+        result = runner.invoke(specimen, ["list", "--format", "parquet"])
+        assert result.exit_code == 0, result.output
+        write_parquet.assert_called_once_with(mock_jobs, output.buffer, None)
+
+
+def test_attach_all(runner):
+    def make_job(name, status, type="training"):
+        job = AsyncMock(status=status, type=type, workers=[])
+        job.name = name
+        return job
+
+    running = make_job("running", "running")
+    finished = make_job("finished", "finished")
+    notebook = make_job("notebook", "running", type="notebook")
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.list = AsyncMock(
+            return_value=[running, finished, notebook]
+        )
+        result = runner.invoke(specimen, ["attach", "--all"])
+        assert result.exit_code == 0
+        running.attach.assert_called_once()
+        finished.attach.assert_not_called()
+        notebook.attach.assert_not_called()
+
+
+def test_attach_requires_job_or_all(runner):
+    with patch("trainml.cli.TrainML", new=AsyncMock):
+        result = runner.invoke(specimen, ["attach"])
+        assert result.exit_code != 0
+        assert "Specify a job or use --all" in result.output
+
+
+SWEEP = dict(
+    name="lr-{lr}",
+    gpu_type="rtx3090",
+    workers=["python train.py --lr {lr}"],
+    grid=dict(lr=[0.1, 0.01]),
+)
+
+
+def test_create_sweep_dry_run(runner, tmp_path):
+    grid = tmp_path / "sweep.json"
+    grid.write_text(json.dumps(SWEEP))
+    output = io.StringIO()
+    with (
+        patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml,
+        patch("trainml.cli.stdout", new=output),
+    ):
+        mock_trainml.jobs = AsyncMock()
+        result = runner.invoke(
+            specimen, ["create", "sweep", "--grid", str(grid), "--dry-run"]
+        )
+        assert result.exit_code == 0
+        mock_trainml.jobs.create_many.assert_not_called()
+    specs = json.loads(output.getvalue())
+    assert [spec["name"] for spec in specs] == ["lr-0.1", "lr-0.01"]
+    assert specs[0]["type"] == "training"
+    assert specs[1]["workers"] == ["python train.py --lr 0.01"]
+
+
+def test_create_sweep(runner, tmp_path):
+    grid = tmp_path / "sweep.json"
+    grid.write_text(json.dumps(SWEEP))
+    batch = Mock(failures=[])
+    batch.__iter__ = Mock(return_value=iter([]))
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.create_many = AsyncMock(return_value=batch)
+        result = runner.invoke(
+            specimen,
+            ["create", "sweep", "--grid", str(grid), "--concurrency", "4"],
+        )
+        assert result.exit_code == 0
+        specs = mock_trainml.jobs.create_many.call_args.args[0]
+        assert len(specs) == 2
+        assert mock_trainml.jobs.create_many.call_args.kwargs == dict(
+            concurrency=4
+        )
+
+
+def test_create_training_data_dir(runner, tmp_path):
+    job = AsyncMock()
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.create = AsyncMock(return_value=job)
+        mock_trainml.datasets = AsyncMock()
+        result = runner.invoke(
+            specimen,
+            [
+                "create",
+                "training",
+                "--no-connect",
+                "--no-attach",
+                "--data-dir",
+                str(tmp_path),
+                "test-job",
+                "python train.py",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        mock_trainml.datasets.create.assert_not_called()
+        data = mock_trainml.jobs.create.call_args.kwargs["data"]
+        assert data["input_type"] == "local"
+        assert data["input_uri"] == str(tmp_path)
+        job.wait_for.assert_called_once_with("waiting for data/model download")
+        job.connect.assert_called_once()
+        job.attach.assert_not_called()
+
+
+def test_create_training_gpu_type_auto(runner):
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.gpu_types = AsyncMock()
+        mock_trainml.gpu_types.select = AsyncMock(
+            return_value=dict(gpu_types=["rtx3090", "a4000"], max_price=1.5)
+        )
+        result = runner.invoke(
+            specimen,
+            [
+                "create",
+                "training",
+                "--no-connect",
+                "--no-attach",
+                "--gpu-type",
+                "auto",
+                "--budget",
+                "2.5",
+                "test-job",
+                "python train.py",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        mock_trainml.gpu_types.select.assert_called_once_with(
+            budget=2.5, profile="training"
+        )
+        kwargs = mock_trainml.jobs.create.call_args.kwargs
+        assert kwargs["gpu_types"] == ["rtx3090", "a4000"]
+        assert kwargs["max_price"] == 1.5
+
+
+def test_create_gpu_type_auto_exclusive(runner):
+    with patch("trainml.cli.TrainML", new=AsyncMock):
+        result = runner.invoke(
+            specimen,
+            [
+                "create",
+                "training",
+                "--gpu-type",
+                "auto",
+                "--gpu-type",
+                "t4",
+                "test-job",
+                "python train.py",
+            ],
+        )
+        assert result.exit_code != 0
+        assert "cannot be combined" in result.output
+
+
+def test_create_inference_shards(runner, tmp_path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_dir.mkdir()
+    output_dir.mkdir()
+    job = Mock()
+    job.name = "infer-shard-0"
+    batch = Mock(failures=[])
+    batch.__iter__ = Mock(return_value=iter([job]))
+    with patch("trainml.cli.TrainML", new=AsyncMock) as mock_trainml:
+        mock_trainml.jobs = AsyncMock()
+        mock_trainml.jobs.fan_out = AsyncMock(return_value=batch)
+        result = runner.invoke(
+            specimen,
+            [
+                "create",
+                "inference",
+                "--input-dir",
+                str(input_dir),
+                "--output-dir",
+                str(output_dir),
+                "--shards",
+                "3",
+                "infer",
+                "python infer.py",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        mock_trainml.jobs.create.assert_not_called()
+        call = mock_trainml.jobs.fan_out.call_args
+        assert call.args == ("infer", str(input_dir), str(output_dir), 3)
+        assert call.kwargs["concurrency"] == 4
+        assert call.kwargs["workers"] == ["python infer.py"]
+
+
+def test_create_inference_shards_requires_dirs(runner):
+    with patch("trainml.cli.TrainML", new=AsyncMock):
+        result = runner.invoke(
+            specimen,
+            ["create", "inference", "--shards", "3", "infer", "python infer.py"],
+        )
+        assert result.exit_code != 0
+        assert "--shards requires" in result.output
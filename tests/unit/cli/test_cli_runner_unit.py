@@ -0,0 +1,221 @@
+import asyncio
+import click
+from unittest.mock import AsyncMock, Mock, patch
+from pytest import mark, raises
+
+pytestmark = [mark.cli, mark.unit]
+
+import trainml.cli as specimen
+
+
+def test_runner_reuses_event_loop():
+    runner = specimen.TrainMLRunner()
+
+    async def get_loop():
+        return asyncio.get_running_loop()
+
+    try:
+        first = runner.run(get_loop())
+        second = runner.run(get_loop())
+        assert first is second
+        assert not first.is_closed()
+    finally:
+        runner.close()
+    assert first.is_closed()
+
+
+def test_runner_gathers_multiple_tasks():
+    runner = specimen.TrainMLRunner()
+
+    async def value(v):
+        return v
+
+    try:
+        assert runner.run(value(1), value(2)) == [1, 2]
+    finally:
+        runner.close()
+
+
+def test_runner_shares_session_with_client():
+    runner = specimen.TrainMLRunner()
+    client = Mock(session=None)
+
+    async def get_session():
+        return client.session
+
+    try:
+        with patch("trainml.cli.TrainML", return_value=client):
+            runner.client
+        first = runner.run(get_session())
+        second = runner.run(get_session())
+        assert first is second
+        assert not first.closed
+    finally:
+        runner.close()
+    assert first.closed
+
+
+def test_runner_without_client_skips_session():
+    runner = specimen.TrainMLRunner()
+
+    async def noop():
+        return None
+
+    try:
+        runner.run(noop())
+        assert runner._session is None
+    finally:
+        runner.close()
+
+
+def test_runner_raises_usage_error():
+    runner = specimen.TrainMLRunner()
+
+    async def fail():
+        raise ValueError("boom")
+
+    try:
+        with raises(click.UsageError) as error:
+            runner.run(fail())
+        assert isinstance(error.value.message, ValueError)
+        assert runner._stats["steps"] == 1
+    finally:
+        runner.close()
+
+
+def test_runner_close_without_run():
+    runner = specimen.TrainMLRunner()
+    runner.close()
+    assert runner._runner is None
+
+
+def test_config_closes_runner_with_context(runner):
+    @click.command()
+    @specimen.pass_config
+    def command(config):
+        config.trainml.run(asyncio.sleep(0))
+        command.runner = config.trainml
+
+    result = runner.invoke(command)
+    assert result.exit_code == 0
+    assert command.runner._runner is None
+
+
+JOB_ID = "1b8b5c4e-7c1f-4d2a-9d43-3f6a8f0e2b11"
+OTHER_ID = "c2a5d1f0-64b6-4b8e-8a1c-0d7e5b9f3a22"
+
+
+def make_item(id, name):
+    item = Mock(id=id)
+    item.name = name
+    return item
+
+
+class Jobs(object):
+    def __init__(self, items):
+        self.items = items
+        self.get = AsyncMock(side_effect=self._get)
+        self.list = AsyncMock(return_value=items)
+
+    async def _get(self, id, **kwargs):
+        for item in self.items:
+            if item.id == id:
+                return item
+        raise specimen.ApiError(404, {"message": "Not Found"})
+
+
+def make_runner(tmp_path):
+    runner = specimen.TrainMLRunner()
+    runner._trainml_client = Mock(
+        config_dir=str(tmp_path), active_project="proj-id", session=None
+    )
+    return runner
+
+
+def test_find_by_id_skips_list(tmp_path):
+    jobs = Jobs([make_item(JOB_ID, "job-1")])
+    runner = make_runner(tmp_path)
+    try:
+        found = runner.find(JOB_ID, jobs)
+    finally:
+        runner.close()
+    assert found.id == JOB_ID
+    jobs.get.assert_called_once_with(id=JOB_ID)
+    jobs.list.assert_not_called()
+
+
+def test_find_missing_id_falls_back_to_list(tmp_path):
+    jobs = Jobs([make_item(JOB_ID, OTHER_ID)])
+    runner = make_runner(tmp_path)
+    try:
+        found = runner.find(OTHER_ID, jobs)
+    finally:
+        runner.close()
+    assert found.id == JOB_ID
+    jobs.list.assert_called_once_with()
+
+
+def test_find_by_name_uses_index(tmp_path):
+    jobs = Jobs([make_item(OTHER_ID, "job-2"), make_item(JOB_ID, "job-1")])
+    runner = make_runner(tmp_path)
+    try:
+        assert runner.find("job-1", jobs).id == JOB_ID
+    finally:
+        runner.close()
+    jobs.list.assert_called_once_with()
+    jobs.get.assert_not_called()
+    assert (tmp_path / "name_index.json").exists()
+
+    jobs.list.reset_mock()
+    runner = make_runner(tmp_path)
+    try:
+        assert runner.find("job-1", jobs).id == JOB_ID
+    finally:
+        runner.close()
+    jobs.get.assert_called_once_with(id=JOB_ID)
+    jobs.list.assert_not_called()
+
+
+def test_find_by_name_ignores_stale_index(tmp_path):
+    jobs = Jobs([make_item(JOB_ID, "job-1")])
+    runner = make_runner(tmp_path)
+    try:
+        runner.find("job-1", jobs)
+        jobs.items[0].name = "renamed"
+        jobs.items.append(make_item(OTHER_ID, "job-1"))
+        assert runner.find("job-1", jobs).id == OTHER_ID
+    finally:
+        runner.close()
+    assert jobs.list.call_count == 2
+
+
+def test_find_by_name_index_expires(tmp_path):
+    jobs = Jobs([make_item(JOB_ID, "job-1")])
+    runner = make_runner(tmp_path)
+    try:
+        runner.find("job-1", jobs)
+        with patch(
+            "trainml.cli.time.time",
+            return_value=specimen.time.time() + specimen.NAME_INDEX_TTL + 1,
+        ):
+            runner.find("job-1", jobs)
+    finally:
+        runner.close()
+    jobs.get.assert_not_called()
+    assert jobs.list.call_count == 2
+
+
+def test_find_passes_parents_and_scopes_index(tmp_path):
+    jobs = Jobs([make_item(JOB_ID, "node-1")])
+    runner = make_runner(tmp_path)
+    try:
+        runner.find("node-1", jobs, provider_uuid="p1", region_uuid="r1")
+        runner.find("node-1", jobs, provider_uuid="p1", region_uuid="r2")
+        runner.find("node-1", jobs, provider_uuid="p1", region_uuid="r1")
+    finally:
+        runner.close()
+    assert jobs.list.call_count == 2
+    jobs.list.assert_called_with(provider_uuid="p1", region_uuid="r2")
+    jobs.get.assert_called_once_with(
+        id=JOB_ID, provider_uuid="p1", region_uuid="r1"
+    )
@@ -243,7 +243,7 @@ class nodeTests:
         mock_trainml._query = AsyncMock(
             side_effect=[api_response_new, api_response_active]
         )
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             result = await node.wait_for("active", timeout=10)
         assert result == node
         assert node.status == "active"
@@ -254,7 +254,7 @@ class nodeTests:
         node._status = "active"
         api_error = ApiError(404, {"errorMessage": "Not found"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             await node.wait_for("archived", timeout=10)
 
     @mark.asyncio
@@ -268,7 +268,7 @@ class nodeTests:
             status="errored",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_errored)
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(NodeError):
                 await node.wait_for("active", timeout=10)
 
@@ -283,7 +283,7 @@ class nodeTests:
             status="new",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_new)
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(TrainMLException) as exc_info:
                 await node.wait_for("active", timeout=0.1)
         assert "Timeout waiting for" in str(exc_info.value.message)
@@ -294,7 +294,7 @@ class nodeTests:
         node._status = "active"
         api_error = ApiError(500, {"errorMessage": "Server Error"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(ApiError):
                 await node.wait_for("archived", timeout=10)
 
@@ -309,6 +309,6 @@ class nodeTests:
             status="failed",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_failed)
-        with patch("trainml.cloudbender.nodes.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(NodeError):
                 await node.wait_for("active", timeout=10)
@@ -183,7 +183,7 @@ class providerTests:
         mock_trainml._query = AsyncMock(
             side_effect=[api_response_new, api_response_ready]
         )
-        with patch("trainml.cloudbender.providers.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             result = await provider.wait_for("ready", timeout=10)
         assert result == provider
         assert provider.status == "ready"
@@ -194,7 +194,7 @@ class providerTests:
         provider._status = "ready"
         api_error = ApiError(404, {"errorMessage": "Not found"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.providers.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             await provider.wait_for("archived", timeout=10)
 
     @mark.asyncio
@@ -207,7 +207,7 @@ class providerTests:
             status="errored",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_errored)
-        with patch("trainml.cloudbender.providers.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(specimen.ProviderError):
                 await provider.wait_for("ready", timeout=10)
 
@@ -221,7 +221,7 @@ class providerTests:
             status="new",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_new)
-        with patch("trainml.cloudbender.providers.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(TrainMLException) as exc_info:
                 await provider.wait_for("ready", timeout=0.1)
         assert "Timeout waiting for" in str(exc_info.value.message)
@@ -232,6 +232,6 @@ class providerTests:
         provider._status = "ready"
         api_error = ApiError(500, {"errorMessage": "Server Error"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.providers.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(ApiError):
                 await provider.wait_for("archived", timeout=10)
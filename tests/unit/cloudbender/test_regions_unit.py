@@ -235,7 +235,7 @@ class regionTests:
         mock_trainml._query = AsyncMock(
             side_effect=[api_response_new, api_response_healthy]
         )
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             result = await region.wait_for("healthy", timeout=10)
         assert result == region
         assert region.status == "healthy"
@@ -246,7 +246,7 @@ class regionTests:
         region._status = "healthy"
         api_error = ApiError(404, {"errorMessage": "Not found"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             await region.wait_for("archived", timeout=10)
 
     @mark.asyncio
@@ -259,7 +259,7 @@ class regionTests:
             status="errored",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_errored)
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(specimen.RegionError):
                 await region.wait_for("healthy", timeout=10)
 
@@ -273,7 +273,7 @@ class regionTests:
             status="new",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_new)
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(TrainMLException) as exc_info:
                 await region.wait_for("healthy", timeout=0.1)
         assert "Timeout waiting for" in str(exc_info.value.message)
@@ -284,7 +284,7 @@ class regionTests:
         region._status = "healthy"
         api_error = ApiError(500, {"errorMessage": "Server Error"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(ApiError):
                 await region.wait_for("archived", timeout=10)
 
@@ -298,6 +298,6 @@ class regionTests:
             status="failed",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_failed)
-        with patch("trainml.cloudbender.regions.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(specimen.RegionError):
                 await region.wait_for("healthy", timeout=10)
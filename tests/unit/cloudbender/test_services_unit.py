@@ -216,7 +216,7 @@ class serviceTests:
         mock_trainml._query = AsyncMock(
             side_effect=[api_response_new, api_response_active]
         )
-        with patch("trainml.cloudbender.services.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             result = await service.wait_for("active", timeout=10)
         assert result == service
         assert service.status == "active"
@@ -227,7 +227,7 @@ class serviceTests:
         service._status = "active"
         api_error = ApiError(404, {"errorMessage": "Not found"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.services.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             await service.wait_for("archived", timeout=10)
 
     @mark.asyncio
@@ -241,7 +241,7 @@ class serviceTests:
             status="new",
         )
         mock_trainml._query = AsyncMock(return_value=api_response_new)
-        with patch("trainml.cloudbender.services.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(TrainMLException) as exc_info:
                 await service.wait_for("active", timeout=0.1)
         assert "Timeout waiting for" in str(exc_info.value.message)
@@ -252,7 +252,7 @@ class serviceTests:
         service._status = "active"
         api_error = ApiError(500, {"errorMessage": "Server Error"})
         mock_trainml._query = AsyncMock(side_effect=api_error)
-        with patch("trainml.cloudbender.services.asyncio.sleep", new_callable=AsyncMock):
+        with patch("trainml.utils.log_stream.asyncio.sleep", new_callable=AsyncMock):
             with raises(ApiError):
                 await service.wait_for("archived", timeout=10)
 
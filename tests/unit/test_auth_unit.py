@@ -1,10 +1,12 @@
 import re
 import logging
+import statistics
 import json
 import os
 from unittest.mock import AsyncMock, patch, mock_open, MagicMock
-from pytest import mark, fixture, raises
+from pytest import mark, fixture, raises, importorskip
 from aiohttp import WSMessage, WSMsgType
+from botocore.exceptions import ClientError
 
 import trainml.utils.auth as specimen
 
@@ -43,3 +45,439 @@ def test_auth_from_envs(mock_open, mock_requests_get, mock_boto3_client):
     assert auth.__dict__.get("region") == "ap-east-1"
     assert auth.__dict__.get("client_id") == "client_id"
     assert auth.__dict__.get("pool_id") == "pool_id"
+
+
+_AUTH_TEST_ENV = {
+    "TRAINML_USER": "user-id",
+    "TRAINML_KEY": "key",
+    "TRAINML_REGION": "ap-east-1",
+    "TRAINML_CLIENT_ID": "client_id",
+    "TRAINML_POOL_ID": "pool_id",
+}
+
+
+@fixture
+def auth_factory(tmp_path):
+    def factory():
+        with patch("trainml.utils.auth.boto3.client"), patch(
+            "trainml.utils.auth.requests.get"
+        ):
+            return specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+
+    with patch.dict(os.environ, _AUTH_TEST_ENV):
+        yield factory
+
+
+def _fake_login(auth, token="id-token", lifetime=3600):
+    def get_new_tokens():
+        auth.id_token = token
+        auth.access_token = "access-token"
+        auth.refresh_token = "refresh-token"
+        auth.expires = specimen.time.time() + lifetime
+
+    return MagicMock(side_effect=get_new_tokens)
+
+
+def test_auth_token_cache_reused_across_instances(auth_factory, tmp_path):
+    first = auth_factory()
+    first.get_new_tokens = _fake_login(first)
+    tokens = first.get_tokens()
+    assert tokens.get("id_token") == "id-token"
+    first.get_new_tokens.assert_called_once()
+
+    cache_file = tmp_path / "tokens.json"
+    assert cache_file.exists()
+    assert (cache_file.stat().st_mode & 0o777) == 0o600
+
+    second = auth_factory()
+    second.get_new_tokens = _fake_login(second, token="other-token")
+    tokens = second.get_tokens()
+    assert tokens.get("id_token") == "id-token"
+    assert tokens.get("refresh_token") == "refresh-token"
+    second.get_new_tokens.assert_not_called()
+
+
+def test_auth_token_cache_ignores_expired_tokens(auth_factory):
+    first = auth_factory()
+    first.get_new_tokens = _fake_login(first, lifetime=-10)
+    first.get_tokens()
+
+    second = auth_factory()
+    second.get_new_tokens = _fake_login(second, token="new-token")
+    second.refresh_tokens = MagicMock(side_effect=second.get_new_tokens)
+    tokens = second.get_tokens()
+    assert tokens.get("id_token") == "new-token"
+    second.refresh_tokens.assert_called_once()
+    assert second.refresh_token == "refresh-token"
+
+
+def test_auth_token_cache_keyed_by_user(auth_factory):
+    first = auth_factory()
+    first.get_new_tokens = _fake_login(first)
+    first.get_tokens()
+
+    with patch.dict(os.environ, {"TRAINML_USER": "other-user"}):
+        second = auth_factory()
+    second.get_new_tokens = _fake_login(second, token="other-token")
+    tokens = second.get_tokens()
+    assert tokens.get("id_token") == "other-token"
+    second.get_new_tokens.assert_called_once()
+
+
+def test_auth_token_cache_corrupt_file(auth_factory, tmp_path):
+    (tmp_path / "tokens.json").write_text("not json")
+    auth = auth_factory()
+    auth.get_new_tokens = _fake_login(auth)
+    tokens = auth.get_tokens()
+    assert tokens.get("id_token") == "id-token"
+    auth.get_new_tokens.assert_called_once()
+
+
+def _fake_verify(auth, lifetime=3600):
+    auth.verify_token = MagicMock(
+        return_value=dict(exp=specimen.time.time() + lifetime)
+    )
+
+
+def test_auth_refresh_tokens_uses_refresh_token(auth_factory):
+    auth = auth_factory()
+    _fake_verify(auth)
+    auth.refresh_token = "refresh-token"
+    auth.get_new_tokens = MagicMock()
+    auth.client.initiate_auth = MagicMock(
+        return_value=dict(
+            AuthenticationResult=dict(
+                IdToken="new-id-token", AccessToken="new-access-token"
+            )
+        )
+    )
+    auth.refresh_tokens()
+    auth.client.initiate_auth.assert_called_once_with(
+        AuthFlow="REFRESH_TOKEN_AUTH",
+        AuthParameters={"REFRESH_TOKEN": "refresh-token"},
+        ClientId="client_id",
+    )
+    auth.get_new_tokens.assert_not_called()
+    assert auth.id_token == "new-id-token"
+    assert auth.access_token == "new-access-token"
+    assert auth.refresh_token == "refresh-token"
+    assert auth.expires > specimen.time.time()
+
+
+def test_auth_refresh_tokens_falls_back_to_srp(auth_factory):
+    auth = auth_factory()
+    auth.refresh_token = "refresh-token"
+    auth.get_new_tokens = MagicMock()
+    auth.client.initiate_auth = MagicMock(
+        side_effect=ClientError(
+            dict(Error=dict(Code="NotAuthorizedException")), "InitiateAuth"
+        )
+    )
+    auth.refresh_tokens()
+    auth.get_new_tokens.assert_called_once()
+    assert auth.refresh_token is None
+
+
+def test_auth_refresh_tokens_raises_other_errors(auth_factory):
+    auth = auth_factory()
+    auth.refresh_token = "refresh-token"
+    auth.get_new_tokens = MagicMock()
+    auth.client.initiate_auth = MagicMock(
+        side_effect=ClientError(
+            dict(Error=dict(Code="TooManyRequestsException")), "InitiateAuth"
+        )
+    )
+    with raises(ClientError):
+        auth.refresh_tokens()
+    auth.get_new_tokens.assert_not_called()
+
+
+def test_auth_schedules_background_renewal(auth_factory):
+    auth = auth_factory()
+    auth.auto_renew = True
+    with patch("trainml.utils.auth.threading.Timer") as mock_timer:
+        auth.get_new_tokens = _fake_login(auth)
+        auth.get_tokens()
+    mock_timer.assert_not_called()  ## fake login bypasses _set_tokens
+    _fake_verify(auth)
+    with patch("trainml.utils.auth.threading.Timer") as mock_timer:
+        auth._set_tokens(dict(IdToken="id", AccessToken="access"))
+    delay = mock_timer.call_args[0][0]
+    assert 3600 - 2 * 300 - 5 < delay <= 3600 - 2 * 300
+    assert mock_timer.call_args[0][1] == auth._background_renew
+    mock_timer.return_value.start.assert_called_once()
+
+
+def test_auth_background_renew_refreshes_tokens(auth_factory):
+    auth = auth_factory()
+    auth.get_new_tokens = _fake_login(auth, lifetime=200)
+    auth.get_tokens()
+    auth.refresh_tokens = _fake_login(auth, token="renewed-token")
+    auth._background_renew()
+    auth.refresh_tokens.assert_called_once()
+    assert auth.id_token == "renewed-token"
+
+    other = auth_factory()
+    other.get_new_tokens = MagicMock()
+    assert other.get_tokens().get("id_token") == "renewed-token"
+    other.get_new_tokens.assert_not_called()
+
+
+def test_auth_background_renew_skips_when_cache_is_fresh(auth_factory):
+    auth = auth_factory()
+    auth.get_new_tokens = _fake_login(auth, lifetime=200)
+    auth.get_tokens()
+
+    other = auth_factory()
+    other.get_new_tokens = _fake_login(other, token="other-token")
+    other.refresh_tokens = MagicMock(side_effect=other.get_new_tokens)
+    other._background_renew()
+    assert other.id_token == "other-token"
+
+    auth.refresh_tokens = MagicMock()
+    auth._background_renew()
+    auth.refresh_tokens.assert_not_called()
+    assert auth.id_token == "other-token"
+
+
+def test_auth_background_renew_swallows_errors(auth_factory):
+    auth = auth_factory()
+    auth.refresh_tokens = MagicMock(side_effect=Exception("offline"))
+    auth._background_renew()
+    auth.refresh_tokens.assert_called_once()
+
+
+@fixture
+def auth_cache():
+    with patch.dict(
+        specimen._auth_cache, dict(auth_config={}, jwks={}), clear=True
+    ):
+        yield specimen._auth_cache
+
+
+def _auth_config_response():
+    response = MagicMock()
+    response.json.return_value = {
+        "region": "us-east-1",
+        "userPoolSDKClientId": "default_client_id",
+        "userPoolId": "default_pool_id",
+    }
+    return response
+
+
+def test_auth_skips_auth_config_when_configured(auth_cache, tmp_path):
+    with patch.dict(os.environ, _AUTH_TEST_ENV), patch(
+        "trainml.utils.auth.boto3.client"
+    ), patch("trainml.utils.auth.requests.get") as mock_requests_get:
+        specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+    mock_requests_get.assert_not_called()
+
+
+def test_auth_config_cached_in_memory_and_on_disk(auth_cache, tmp_path):
+    env = {
+        k: v
+        for k, v in _AUTH_TEST_ENV.items()
+        if k in ["TRAINML_USER", "TRAINML_KEY"]
+    }
+    with patch.dict(os.environ, env, clear=True), patch(
+        "trainml.utils.auth.boto3.client"
+    ), patch(
+        "trainml.utils.auth.requests.get",
+        return_value=_auth_config_response(),
+    ) as mock_requests_get:
+        auth = specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+        assert auth.region == "us-east-1"
+        assert auth.client_id == "default_client_id"
+        assert auth.pool_id == "default_pool_id"
+        specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+        mock_requests_get.assert_called_once()
+
+        auth_cache["auth_config"].clear()
+        auth = specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+        assert auth.pool_id == "default_pool_id"
+        mock_requests_get.assert_called_once()
+
+        auth_cache["auth_config"].clear()
+        with patch(
+            "trainml.utils.auth.time.time",
+            return_value=specimen.time.time() + specimen.AUTH_CACHE_TTL + 1,
+        ):
+            specimen.Auth(config_dir=str(tmp_path), auto_renew=False)
+        assert mock_requests_get.call_count == 2
+
+
+def test_auth_get_key_cached_by_kid(auth_factory, auth_cache):
+    auth = auth_factory()
+    auth.get_keys = MagicMock(
+        return_value=dict(keys=[dict(kid="kid-1"), dict(kid="kid-2")])
+    )
+    assert auth.get_key("kid-1") == dict(kid="kid-1")
+    assert auth.get_key("kid-2") == dict(kid="kid-2")
+    assert auth.get_key("kid-1") == dict(kid="kid-1")
+    auth.get_keys.assert_called_once()
+
+    auth_cache["jwks"].clear()
+    other = auth_factory()
+    other.get_keys = MagicMock()
+    assert other.get_key("kid-2") == dict(kid="kid-2")
+    other.get_keys.assert_not_called()
+
+
+def test_auth_get_key_refetches_unknown_kid(auth_factory, auth_cache):
+    auth = auth_factory()
+    auth.get_keys = MagicMock(return_value=dict(keys=[dict(kid="kid-1")]))
+    auth.get_key("kid-1")
+    auth.get_keys.return_value = dict(keys=[dict(kid="kid-3")])
+    assert auth.get_key("kid-3") == dict(kid="kid-3")
+    assert auth.get_keys.call_count == 2
+    with raises(specimen.TrainMLException):
+        auth.get_key("kid-4")
+
+
+@mark.asyncio
+async def test_auth_get_tokens_async_shares_one_renewal(auth_factory):
+    auth = auth_factory()
+    login = _fake_login(auth)
+
+    def slow_get_tokens():
+        specimen.time.sleep(0.05)
+        login()
+        return auth._token_dict()
+
+    auth.get_tokens = MagicMock(side_effect=slow_get_tokens)
+    results = await specimen.asyncio.gather(
+        *[auth.get_tokens_async() for _ in range(1000)]
+    )
+    auth.get_tokens.assert_called_once()
+    assert all(result.get("id_token") == "id-token" for result in results)
+    assert auth._pending_tokens is None
+
+    tokens = await auth.get_tokens_async()
+    assert tokens.get("id_token") == "id-token"
+    auth.get_tokens.assert_called_once()
+
+
+@mark.asyncio
+async def test_auth_get_tokens_async_propagates_errors(auth_factory):
+    auth = auth_factory()
+    auth.get_tokens = MagicMock(
+        side_effect=specimen.TrainMLException("Auth failed")
+    )
+    with raises(specimen.TrainMLException):
+        await auth.get_tokens_async()
+    assert auth._pending_tokens is None
+    with raises(specimen.TrainMLException):
+        await auth.get_tokens_async()
+    assert auth.get_tokens.call_count == 2
+
+
+def _legacy_calculate_u(big_a, big_b):
+    u_hex_hash = specimen.hex_hash(
+        specimen.pad_hex(big_a) + specimen.pad_hex(big_b)
+    )
+    return specimen.hex_to_long(u_hex_hash)
+
+
+def _legacy_password_authentication_key(
+    aws, username, password, server_b_value, salt
+):
+    u_value = _legacy_calculate_u(aws.large_a_value, server_b_value)
+    username_password = "%s%s:%s" % (
+        aws.pool_id.split("_")[1],
+        username,
+        password,
+    )
+    username_password_hash = specimen.hash_sha256(
+        username_password.encode("utf-8")
+    )
+    x_value = specimen.hex_to_long(
+        specimen.hex_hash(specimen.pad_hex(salt) + username_password_hash)
+    )
+    g_mod_pow_xn = pow(aws.g, x_value, aws.big_n)
+    int_value2 = server_b_value - aws.k * g_mod_pow_xn
+    s_value = pow(int_value2, aws.small_a_value + u_value * x_value, aws.big_n)
+    return specimen.compute_hkdf(
+        bytearray.fromhex(specimen.pad_hex(s_value)),
+        bytearray.fromhex(specimen.pad_hex(specimen.long_to_hex(u_value))),
+    )
+
+
+def test_srp_constants_precomputed():
+    assert specimen.big_n == specimen.hex_to_long(specimen.n_hex)
+    assert specimen.g_value == 2
+    assert specimen.k_value == specimen.hex_to_long(
+        specimen.hex_hash("00" + specimen.n_hex + "0" + specimen.g_hex)
+    )
+
+
+def test_long_to_padded_bytes_matches_pad_hex():
+    for value in [0, 1, 0x7F, 0x80, 0x8BC, 0xFFFF, 2**255, 2**256 - 1]:
+        assert specimen.long_to_padded_bytes(value) == bytes.fromhex(
+            specimen.pad_hex(value)
+        )
+    for _ in range(50):
+        value = specimen.get_random(384)
+        assert specimen.long_to_padded_bytes(value) == bytes.fromhex(
+            specimen.pad_hex(value)
+        )
+
+
+@mark.parametrize("use_gmpy2", [False, True])
+def test_srp_password_authentication_key_matches_legacy(use_gmpy2):
+    if use_gmpy2:
+        importorskip("gmpy2")
+    with patch.object(
+        specimen, "gmpy2", specimen.gmpy2 if use_gmpy2 else None
+    ):
+        aws = specimen.AWSSRP(
+            "user", "password", "region_pool", "client", client=MagicMock()
+        )
+        for salt in ["a1b2c3", "8f00", "0a0b0c0d"]:
+            server_b = specimen.get_random(384) % aws.big_n
+            assert aws.get_password_authentication_key(
+                "user-id", "password", server_b, salt
+            ) == _legacy_password_authentication_key(
+                aws, "user-id", "password", server_b, salt
+            )
+            assert specimen.calculate_u(
+                aws.large_a_value, server_b
+            ) == _legacy_calculate_u(aws.large_a_value, server_b)
+
+
+def _median_times(legacy_fn, current_fn, repeat=15, number=200):
+    ## alternate the runs, so load changes affect both sides alike
+    legacy, current = [], []
+    for _ in range(repeat):
+        for fn, times in [(legacy_fn, legacy), (current_fn, current)]:
+            start = specimen.time.perf_counter()
+            for _ in range(number):
+                fn()
+            times.append(specimen.time.perf_counter() - start)
+    return statistics.median(legacy), statistics.median(current)
+
+
+@mark.benchmark
+def test_srp_calculate_u_benchmark():
+    big_a = specimen.get_random(384) % specimen.big_n
+    big_b = specimen.get_random(384) % specimen.big_n
+    legacy, current = _median_times(
+        lambda: _legacy_calculate_u(big_a, big_b),
+        lambda: specimen.calculate_u(big_a, big_b),
+    )
+    logging.info(
+        "calculate_u x200 legacy: %.4fs current: %.4fs", legacy, current
+    )
+    assert current < legacy
+
+
+@mark.benchmark
+def test_srp_mod_pow_gmpy2_benchmark():
+    importorskip("gmpy2")
+    exponent = specimen.get_random(128)
+    legacy, current = _median_times(
+        lambda: pow(specimen.g_value, exponent, specimen.big_n),
+        lambda: specimen.mod_pow(specimen.g_value, exponent, specimen.big_n),
+        number=10,
+    )
+    logging.info("mod_pow x10 pow: %.4fs gmpy2: %.4fs", legacy, current)
+    assert current < legacy
@@ -379,7 +379,9 @@ class CheckpointTests:
         assert captured.out == "worker-id-1\n"
 
     @mark.asyncio
-    async def test_checkpoint_attach(self, checkpoint, mock_trainml):
+    async def test_checkpoint_attach(
+        self, checkpoint, mock_trainml, monkeypatch
+    ):
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
         refresh_response = {
@@ -391,12 +393,16 @@ class CheckpointTests:
             "source_uri": "s3://trainml-examples/data/cifar10",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        checkpoint.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(checkpoint), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await checkpoint.attach()
         mock_trainml._ws_subscribe.assert_called_once()
 
     @mark.asyncio
-    async def test_checkpoint_attach_immediate_return(self, mock_trainml):
+    async def test_checkpoint_attach_immediate_return(
+        self, mock_trainml, monkeypatch
+    ):
         checkpoint = specimen.Checkpoint(
             mock_trainml,
             checkpoint_uuid="1",
@@ -413,7 +419,9 @@ class CheckpointTests:
             "status": "ready",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        checkpoint.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(checkpoint), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await checkpoint.attach()
         mock_trainml._ws_subscribe.assert_not_called()
 
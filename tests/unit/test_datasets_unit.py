@@ -295,7 +295,7 @@ class DatasetTests:
         assert captured.out == "worker-id-1\n"
 
     @mark.asyncio
-    async def test_dataset_attach(self, dataset, mock_trainml):
+    async def test_dataset_attach(self, dataset, mock_trainml, monkeypatch):
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
         refresh_response = {
@@ -307,12 +307,16 @@ class DatasetTests:
             "source_uri": "s3://trainml-examples/data/cifar10",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        dataset.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(dataset), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await dataset.attach()
         mock_trainml._ws_subscribe.assert_called_once()
 
     @mark.asyncio
-    async def test_dataset_attach_immediate_return(self, mock_trainml):
+    async def test_dataset_attach_immediate_return(
+        self, mock_trainml, monkeypatch
+    ):
         dataset = specimen.Dataset(
             mock_trainml,
             dataset_uuid="1",
@@ -329,7 +333,9 @@ class DatasetTests:
             "status": "ready",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        dataset.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(dataset), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await dataset.attach()
         mock_trainml._ws_subscribe.assert_not_called()
 
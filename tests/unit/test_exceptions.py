@@ -162,3 +162,12 @@ def test_region_error():
         repr(error) == "RegionError(failed, {'id': 'id-1', 'status': 'failed'})"
     )
     assert str(error) == "RegionError(failed, {'id': 'id-1', 'status': 'failed'})"
+
+
+def test_pipeline_error():
+    """Test PipelineError exception."""
+    error = specimen.PipelineError("training", "Stage training failed")
+    assert error.stage == "training"
+    assert error.message == "Stage training failed"
+    assert repr(error) == "PipelineError(training, Stage training failed)"
+    assert str(error) == "PipelineError(training, Stage training failed)"
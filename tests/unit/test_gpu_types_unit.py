@@ -59,6 +59,75 @@ class GpuTypesTests:
         )
 
 
+def gpu_type_payload(abbrv, min, max):
+    return dict(id=f"{abbrv}-id", name=abbrv, abbrv=abbrv, price=dict(min=min, max=max))
+
+
+GPU_TYPES_RESPONSE = [
+    gpu_type_payload("gtx1060", 0.1, 0.1),
+    gpu_type_payload("rtx2080ti", 0.3, 0.5),
+    gpu_type_payload("rtx3090", 0.5, 1.2),
+    gpu_type_payload("a100", 1.5, 2.5),
+    gpu_type_payload("cpu", 0.05, 0.05),
+]
+
+
+class GpuTypesSelectTests:
+    @mark.asyncio
+    async def test_snapshot_reuses_list(self, gpu_types, mock_trainml):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        first = await gpu_types.snapshot()
+        second = await gpu_types.snapshot()
+        assert first is second
+        mock_trainml._query.assert_called_once()
+        await gpu_types.snapshot(max_age=-1)
+        assert mock_trainml._query.call_count == 2
+
+    @mark.asyncio
+    async def test_refresh_drops_snapshot(self, gpu_types, mock_trainml):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        await gpu_types.snapshot()
+        await gpu_types.refresh_gpu_types()
+        await gpu_types.snapshot()
+        assert mock_trainml._query.call_count == 3
+
+    @mark.asyncio
+    async def test_select_ranks_by_cost_per_throughput(
+        self, gpu_types, mock_trainml
+    ):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        selection = await gpu_types.select(max_types=2)
+        assert selection == dict(gpu_types=["rtx3090", "rtx2080ti"], max_price=1.2)
+
+    @mark.asyncio
+    async def test_select_budget(self, gpu_types, mock_trainml):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        selection = await gpu_types.select(budget=0.4)
+        assert selection == dict(gpu_types=["rtx2080ti", "gtx1060"], max_price=0.4)
+
+    @mark.asyncio
+    async def test_select_min_memory(self, gpu_types, mock_trainml):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        selection = await gpu_types.select(min_memory=32)
+        assert selection == dict(gpu_types=["a100"], max_price=2.5)
+
+    @mark.asyncio
+    async def test_select_custom_profile(self, gpu_types, mock_trainml):
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        selection = await gpu_types.select(profile=dict(gtx1060=1.0, a100=1.0))
+        assert selection["gpu_types"] == ["gtx1060", "a100"]
+
+    @mark.asyncio
+    async def test_select_nothing_matches(self, gpu_types, mock_trainml):
+        from trainml.exceptions import SpecificationError
+
+        mock_trainml._query = AsyncMock(return_value=GPU_TYPES_RESPONSE)
+        with raises(SpecificationError):
+            await gpu_types.select(budget=0.01)
+        with raises(SpecificationError):
+            await gpu_types.select(profile="unknown")
+
+
 class GpuTypeTests:
     def test_gpu_type_properties(self, gpu_type):
         assert isinstance(gpu_type.id, str)
@@ -2,7 +2,7 @@ import asyncio
 import re
 import logging
 import json
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from pytest import mark, fixture, raises
 from aiohttp import WSMessage, WSMsgType
 
@@ -289,6 +289,144 @@ class JobsTests:
         )
 
 
+    async def test_jobs_create_many(self, jobs, mock_trainml):
+        created = []
+        running = 0
+        max_running = 0
+
+        async def query(path, method, params=None, data=None, headers=None):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            created.append((data["name"], headers["Idempotency-Key"]))
+            return dict(job_uuid=f"job-{data['name']}", name=data["name"])
+
+        mock_trainml._query = AsyncMock(side_effect=query)
+        specs = [
+            dict(name=f"sweep-{i}", type="training", gpu_type="1060")
+            for i in range(5)
+        ]
+        batch = await jobs.create_many(specs, concurrency=2)
+        assert [job.id for job in batch] == [f"job-sweep-{i}" for i in range(5)]
+        assert batch.failures == []
+        assert max_running <= 2
+        assert len({key for _, key in created}) == 5
+
+    async def test_jobs_create_many_retries_with_same_key(
+        self, jobs, mock_trainml
+    ):
+        posts = []
+
+        async def query(path, method, params=None, data=None, headers=None):
+            ## the job isn't looked up, the key lets the server dedupe
+            assert method == "POST"
+            posts.append(headers["Idempotency-Key"])
+            if len(posts) == 1:
+                raise ApiError(503, dict(message="Unavailable"))
+            return dict(job_uuid="job-1", name=data["name"])
+
+        mock_trainml._query = AsyncMock(side_effect=query)
+        with patch("trainml.jobs.asyncio.sleep", new=AsyncMock()):
+            batch = await jobs.create_many(
+                [dict(name="sweep-0", type="training", gpu_type="1060")]
+            )
+        assert len(posts) == 2 and posts[0] == posts[1]
+        assert [job.id for job in batch] == ["job-1"]
+
+    async def test_jobs_create_many_partial_failure(self, jobs, mock_trainml):
+        async def query(path, method, params=None, data=None, headers=None):
+            if data["name"] == "bad":
+                raise ApiError(400, dict(message="Invalid"))
+            return dict(job_uuid=data["name"], name=data["name"])
+
+        mock_trainml._query = AsyncMock(side_effect=query)
+        batch = await jobs.create_many(
+            [
+                dict(name="good", type="training", gpu_type="1060"),
+                dict(name="bad", type="training", gpu_type="1060"),
+            ]
+        )
+        assert [job.id for job in batch] == ["good"]
+        assert [spec["name"] for spec, _ in batch.failures] == ["bad"]
+        assert batch.failures[0][1].status == 400
+
+    async def test_jobs_fan_out(self, jobs, tmp_path):
+        import os
+
+        input_dir = tmp_path / "input"
+        input_dir.mkdir()
+        for i, size in enumerate([300, 200, 100]):
+            (input_dir / f"part-{i}.bin").write_bytes(b"x" * size)
+        output_dir = tmp_path / "output"
+        uploaded = dict()
+
+        def make_job(spec):
+            job = AsyncMock()
+            job.name = spec["name"]
+            data = spec["data"]
+
+            async def connect():
+                if job.name not in uploaded:
+                    uploaded[job.name] = sorted(os.listdir(data["input_uri"]))
+                elif job.name.endswith("-1"):
+                    raise TrainMLException("download failed")
+                else:
+                    os.makedirs(data["output_uri"])
+                    with open(f"{data['output_uri']}/{job.name}.out", "w"):
+                        pass
+
+            job.connect = AsyncMock(side_effect=connect)
+            return job
+
+        async def create_many(specs, concurrency):
+            specs = list(specs)
+            assert concurrency == 2
+            assert all(spec["type"] == "inference" for spec in specs)
+            assert all(spec["workers"] == ["python infer.py"] for spec in specs)
+            return specimen.JobBatch(jobs, [make_job(spec) for spec in specs])
+
+        jobs.create_many = AsyncMock(side_effect=create_many)
+        batch = await jobs.fan_out(
+            "infer",
+            str(input_dir),
+            str(output_dir),
+            shards=2,
+            concurrency=2,
+            workers=["python infer.py"],
+            data=dict(output_options=dict(archive=False)),
+        )
+        assert uploaded == {
+            "infer-shard-0": ["part-0.bin"],
+            "infer-shard-1": ["part-1.bin", "part-2.bin"],
+        }
+        assert sorted(os.listdir(output_dir)) == ["infer-shard-0.out"]
+        assert [spec["name"] for spec, _ in batch.failures] == ["infer-shard-1"]
+        assert batch.failures[0][0]["data"]["output_options"] == dict(
+            archive=False
+        )
+
+    async def test_jobs_create_many_unique_names(self, jobs):
+        spec = dict(name="same", type="training", gpu_type="1060")
+        with raises(SpecificationError):
+            await jobs.create_many([spec, spec])
+
+    async def test_job_batch_stop_and_remove(self, jobs, mock_trainml):
+        batch = specimen.JobBatch(
+            jobs,
+            [
+                specimen.Job(mock_trainml, job_uuid=f"job-{i}")
+                for i in range(3)
+            ],
+        )
+        mock_trainml._query = AsyncMock(return_value=dict(status="stopped"))
+        await batch.stop()
+        await batch.remove(force=True)
+        methods = [call.args[1] for call in mock_trainml._query.call_args_list]
+        assert methods == ["PATCH"] * 3 + ["DELETE"] * 3
+
+
 class JobTests:
     def test_job_properties(self, job):
         assert isinstance(job.id, str)
@@ -593,7 +731,7 @@ class JobTests:
 
         real_sleep = asyncio.sleep
 
-        with patch.object(job, "refresh", side_effect=mock_refresh):
+        with patch.object(specimen.Job, "refresh", side_effect=mock_refresh):
             with patch("trainml.jobs.download", mock_download):
                 # Mock sleep - allow loop to continue
                 async def sleep_side_effect(delay):
@@ -609,6 +747,64 @@ class JobTests:
                         str(tmp_path / "output"),
                     )
 
+    @mark.asyncio
+    async def test_job_download_polls_quickly_while_downloading(
+        self, mock_trainml, tmp_path
+    ):
+        job = specimen.Job(
+            mock_trainml,
+            job_uuid="job-id-1",
+            project_uuid="proj-id-1",
+            status="running",
+            workers=[],
+        )
+        intervals = []
+        released = asyncio.Event()
+
+        async def mock_refresh():
+            uploading = dict(
+                job_worker_uuid="worker-1",
+                status="uploading",
+                output_auth_token="token",
+                output_hostname="host",
+            )
+            if len(intervals) < 10:
+                workers = [uploading, dict(job_worker_uuid="w-2", status="running")]
+            else:
+                released.set()
+                workers = [
+                    dict(job_worker_uuid=w, status="finished")
+                    for w in ["worker-1", "w-2"]
+                ]
+            job._job["workers"] = workers
+            return job
+
+        async def mock_download(hostname, token, out_uri):
+            await released.wait()
+
+        class FakeWatch:
+            def __init__(self, *args):
+                pass
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                pass
+
+            async def sleep(self, interval):
+                intervals.append(interval)
+                await asyncio.sleep(0)
+
+        with (
+            patch.object(specimen.Job, "refresh", side_effect=mock_refresh),
+            patch("trainml.jobs.download", mock_download),
+            patch("trainml.jobs.StatusWatch", FakeWatch),
+        ):
+            await job._download_worker_outputs(str(tmp_path))
+        assert len(intervals) == 10
+        assert max(intervals) <= specimen.poller.POLL_INTERVAL_MIN
+
     @mark.asyncio
     async def test_job_connect_running_status_multi_worker_polling(
         self, mock_trainml, tmp_path
@@ -858,7 +1054,7 @@ class JobTests:
         mock_trainml._ws_subscribe.create.assert_not_called()
 
     @mark.asyncio
-    async def test_job_attach(self, mock_trainml):
+    async def test_job_attach(self, mock_trainml, monkeypatch):
         job_spec = {
             "customer_uuid": "cus-id-1",
             "job_uuid": "job-id-1",
@@ -886,12 +1082,16 @@ class JobTests:
         )
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
-        job.refresh = AsyncMock(return_value=job_spec)
+        monkeypatch.setattr(
+            type(job), "refresh", AsyncMock(return_value=job_spec)
+        )
         await job.attach()
         mock_trainml._ws_subscribe.assert_called_once()
 
     @mark.asyncio
-    async def test_job_attach_immediate_return(self, mock_trainml):
+    async def test_job_attach_immediate_return(
+        self, mock_trainml, monkeypatch
+    ):
         job_spec = {
             "customer_uuid": "cus-id-1",
             "job_uuid": "job-id-1",
@@ -906,7 +1106,9 @@ class JobTests:
         )
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
-        job.refresh = AsyncMock(return_value=job_spec)
+        monkeypatch.setattr(
+            type(job), "refresh", AsyncMock(return_value=job_spec)
+        )
         await job.attach()
         mock_trainml._ws_subscribe.assert_not_called()
 
@@ -1802,10 +2004,10 @@ class JobTests:
             assert sleep_calls == []
 
     @mark.asyncio
-    async def test_job_connect_sleep_30_no_download_tasks(
+    async def test_job_connect_polls_without_download_tasks(
         self, mock_trainml, tmp_path
     ):
-        """Test connect sleeps 30 seconds when no download tasks (line 543)."""
+        """Test connect polls worker statuses on the backoff schedule."""
         job = specimen.Job(
             mock_trainml,
             **{
@@ -1864,8 +2066,84 @@ class JobTests:
 
         with patch("asyncio.sleep", new_callable=AsyncMock) as sleep_mock:
             await job.connect()
-            # Should have called sleep with 30 seconds when no download tasks (line 543)
-            # First iteration: no download tasks, so sleep(30)
-            # Second iteration: worker finished, so break
+            # Polls start fast instead of waiting a fixed 30 seconds
             sleep_calls = [call[0][0] for call in sleep_mock.call_args_list]
-            assert 30 in sleep_calls
+            assert len(sleep_calls) == 1
+            assert sleep_calls[0] <= 2
+
+
+@mark.asyncio
+async def test_job_wait_for_wakes_on_status_event(job, mock_trainml):
+    api_response = {
+        "customer_uuid": "cus-id-1",
+        "job_uuid": "job-id-1",
+        "name": "test notebook",
+        "type": "notebook",
+        "status": "running",
+    }
+
+    async def subscribe(entity, project_uuid, id, msg_handler, **kwargs):
+        assert kwargs.get("kind") == "status"
+        msg_handler(dict(type="status", id=id, status="running"))
+        await asyncio.Event().wait()
+
+    mock_trainml.status_events = True
+    mock_trainml.log_stream = Mock()
+    mock_trainml.log_stream.subscribe = subscribe
+    mock_trainml._query = AsyncMock(return_value=api_response)
+    response = await asyncio.wait_for(job.wait_for("running"), 2)
+    assert response.status == "running"
+    mock_trainml._query.assert_called_once()
+
+
+@mark.asyncio
+async def test_job_connect_downloads_on_status_event(mock_trainml, tmp_path):
+    job = specimen.Job(
+        mock_trainml,
+        job_uuid="job-id-1",
+        project_uuid="proj-id-1",
+        name="test job",
+        type="training",
+        status="running",
+    )
+
+    def api_response(worker_status):
+        return dict(
+            job_uuid="job-id-1",
+            project_uuid="proj-id-1",
+            type="training",
+            status="running",
+            data=dict(output_type="local", output_uri=str(tmp_path)),
+            workers=[
+                dict(
+                    job_worker_uuid="worker-1",
+                    status=worker_status,
+                    output_auth_token="token-1",
+                    output_hostname="host-1.com",
+                )
+            ],
+        )
+
+    async def subscribe(entity, project_uuid, id, msg_handler, **kwargs):
+        msg_handler(dict(type="status", id=id, status="running"))
+        await asyncio.Event().wait()
+
+    async def failing_download(*args):
+        raise ValueError("Download failed")
+
+    mock_trainml.status_events = True
+    mock_trainml.log_stream = Mock()
+    mock_trainml.log_stream.subscribe = subscribe
+    mock_trainml._query = AsyncMock(
+        side_effect=[
+            api_response("running"),
+            api_response("running"),
+            api_response("uploading"),
+        ]
+    )
+    with patch("trainml.jobs.download", failing_download):
+        ## neither step waits for a poll interval, the status event wakes
+        ## the loop and the failed download is raised as soon as it ends
+        with raises(ValueError, match="Download failed"):
+            await asyncio.wait_for(job.connect(), 1)
+    assert mock_trainml._query.await_count == 3
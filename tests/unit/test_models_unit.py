@@ -275,7 +275,7 @@ class ModelTests:
         assert captured.out == "worker-id-1\n"
 
     @mark.asyncio
-    async def test_model_attach(self, model, mock_trainml):
+    async def test_model_attach(self, model, mock_trainml, monkeypatch):
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
         refresh_response = {
@@ -287,12 +287,16 @@ class ModelTests:
             "source_uri": "s3://trainml-examples/data/cifar10",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        model.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(model), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await model.attach()
         mock_trainml._ws_subscribe.assert_called_once()
 
     @mark.asyncio
-    async def test_model_attach_immediate_return(self, mock_trainml):
+    async def test_model_attach_immediate_return(
+        self, mock_trainml, monkeypatch
+    ):
         model = specimen.Model(
             mock_trainml,
             model_uuid="1",
@@ -309,7 +313,9 @@ class ModelTests:
             "status": "ready",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        model.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(model), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await model.attach()
         mock_trainml._ws_subscribe.assert_not_called()
 
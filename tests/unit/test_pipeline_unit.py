@@ -0,0 +1,170 @@
+import json
+import asyncio
+from unittest.mock import MagicMock
+from pytest import mark, fixture, raises
+
+import trainml.pipeline as specimen
+from trainml.exceptions import PipelineError, SpecificationError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+@fixture
+def mock_trainml():
+    return MagicMock()
+
+
+@fixture
+def state_file(tmp_path):
+    return str(tmp_path / "pipeline.json")
+
+
+class PipelineTests:
+    def test_duplicate_stage(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+
+        @pipeline.stage()
+        async def dataset(trainml):
+            return "data-id"
+
+        with raises(SpecificationError):
+            pipeline.add("dataset", dataset)
+
+    @mark.asyncio
+    async def test_run_without_stages(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+        assert await pipeline.run() == dict()
+
+    @mark.asyncio
+    async def test_unknown_dependency(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+
+        @pipeline.stage(depends=["dataset"])
+        async def training(trainml, dataset):
+            return "job-id"
+
+        with raises(SpecificationError) as error:
+            await pipeline.run()
+        assert "unknown stage dataset" in error.value.message
+
+    @mark.asyncio
+    async def test_cycle(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+        pipeline.add("a", MagicMock(), depends=["b"])
+        pipeline.add("b", MagicMock(), depends=["a"])
+        with raises(SpecificationError) as error:
+            await pipeline.run()
+        assert "a -> b -> a" in error.value.message
+
+    @mark.asyncio
+    async def test_run_passes_outputs(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+
+        @pipeline.stage()
+        async def dataset(trainml):
+            assert trainml is mock_trainml
+            return "data-id"
+
+        @pipeline.stage(depends=["dataset"])
+        async def training(trainml, dataset):
+            return f"model-of-{dataset}"
+
+        @pipeline.stage(depends=["dataset", "training"])
+        async def inference(trainml, dataset, training):
+            return [dataset, training]
+
+        outputs = await pipeline.run()
+        assert outputs == dict(
+            dataset="data-id",
+            training="model-of-data-id",
+            inference=["data-id", "model-of-data-id"],
+        )
+
+    @mark.asyncio
+    async def test_independent_stages_run_concurrently(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+        started = asyncio.Event()
+
+        @pipeline.stage()
+        async def first(trainml):
+            ## only finishes once the second stage has started
+            await asyncio.wait_for(started.wait(), 1)
+            return 1
+
+        @pipeline.stage()
+        async def second(trainml):
+            started.set()
+            return 2
+
+        outputs = await pipeline.run()
+        assert outputs == dict(first=1, second=2)
+
+    @mark.asyncio
+    async def test_resume_skips_completed(self, mock_trainml, state_file):
+        calls = []
+
+        def build(fail):
+            pipeline = specimen.Pipeline(mock_trainml, state_file=state_file)
+
+            @pipeline.stage()
+            async def dataset(trainml):
+                calls.append("dataset")
+                return "data-id"
+
+            @pipeline.stage(depends=["dataset"])
+            async def training(trainml, dataset):
+                calls.append("training")
+                if fail:
+                    raise RuntimeError("boom")
+                return "model-id"
+
+            return pipeline
+
+        with raises(PipelineError) as error:
+            await build(fail=True).run()
+        assert error.value.stage == "training"
+        with open(state_file) as file:
+            assert json.load(file) == dict(completed=dict(dataset="data-id"))
+
+        outputs = await build(fail=False).run()
+        assert outputs == dict(dataset="data-id", training="model-id")
+        assert calls == ["dataset", "training", "training"]
+
+    @mark.asyncio
+    async def test_failure_skips_dependents_only(self, mock_trainml):
+        pipeline = specimen.Pipeline(mock_trainml)
+        ran = []
+
+        @pipeline.stage()
+        async def training(trainml):
+            raise RuntimeError("boom")
+
+        @pipeline.stage(depends=["training"])
+        async def inference(trainml, training):
+            ran.append("inference")
+
+        @pipeline.stage()
+        async def other(trainml):
+            await asyncio.sleep(0)
+            ran.append("other")
+
+        with raises(PipelineError) as error:
+            await pipeline.run()
+        assert error.value.stage == "training"
+        assert isinstance(error.value.__cause__, RuntimeError)
+        assert ran == ["other"]
+
+    def test_reset_downstream(self, mock_trainml, state_file):
+        pipeline = specimen.Pipeline(mock_trainml, state_file=state_file)
+        pipeline.add("dataset", MagicMock())
+        pipeline.add("training", MagicMock(), depends=["dataset"])
+        pipeline.add("inference", MagicMock(), depends=["training"])
+        pipeline.add("report", MagicMock(), depends=["dataset"])
+        pipeline._save(
+            dict(dataset=1, training=2, inference=3, report=4)
+        )
+
+        pipeline.reset("training")
+        assert pipeline.load() == dict(dataset=1, report=4)
+        pipeline.reset()
+        assert pipeline.load() == dict()
@@ -211,6 +211,79 @@ async def test_trainml_query_success(mock_open, mock_requests_get, mock_boto3_cl
         assert result == {"result": "success"}
 
 
+@patch("trainml.utils.auth.boto3.client")
+@patch("trainml.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@mark.asyncio
+async def test_trainml_query_shared_session(
+    mock_open, mock_requests_get, mock_boto3_client
+):
+    """Test _query() reuses the session assigned to the client."""
+    with patch.dict(os.environ, _TRAINML_QUERY_TEST_ENV):
+        trainml = specimen.TrainML()
+        trainml.auth.get_tokens = MagicMock(
+            return_value={"id_token": "token123"}
+        )
+
+        mock_resp = create_mock_aiohttp_response(
+            json_data={"result": "success"}
+        )
+        _, mock_session = create_mock_aiohttp_session([mock_resp])
+        mock_session.closed = False
+        trainml.session = mock_session
+
+        with patch(
+            "trainml.trainml.aiohttp.ClientSession"
+        ) as mock_client_session:
+            assert await trainml._query("/test", "GET") == {
+                "result": "success"
+            }
+            assert await trainml._query("/test", "GET") == {
+                "result": "success"
+            }
+
+        mock_client_session.assert_not_called()
+        assert mock_session.request.call_count == 2
+
+
+@patch("trainml.utils.auth.boto3.client")
+@patch("trainml.utils.auth.requests.get")
+@patch("builtins.open", side_effect=FileNotFoundError)
+@mark.asyncio
+async def test_trainml_query_not_modified(
+    mock_open, mock_requests_get, mock_boto3_client
+):
+    """Test _query() revalidates GETs and serves 304s from the cache."""
+    with patch.dict(os.environ, _TRAINML_QUERY_TEST_ENV):
+        trainml = specimen.TrainML()
+        trainml.auth.get_tokens = MagicMock(
+            return_value={"id_token": "token123"}
+        )
+
+        first_resp = create_mock_aiohttp_response(
+            json_data={"status": "running"}
+        )
+        first_resp.headers = {"ETag": '"v1"'}
+        not_modified = create_mock_aiohttp_response(status=304)
+        not_modified.headers = {"ETag": '"v1"'}
+        _, mock_session = create_mock_aiohttp_session(
+            [first_resp, not_modified]
+        )
+        mock_session.closed = False
+        trainml.session = mock_session
+
+        first = await trainml._query("/job/job-id-1", "GET")
+        second = await trainml._query("/job/job-id-1", "GET")
+
+        assert second == first
+        assert second is not first
+        not_modified.json.assert_not_called()
+        first_headers = mock_session.request.call_args_list[0][1]["headers"]
+        second_headers = mock_session.request.call_args_list[1][1]["headers"]
+        assert "If-None-Match" not in first_headers
+        assert second_headers["If-None-Match"] == '"v1"'
+
+
 @patch("trainml.utils.auth.boto3.client")
 @patch("trainml.utils.auth.requests.get")
 @patch("builtins.open", side_effect=FileNotFoundError)
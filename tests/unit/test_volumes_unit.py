@@ -278,7 +278,7 @@ class VolumeTests:
         assert captured.out == "worker-id-1\n"
 
     @mark.asyncio
-    async def test_volume_attach(self, volume, mock_trainml):
+    async def test_volume_attach(self, volume, mock_trainml, monkeypatch):
         api_response = None
         mock_trainml._ws_subscribe = AsyncMock(return_value=api_response)
         refresh_response = {
@@ -290,12 +290,16 @@ class VolumeTests:
             "source_uri": "s3://trainml-examples/data/cifar10",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        volume.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(volume), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await volume.attach()
         mock_trainml._ws_subscribe.assert_called_once()
 
     @mark.asyncio
-    async def test_volume_attach_immediate_return(self, mock_trainml):
+    async def test_volume_attach_immediate_return(
+        self, mock_trainml, monkeypatch
+    ):
         volume = specimen.Volume(
             mock_trainml,
             id="1",
@@ -312,7 +316,9 @@ class VolumeTests:
             "status": "ready",
             "createdAt": "2020-12-20T16:46:23.909Z",
         }
-        volume.refresh = AsyncMock(return_value=refresh_response)
+        monkeypatch.setattr(
+            type(volume), "refresh", AsyncMock(return_value=refresh_response)
+        )
         await volume.attach()
         mock_trainml._ws_subscribe.assert_not_called()
 
@@ -0,0 +1,102 @@
+import sys
+import json
+import time
+import logging
+from pytest import mark, raises
+
+import trainml.utils.codec as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def _installed():
+    names = []
+    for name in specimen.CODECS:
+        try:
+            specimen.get_codec(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+@mark.parametrize("name", _installed())
+def test_codec_round_trip(name):
+    codec = specimen.get_codec(name)
+    data = dict(name="job", workers=[dict(status="running")], credits=1.5)
+    assert codec.loads(codec.encode(data)) == data
+    assert codec.loads(codec.dumps(data)) == data
+    assert isinstance(codec.dumps(data), str)
+    assert codec.loads(codec.encode(2**70)) == 2**70
+    with raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+def test_falls_back_to_json(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    assert specimen.get_codec().name == "json"
+
+
+def test_use_switches_module_functions():
+    previous = specimen.active.name
+    try:
+        assert specimen.use("json").name == "json"
+        assert specimen.loads == specimen.active.loads
+        assert specimen.dumps([1]) == "[1]"
+    finally:
+        specimen.use(previous)
+
+
+def test_unknown_codec():
+    with raises(ValueError):
+        specimen.get_codec("yaml")
+
+
+def _listing(count):
+    return [
+        dict(
+            job_uuid=f"job-id-{i}",
+            name=f"job {i}",
+            status="running",
+            credits=i * 0.01,
+            resources=dict(gpu_count=8, gpu_types=["a100", "h100"]),
+            workers=[
+                dict(job_worker_uuid=f"worker-{i}-{w}", status="running")
+                for w in range(8)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def _time(loads, messages):
+    start = time.perf_counter()
+    for message in messages:
+        loads(message)
+    return time.perf_counter() - start
+
+
+@mark.benchmark
+def test_codec_benchmark():
+    listing = json.dumps(_listing(20000)).encode("utf-8")
+    logs = [
+        json.dumps(
+            dict(type="subscription", stream="w-1", time=i, msg=f"line {i}")
+        )
+        for i in range(100000)
+    ]
+    results = dict()
+    for name in _installed():
+        codec = specimen.get_codec(name)
+        assert codec.loads(listing) == json.loads(listing)
+        results[name] = (
+            _time(codec.loads, [listing]),
+            _time(codec.loads, logs),
+        )
+    logging.info(
+        "; ".join(
+            f"{name}: listing {listing_time:.3f}s, log burst {log_time:.3f}s"
+            for name, (listing_time, log_time) in results.items()
+        )
+    )
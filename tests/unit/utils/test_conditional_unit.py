@@ -0,0 +1,55 @@
+from pytest import mark
+
+import trainml.utils.conditional as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def test_headers_from_validators():
+    cache = specimen.ValidatorCache()
+    key = cache.key("https://api/job/1", dict(project_uuid="proj-1"))
+    assert cache.headers(key) == dict()
+    cache.store(
+        key,
+        {"ETag": '"v1"', "Last-Modified": "Tue, 01 Jan 2030 00:00:00 GMT"},
+        dict(status="new"),
+    )
+    assert cache.headers(key) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Tue, 01 Jan 2030 00:00:00 GMT",
+    }
+    assert cache.get(key) == dict(status="new")
+
+
+def test_responses_are_copied():
+    cache = specimen.ValidatorCache()
+    results = [dict(status="new")]
+    cache.store("key", {"ETag": '"v1"'}, results)
+    results[0]["status"] = "stored"
+    cache.get("key")[0]["status"] = "returned"
+    assert cache.get("key") == [dict(status="new")]
+
+
+def test_key_ignores_param_order():
+    first = specimen.ValidatorCache.key("u", dict(a=1, b="2"))
+    assert first == specimen.ValidatorCache.key("u", dict(b="2", a=1))
+    assert first != specimen.ValidatorCache.key("u", None)
+
+
+def test_responses_without_validators_are_forgotten():
+    cache = specimen.ValidatorCache()
+    cache.store("key", {"ETag": '"v1"'}, [1])
+    cache.store("key", {}, [2])
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_are_dropped():
+    cache = specimen.ValidatorCache(max_entries=2)
+    cache.store("a", {"ETag": "a"}, "a")
+    cache.store("b", {"ETag": "b"}, "b")
+    cache.get("a")
+    cache.store("c", {"ETag": "c"}, "c")
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
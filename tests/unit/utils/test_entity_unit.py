@@ -0,0 +1,243 @@
+import time
+import logging
+import tracemalloc
+import gc
+from unittest.mock import AsyncMock, Mock, patch
+from pytest import mark, fixture, raises
+
+import trainml.utils.entity as specimen
+from trainml.jobs import Job, Jobs
+from trainml.projects import Project
+from trainml.projects.members import ProjectMember
+from trainml.projects.datastores import ProjectDatastores
+
+pytestmark = [mark.sdk, mark.unit]
+
+ENTITY_COUNT = 100000
+
+
+class Thing(specimen.Entity):
+    _payload = "_thing"
+    _fields = dict(
+        _id=lambda d: d.get("id"),
+        _status=lambda d: d.get("status"),
+    )
+    __slots__ = ("_thing", *_fields)
+
+    def __init__(self, trainml, **kwargs):
+        self.trainml = trainml
+        self._thing = kwargs
+
+
+class EagerJob:
+    ## how entities copied their fields before they were slotted
+    def __init__(self, trainml, **kwargs):
+        self.trainml = trainml
+        self._job = kwargs
+        self._id = self._job.get("id", self._job.get("job_uuid"))
+        self._name = self._job.get("name")
+        self._status = self._job.get("status")
+        self._type = self._job.get("type")
+        self._workers = self._job.get("workers")
+        self._credits = self._job.get("credits")
+        self._project_uuid = self._job.get("project_uuid")
+
+
+def test_fields_are_extracted_on_first_read():
+    extract = Mock(return_value="running")
+
+    class CountedThing(Thing):
+        _fields = dict(Thing._fields, _status=extract)
+        __slots__ = ()
+
+    thing = CountedThing(None, id="1", status="new")
+    extract.assert_not_called()
+    assert thing._status == "running"
+    assert thing._status == "running"
+    extract.assert_called_once_with(dict(id="1", status="new"))
+
+
+def test_assigned_field_overrides_payload():
+    thing = Thing(None, id="1", status="new")
+    thing._status = "running"
+    assert thing._status == "running"
+    assert thing._thing["status"] == "new"
+
+
+def test_reload_drops_extracted_fields():
+    thing = Thing(None, id="1", status="new")
+    assert thing._status == "new"
+    thing._id = "2"
+    thing._reload(dict(id="1", status="running"))
+    assert thing._status == "running"
+    assert thing._id == "1"
+
+
+def test_unknown_attributes():
+    thing = Thing(None, id="1")
+    with raises(AttributeError, match="no attribute 'other'"):
+        thing.other
+    with raises(AttributeError):
+        thing.other = 1
+    assert not hasattr(thing, "__dict__")
+
+
+def test_project_collections_are_lazy():
+    project = Project(Mock(), id="proj-id-1", name="project")
+    with raises(AttributeError):
+        object.__getattribute__(project, "datastores")
+    datastores = project.datastores
+    assert isinstance(datastores, ProjectDatastores)
+    assert datastores.project_id == "proj-id-1"
+    assert project.datastores is datastores
+
+
+@fixture
+def mapped_trainml():
+    trainml = Mock()
+    trainml.identity_map = specimen.IdentityMap()
+    return trainml
+
+
+def test_identity_map_returns_live_object(mapped_trainml):
+    job = Job._from_payload(
+        mapped_trainml, dict(job_uuid="job-id-1", status="new", workers=[])
+    )
+    assert job.status == "new"
+    listed = Job._from_payload(
+        mapped_trainml, dict(job_uuid="job-id-1", status="running")
+    )
+    assert listed is job
+    assert job.status == "running"
+    ## payloads are merged, fields missing from a response are kept
+    assert job._job["workers"] == []
+    assert mapped_trainml.identity_map.get(Job, "job-id-1") is job
+    other = Job._from_payload(mapped_trainml, dict(job_uuid="job-id-2"))
+    assert other is not job
+
+
+def test_identity_map_holds_entities_weakly(mapped_trainml):
+    Job._from_payload(mapped_trainml, dict(job_uuid="job-id-1"))
+    gc.collect()
+    assert len(mapped_trainml.identity_map) == 0
+
+
+def test_identity_map_skips_project_scoped_entities(mapped_trainml):
+    first = ProjectMember._from_payload(
+        mapped_trainml, dict(email="a@b.c", project_uuid="p-1")
+    )
+    second = ProjectMember._from_payload(
+        mapped_trainml, dict(email="a@b.c", project_uuid="p-2")
+    )
+    assert first is not second
+    assert len(mapped_trainml.identity_map) == 0
+
+
+def test_entities_without_identity_map_are_distinct():
+    trainml = Mock(identity_map=None)
+    payload = dict(job_uuid="job-id-1")
+    first = Job._from_payload(trainml, payload)
+    assert Job._from_payload(trainml, payload) is not first
+    assert first.age is None
+    assert not first.is_fresh(60)
+
+
+@mark.asyncio
+async def test_collection_get_updates_held_entity(mapped_trainml):
+    mapped_trainml._query = AsyncMock(
+        return_value=dict(job_uuid="job-id-1", status="new")
+    )
+    jobs = Jobs(mapped_trainml)
+    job = await jobs.get("job-id-1")
+    mapped_trainml._query.return_value = dict(
+        job_uuid="job-id-1", status="running"
+    )
+    fetched = await jobs.get("job-id-1")
+    assert fetched is job
+    assert job.status == "running"
+
+
+def test_entity_age(mapped_trainml):
+    with patch("trainml.utils.entity.time.monotonic", return_value=100):
+        job = Job._from_payload(mapped_trainml, dict(job_uuid="job-id-1"))
+    with patch("trainml.utils.entity.time.monotonic", return_value=130):
+        assert job.age == 30
+        assert job.is_fresh(60)
+        assert not job.is_fresh(10)
+        job._reload(dict(job_uuid="job-id-1"))
+        assert job.age == 0
+
+
+def test_unchanged_reload_keeps_fields():
+    job = Job(Mock(), job_uuid="job-id-1", status="running")
+    job._status = "overridden"
+    job._reload(dict(job_uuid="job-id-1", status="running"))
+    assert job.status == "overridden"
+    job._reload(dict(job_uuid="job-id-1", status="stopped"))
+    assert job.status == "stopped"
+
+
+def test_on_change_reports_watched_fields():
+    job = Job(Mock(), job_uuid="job-id-1", status="new", credits=1, name="a")
+    changes = []
+    remove = job.on_change(lambda entity, change: changes.append(change))
+    job._reload(dict(job_uuid="job-id-1", status="new", credits=1, name="b"))
+    assert changes == []
+    job._reload(dict(job_uuid="job-id-1", status="running", credits=2))
+    assert changes == [dict(status=("new", "running"), credits=(1, 2))]
+    remove()
+    job._reload(dict(job_uuid="job-id-1", status="stopped"))
+    assert len(changes) == 1
+
+
+def test_on_change_fields():
+    job = Job(Mock(), job_uuid="job-id-1", status="new", name="a")
+    changes = []
+    job.on_change(lambda entity, change: changes.append(change), ["name"])
+    job._reload(dict(job_uuid="job-id-1", status="running", name="a"))
+    job._reload(dict(job_uuid="job-id-1", status="running", name="b"))
+    assert changes == [dict(name=("a", "b"))]
+
+
+def _payloads():
+    return [
+        dict(
+            job_uuid=f"job-id-{index}",
+            project_uuid="proj-id-1",
+            name=f"job {index}",
+            type="training",
+            status="running",
+            credits=0.5,
+            workers=[],
+        )
+        for index in range(ENTITY_COUNT)
+    ]
+
+
+def _measure(cls, payloads):
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        entities = [cls(None, **payload) for payload in payloads]
+        elapsed = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return entities, elapsed, memory
+
+
+@mark.benchmark
+def test_entity_construction_benchmark():
+    payloads = _payloads()
+    _, eager_time, eager_memory = _measure(EagerJob, payloads)
+    jobs, lazy_time, lazy_memory = _measure(Job, payloads)
+    logging.info(
+        "%s entities: eager %.3fs %sKB, slotted %.3fs %sKB",
+        ENTITY_COUNT,
+        eager_time,
+        eager_memory // 1024,
+        lazy_time,
+        lazy_memory // 1024,
+    )
+    assert lazy_memory < eager_memory
+    assert jobs[-1].id == f"job-id-{ENTITY_COUNT - 1}"
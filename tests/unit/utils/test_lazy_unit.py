@@ -0,0 +1,101 @@
+import sys
+import logging
+import subprocess
+from pytest import mark, raises
+
+import trainml.utils.lazy as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+HEAVY_MODULES = [
+    "aiofiles",
+    "aiohttp",
+    "boto3",
+    "botocore",
+    "dateutil.parser",
+    "jose.jwt",
+    "requests",
+]
+
+
+def _imported_modules(statement):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative.strip())
+    return modules
+
+
+def test_lazy_import_returns_loaded_module():
+    assert specimen.lazy_import("json") is sys.modules["json"]
+
+
+def test_lazy_import_missing_module():
+    with raises(ModuleNotFoundError):
+        specimen.lazy_import("trainml_missing_module")
+
+
+def test_lazy_import_defers_execution():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from trainml.utils.lazy import lazy_import; "
+            "mod = lazy_import('email.mime.text'); "
+            "print(type(mod).__name__ == 'module'); mod.MIMEText; "
+            "print(type(mod).__name__ == 'module')",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "True"]
+
+
+@mark.benchmark
+def test_import_trainml_skips_heavy_modules():
+    modules = _imported_modules("import trainml")
+    logging.info("import trainml: %sus", modules.get("trainml"))
+    assert "trainml" in modules
+    assert not [name for name in HEAVY_MODULES if name in modules]
+
+
+@mark.benchmark
+def test_import_cli_skips_subcommands():
+    modules = _imported_modules("import trainml.cli")
+    logging.info("import trainml.cli: %sus", modules.get("trainml.cli"))
+    assert not [name for name in HEAVY_MODULES if name in modules]
+    assert not [
+        name for name in modules if name.startswith("trainml.cli.")
+    ]
+
+
+@mark.benchmark
+def test_cli_help_imports_only_invoked_subcommand():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from trainml.cli import cli; "
+            "cli.main(['job', 'attach', '--help'], standalone_mode=False); "
+            "print(*[name for name, module in sys.modules.items() "
+            "if type(module).__name__ != '_LazyModule'], file=sys.stderr)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = result.stderr.split()
+    assert "trainml.cli.job" in modules
+    assert "trainml.cli.job.create" not in modules
+    assert "trainml.cli.cloudbender" not in modules
+    assert not [name for name in HEAVY_MODULES if name in modules]
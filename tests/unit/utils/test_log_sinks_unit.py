@@ -0,0 +1,143 @@
+import io
+import json
+import time
+import logging
+import threading
+from pytest import mark, raises
+
+import trainml.utils.log_sinks as specimen
+
+pytestmark = [mark.sdk, mark.unit]
+
+MESSAGE = {
+    "msg": "Epoch (1/1000)\n",
+    "time": 1613079345318,
+    "type": "subscription",
+    "stream": "worker-id-1",
+}
+
+
+class SlowStream(io.StringIO):
+    def __init__(self, release):
+        super().__init__()
+        self.release = release
+        self.writes = 0
+
+    def write(self, text):
+        self.release.wait(5)
+        self.writes += 1
+        return super().write(text)
+
+
+def test_format_log_message():
+    assert (
+        specimen.format_log_message(MESSAGE)
+        == "02/11/2021, 15:35:45: Epoch (1/1000)"
+    )
+    assert (
+        specimen.format_log_message(
+            dict(MESSAGE, worker_number=2, worker_count=2), prefix="job-1"
+        )
+        == "02/11/2021, 15:35:45: job-1 Worker 2 - Epoch (1/1000)"
+    )
+
+
+def test_format_timestamp_cache_tracks_seconds():
+    first = specimen.format_timestamp(1613079345318)
+    assert specimen.format_timestamp(1613079345999) == first
+    assert specimen.format_timestamp(1613079346000) != first
+
+
+def test_stdout_sink_batches_messages():
+    stream = io.StringIO()
+    with specimen.StdoutSink(stream=stream, flush_interval=5) as sink:
+        for index in range(10):
+            sink(dict(MESSAGE, msg=f"line {index}"))
+        sink.handler(prefix="job-1")(MESSAGE)
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 11
+    assert lines[0] == "02/11/2021, 15:35:45: line 0"
+    assert lines[-1] == "02/11/2021, 15:35:45: job-1 - Epoch (1/1000)"
+    assert sink.metrics["written"] == 11
+    assert sink.metrics["batches"] == 1
+    assert sink.metrics["pending"] == 0
+
+
+def test_sink_flushes_on_interval():
+    stream = io.StringIO()
+    sink = specimen.StdoutSink(stream=stream, flush_interval=0.01)
+    try:
+        sink(MESSAGE)
+        deadline = time.monotonic() + 5
+        while not stream.getvalue() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert stream.getvalue() == "02/11/2021, 15:35:45: Epoch (1/1000)\n"
+    finally:
+        sink.close()
+
+
+def test_sink_flushes_on_batch_size():
+    stream = io.StringIO()
+    with specimen.StdoutSink(
+        stream=stream, batch_size=2, flush_interval=5
+    ) as sink:
+        for index in range(5):
+            sink(MESSAGE)
+    assert sink.metrics["batches"] == 3
+
+
+def test_sink_reports_backpressure(caplog):
+    release = threading.Event()
+    stream = SlowStream(release)
+    sink = specimen.StdoutSink(
+        stream=stream, batch_size=1, flush_interval=0, max_pending=3
+    )
+    try:
+        with caplog.at_level(logging.WARNING):
+            for index in range(10):
+                sink(MESSAGE)
+            release.set()
+            sink.close()
+    finally:
+        release.set()
+        sink.close()
+    assert sink.metrics["written"] == 10
+    assert sink.metrics["max_pending"] > 3
+    assert "falling behind" in caplog.text
+
+
+def test_closed_sink_rejects_messages():
+    sink = specimen.StdoutSink(stream=io.StringIO())
+    sink.close()
+    with raises(ValueError):
+        sink(MESSAGE)
+
+
+def test_sink_requires_write():
+    with raises(TypeError):
+        specimen.LogSink()
+
+
+def test_rotating_file_sink(tmp_path):
+    path = tmp_path / "job.log"
+    with specimen.RotatingFileSink(
+        str(path), max_bytes=100, backup_count=2
+    ) as sink:
+        for index in range(12):
+            sink(dict(MESSAGE, msg=f"line {index}"))
+    assert path.exists()
+    assert (tmp_path / "job.log.1").exists()
+    assert (tmp_path / "job.log.2").exists()
+    assert not (tmp_path / "job.log.3").exists()
+    assert path.read_text().splitlines()[-1].endswith("line 11")
+    for file in [path, tmp_path / "job.log.1"]:
+        assert file.stat().st_size <= 100
+
+
+def test_jsonl_sink(tmp_path):
+    path = tmp_path / "job.jsonl"
+    with specimen.JsonlSink(str(path)) as sink:
+        sink(MESSAGE)
+        sink.handler(prefix="job-1")(MESSAGE)
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert lines == [MESSAGE, dict(MESSAGE, source="job-1")]
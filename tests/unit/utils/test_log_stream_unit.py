@@ -0,0 +1,398 @@
+import json
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, Mock
+from aiohttp import WSMessage, WSMsgType
+from pytest import mark, fixture, raises
+
+import trainml.utils.log_stream as specimen
+from trainml.exceptions import ApiError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+class FakeWebSocket(object):
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self.messages = asyncio.Queue()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        self.closed = True
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+    def receive(self, **data):
+        self.messages.put_nowait(
+            WSMessage(WSMsgType.TEXT, json.dumps(data), None)
+        )
+
+    def drop(self):
+        self.messages.put_nowait(WSMessage(WSMsgType.CLOSED, None, None))
+
+    async def close(self):
+        self.closed = True
+        self.messages.put_nowait(None)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        msg = await self.messages.get()
+        if msg is None:
+            raise StopAsyncIteration
+        return msg
+
+
+class FakeSession(object):
+    def __init__(self):
+        self.sockets = []
+        self.connected = asyncio.Event()
+        self.failures = 0
+
+    def ws_connect(self, url, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("connection refused")
+        ws = FakeWebSocket()
+        self.sockets.append(ws)
+        self.connected.set()
+        return ws
+
+    async def next_socket(self, count):
+        while len(self.sockets) < count:
+            await asyncio.sleep(0)
+        ## let the runner send the subscription requests
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return self.sockets[count - 1]
+
+
+@fixture
+def session():
+    return FakeSession()
+
+
+@fixture
+def log_stream(session, monkeypatch):
+    monkeypatch.setattr(specimen, "END_GRACE_PERIOD", 0)
+    monkeypatch.setattr(specimen, "RECONNECT_DELAY", 0)
+    trainml = Mock(
+        ws_url="api-ws.example.com", _version="1.0", status_events=True
+    )
+    trainml.auth.get_tokens_async = AsyncMock(
+        return_value=dict(id_token="token")
+    )
+
+    @asynccontextmanager
+    async def client_session():
+        yield session
+
+    trainml._client_session = client_session
+    return specimen.LogStream(trainml)
+
+
+def _actions(ws, id):
+    return [
+        (msg["action"], msg["data"]["type"])
+        for msg in ws.sent
+        if msg["data"]["id"] == id
+    ]
+
+
+@mark.asyncio
+async def test_subscriptions_use_their_own_connection(log_stream, session):
+    first, second = [], []
+    tasks = [
+        asyncio.create_task(
+            log_stream.subscribe("job", "proj", "job-1", first.append)
+        ),
+        asyncio.create_task(
+            log_stream.subscribe("job", "proj", "job-2", second.append)
+        ),
+    ]
+    first_ws = await session.next_socket(1)
+    second_ws = await session.next_socket(2)
+    assert _actions(first_ws, "job-1") == [
+        ("getlogs", "init"),
+        ("subscribe", "logs"),
+    ]
+    assert _actions(second_ws, "job-2") == [
+        ("getlogs", "init"),
+        ("subscribe", "logs"),
+    ]
+
+    first_ws.receive(
+        type="subscription", stream="w-1", job_worker_uuid="w-1", msg="one"
+    )
+    second_ws.receive(
+        type="subscription", stream="w-2", job_worker_uuid="w-2", msg="two"
+    )
+    first_ws.receive(type="end")
+    await asyncio.wait_for(tasks[0], 1)
+    assert first_ws.closed
+    assert not second_ws.closed
+    second_ws.receive(type="end")
+    await asyncio.wait_for(tasks[1], 1)
+
+    assert [m["msg"] for m in first] == ["one"]
+    assert [m["msg"] for m in second] == ["two"]
+    assert second_ws.closed
+    assert log_stream.subscriptions == 0
+
+
+@mark.asyncio
+async def test_subscribing_again_replaces_subscription(log_stream, session):
+    first = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", Mock())
+    )
+    first_ws = await session.next_socket(1)
+    second = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", Mock())
+    )
+    second_ws = await session.next_socket(2)
+    await asyncio.wait_for(first, 1)
+    assert first_ws.closed
+    assert log_stream.subscriptions == 1
+    second_ws.receive(type="end")
+    await asyncio.wait_for(second, 1)
+
+
+@mark.asyncio
+async def test_reconnect_resumes_from_last_message(log_stream, session):
+    received = []
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", received.append)
+    )
+    ws = await session.next_socket(1)
+    ws.receive(type="subscription", stream="w-1", time=90, msg="old")
+    ws.receive(type="subscription", stream="w-1", time=100, msg="a")
+    ws.receive(type="subscription", stream="w-2", time=50, msg="b")
+    ws.drop()
+    ws = await session.next_socket(2)
+    assert _actions(ws, "job-1") == [
+        ("getlogs", "init"),
+        ("subscribe", "logs"),
+    ]
+    assert ws.sent[0]["data"]["start_time"] == 50
+
+    ## backfill overlaps with what was already delivered
+    ws.receive(type="subscription", stream="w-2", time=50, msg="b")
+    ws.receive(type="subscription", stream="w-1", time=90, msg="old")
+    ws.receive(type="subscription", stream="w-1", time=100, msg="a")
+    ws.receive(type="subscription", stream="w-2", time=60, msg="c")
+    ws.receive(type="subscription", stream="w-1", time=100, msg="d")
+    ws.receive(type="end")
+    await asyncio.wait_for(task, 1)
+    assert [m["msg"] for m in received] == ["old", "a", "b", "c", "d"]
+
+
+@mark.asyncio
+async def test_live_message_before_backfill(log_stream, session):
+    received = []
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", received.append)
+    )
+    ws = await session.next_socket(1)
+    ws.receive(type="subscription", stream="w-1", time=100, msg="a")
+    ws.drop()
+    ws = await session.next_socket(2)
+    assert ws.sent[0]["data"]["start_time"] == 100
+
+    ## a live message overtakes the backfill of the gap
+    ws.receive(type="subscription", stream="w-1", time=200, msg="live")
+    ws.receive(type="subscription", stream="w-1", time=100, msg="a")
+    ws.receive(type="subscription", stream="w-1", time=150, msg="gap-1")
+    ws.receive(type="subscription", stream="w-1", time=160, msg="gap-2")
+    ws.receive(type="end")
+    await asyncio.wait_for(task, 1)
+    assert [m["msg"] for m in received] == ["a", "live", "gap-1", "gap-2"]
+
+
+@mark.asyncio
+async def test_first_attach_delivers_history(log_stream, session):
+    received = []
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", received.append)
+    )
+    ws = await session.next_socket(1)
+    ws.receive(type="subscription", stream="w-1", time=200, msg="live")
+    ws.receive(type="subscription", stream="w-1", time=100, msg="history")
+    ws.receive(type="end")
+    await asyncio.wait_for(task, 1)
+    assert [m["msg"] for m in received] == ["live", "history"]
+
+
+@mark.asyncio
+async def test_reconnect_without_messages_reloads_history(log_stream, session):
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", Mock())
+    )
+    ws = await session.next_socket(1)
+    ws.drop()
+    ws = await session.next_socket(2)
+    assert "start_time" not in ws.sent[0]["data"]
+    ws.receive(type="end")
+    await asyncio.wait_for(task, 1)
+
+
+def test_dedup_window_is_bounded(monkeypatch):
+    monkeypatch.setattr(specimen, "DEDUP_WINDOW", 3)
+    subscription = specimen.LogSubscription(
+        "job", "proj", "job-1", Mock(), Mock()
+    )
+    for msg in ["a", "b", "c", "d"]:
+        assert not subscription.seen(dict(stream="w", time=10, msg=msg))
+    assert len(subscription._recent_keys) == 3
+    subscription.backfill()
+    assert subscription.seen(dict(stream="w", time=10, msg="d"))
+    assert not subscription.seen(dict(stream="w", time=10, msg="a"))
+    assert not subscription.seen(dict(stream="w", time=11, msg="a"))
+    assert not subscription.seen(dict(stream="w", time=11, msg="a"))
+    assert not subscription.seen(dict(stream="w", msg="no time"))
+
+
+@mark.asyncio
+async def test_handler_error_only_fails_its_subscription(log_stream, session):
+    received = []
+    failing = asyncio.create_task(
+        log_stream.subscribe(
+            "job", "proj", "job-1", Mock(side_effect=ValueError("bad"))
+        )
+    )
+    working = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-2", received.append)
+    )
+    failing_ws = await session.next_socket(1)
+    working_ws = await session.next_socket(2)
+    failing_ws.receive(type="subscription", stream="w-1", msg="one")
+    with raises(ValueError):
+        await asyncio.wait_for(failing, 1)
+    working_ws.receive(type="subscription", stream="w-2", msg="two")
+    working_ws.receive(type="end")
+    await asyncio.wait_for(working, 1)
+    assert [m["msg"] for m in received] == ["two"]
+
+
+@mark.asyncio
+async def test_reconnects_back_off_until_messages_arrive(
+    log_stream, session, monkeypatch
+):
+    monkeypatch.setattr(specimen, "RECONNECT_DELAY", 1)
+    monkeypatch.setattr(specimen.random, "random", lambda: 0.5)
+    delays = []
+    real_sleep = asyncio.sleep
+
+    async def sleep(delay):
+        ## the test's own zero sleeps let the other tasks run
+        if delay:
+            delays.append(delay)
+        await real_sleep(0)
+
+    monkeypatch.setattr(specimen.asyncio, "sleep", sleep)
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", Mock())
+    )
+    for count in range(1, 4):
+        ws = await session.next_socket(count)
+        ws.drop()
+    ws = await session.next_socket(4)
+    ws.receive(type="subscription", stream="w-1", time=10, msg="a")
+    ws.drop()
+    ws = await session.next_socket(5)
+    ws.receive(type="end")
+    await task
+    assert delays == [1, 2, 4, 1]
+
+
+@mark.asyncio
+async def test_connection_failures_raise_api_error(log_stream, session):
+    session.failures = specimen.MAX_CONNECTION_TRIES
+    with raises(ApiError):
+        await asyncio.wait_for(
+            log_stream.subscribe("job", "proj", "job-1", Mock()), 1
+        )
+    assert log_stream.subscriptions == 0
+
+
+@mark.asyncio
+async def test_cancelled_subscriber_closes_connection(log_stream, session):
+    task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", Mock())
+    )
+    ws = await session.next_socket(1)
+    task.cancel()
+    with raises(asyncio.CancelledError):
+        await task
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert ws.closed
+    assert log_stream.subscriptions == 0
+
+
+@mark.asyncio
+async def test_status_subscription_routes_status_events(log_stream, session):
+    logs, statuses = [], []
+    log_task = asyncio.create_task(
+        log_stream.subscribe("job", "proj", "job-1", logs.append)
+    )
+    status_task = asyncio.create_task(
+        log_stream.subscribe(
+            "job", "proj", "job-1", statuses.append, kind="status"
+        )
+    )
+    log_ws = await session.next_socket(1)
+    status_ws = await session.next_socket(2)
+    assert _actions(log_ws, "job-1") == [
+        ("getlogs", "init"),
+        ("subscribe", "logs"),
+    ]
+    assert _actions(status_ws, "job-1") == [("subscribe", "status")]
+    status_ws.receive(type="status", status="running")
+    log_ws.receive(type="subscription", stream="w-1", msg="log")
+    log_ws.receive(type="end")
+    await asyncio.wait_for(log_task, 1)
+    assert [m["status"] for m in statuses] == ["running"]
+    assert [m["msg"] for m in logs] == ["log"]
+    assert not status_task.done()
+    status_task.cancel()
+    with raises(asyncio.CancelledError):
+        await status_task
+
+
+@mark.asyncio
+async def test_status_watch_wakes_on_event(log_stream, session):
+    log_stream.trainml.log_stream = log_stream
+    async with specimen.StatusWatch(
+        log_stream.trainml, "job", "proj", "job-1"
+    ) as watch:
+        ws = await session.next_socket(1)
+        ws.receive(type="status", status="running")
+        await asyncio.wait_for(watch.sleep(60), 1)
+        assert watch.status == "running"
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert ws.closed
+    assert log_stream.subscriptions == 0
+
+
+@mark.asyncio
+async def test_status_watch_is_opt_in():
+    trainml = Mock(status_events=False)
+    async with specimen.StatusWatch(trainml, "job", "proj", "job-1") as watch:
+        await watch.sleep(0)
+    assert watch._task is None
+    trainml.log_stream.subscribe.assert_not_called()
+
+
+@mark.asyncio
+async def test_status_watch_without_websocket_sleeps():
+    trainml = Mock(status_events=True)
+    trainml.log_stream.subscribe = Mock(side_effect=ConnectionError())
+    async with specimen.StatusWatch(trainml, "job", "proj", "job-1") as watch:
+        assert watch._task is None
+        await watch.sleep(0)
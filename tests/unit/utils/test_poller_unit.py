@@ -0,0 +1,265 @@
+from unittest.mock import AsyncMock, Mock, patch
+from pytest import mark, fixture, raises
+
+import trainml.utils.poller as specimen
+from trainml.jobs import Job, Jobs
+from trainml.exceptions import ApiError, JobError, TrainMLException
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def make_job(mock_trainml, id, status, project_uuid="proj-id-1"):
+    return Job(
+        mock_trainml,
+        job_uuid=id,
+        project_uuid=project_uuid,
+        name=id,
+        type="training",
+        status=status,
+        workers=[],
+    )
+
+
+@fixture
+def collection(mock_trainml):
+    collection = Mock()
+    collection.list = AsyncMock()
+    return collection
+
+
+def listing(mock_trainml, *ticks):
+    return [
+        [make_job(mock_trainml, id, status) for id, status in tick.items()]
+        for tick in ticks
+    ]
+
+
+@mark.asyncio
+async def test_as_completed_lists_once_per_tick(mock_trainml, collection):
+    jobs = [make_job(mock_trainml, f"job-id-{i}", "running") for i in range(3)]
+    collection.list.side_effect = listing(
+        mock_trainml,
+        {"job-id-0": "running", "job-id-1": "running", "job-id-2": "running"},
+        {"job-id-0": "running", "job-id-1": "finished", "job-id-2": "running"},
+        {"job-id-0": "finished", "job-id-2": "finished"},
+    )
+    responses = {
+        "job-id-0": dict(job_uuid="job-id-0", status="finished"),
+        "job-id-1": dict(job_uuid="job-id-1", status="finished"),
+        "job-id-2": dict(job_uuid="job-id-2", status="finished"),
+    }
+    mock_trainml._query = AsyncMock(
+        side_effect=lambda path, *args: responses[path.split("/")[-1]]
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        completed = [
+            job.id
+            async for job in specimen.as_completed(
+                collection, jobs, "finished", timeout=600
+            )
+        ]
+    assert completed == ["job-id-1", "job-id-0", "job-id-2"]
+    assert collection.list.await_count == 3
+    collection.list.assert_awaited_with(project_uuid="proj-id-1")
+    ## only entities whose listed status changed are refreshed
+    assert mock_trainml._query.await_count == 3
+
+
+@mark.asyncio
+async def test_as_completed_yields_already_done(mock_trainml, collection):
+    job = make_job(mock_trainml, "job-id-1", "finished")
+    completed = [
+        job
+        async for job in specimen.as_completed(collection, [job], "finished")
+    ]
+    assert completed == [job]
+    collection.list.assert_not_awaited()
+
+
+@mark.asyncio
+async def test_wait_all_and_wait_any(mock_trainml, collection):
+    jobs = [
+        make_job(mock_trainml, "job-id-1", "running"),
+        make_job(mock_trainml, "job-id-2", "running"),
+    ]
+    collection.list.side_effect = listing(
+        mock_trainml,
+        {"job-id-1": "running", "job-id-2": "finished"},
+        {"job-id-1": "finished", "job-id-2": "finished"},
+    )
+    mock_trainml._query = AsyncMock(
+        side_effect=lambda path, *args: dict(
+            job_uuid=path.split("/")[-1], status="finished"
+        )
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        first = await specimen.wait_any(collection, jobs, "finished")
+        assert first.id == "job-id-2"
+        result = await specimen.wait_all(collection, jobs, "finished")
+    assert result == jobs
+    assert all(job.status == "finished" for job in jobs)
+
+
+@mark.asyncio
+async def test_wait_all_stopped_training_is_finished(mock_trainml, collection):
+    jobs = [
+        make_job(mock_trainml, "job-id-1", "stopped"),
+        make_job(mock_trainml, "job-id-2", "running"),
+    ]
+    collection.list.side_effect = listing(
+        mock_trainml, {"job-id-1": "stopped", "job-id-2": "stopped"}
+    )
+    mock_trainml._query = AsyncMock(
+        return_value=dict(
+            job_uuid="job-id-2", type="training", status="stopped"
+        )
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        result = await specimen.wait_all(collection, jobs, "finished")
+    assert result == jobs
+    mock_trainml._query.assert_awaited_once()
+
+
+@mark.asyncio
+async def test_as_completed_groups_lists_by_project(mock_trainml, collection):
+    jobs = [
+        make_job(mock_trainml, "job-id-1", "running", "proj-id-1"),
+        make_job(mock_trainml, "job-id-2", "running", "proj-id-2"),
+    ]
+    collection.list.return_value = []
+    mock_trainml._query = AsyncMock(
+        side_effect=lambda path, *args: dict(
+            job_uuid=path.split("/")[-1], status="finished"
+        )
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        await specimen.wait_all(collection, jobs, "finished")
+    assert sorted(
+        call.kwargs["project_uuid"] for call in collection.list.await_args_list
+    ) == ["proj-id-1", "proj-id-2"]
+
+
+@mark.asyncio
+async def test_as_completed_raises_on_failure(mock_trainml, collection):
+    jobs = [make_job(mock_trainml, "job-id-1", "running")]
+    collection.list.return_value = listing(
+        mock_trainml, {"job-id-1": "failed"}
+    )[0]
+    mock_trainml._query = AsyncMock(
+        return_value=dict(job_uuid="job-id-1", status="failed")
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        with raises(JobError):
+            await specimen.wait_all(collection, jobs, "finished")
+
+
+@mark.asyncio
+async def test_as_completed_archived_on_not_found(mock_trainml, collection):
+    jobs = [make_job(mock_trainml, "job-id-1", "finished")]
+    collection.list.return_value = []
+    mock_trainml._query = AsyncMock(
+        side_effect=ApiError(404, dict(errorMessage="Job Not Found"))
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        result = await specimen.wait_all(collection, jobs, "archived")
+    assert result == jobs
+
+
+@mark.asyncio
+async def test_as_completed_not_found_raises(mock_trainml, collection):
+    jobs = [make_job(mock_trainml, "job-id-1", "running")]
+    collection.list.return_value = []
+    mock_trainml._query = AsyncMock(
+        side_effect=ApiError(404, dict(errorMessage="Job Not Found"))
+    )
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        with raises(ApiError):
+            await specimen.wait_all(collection, jobs, "finished")
+
+
+@mark.asyncio
+async def test_as_completed_timeout(mock_trainml, collection):
+    jobs = [make_job(mock_trainml, "job-id-1", "running")]
+    collection.list.return_value = listing(
+        mock_trainml, {"job-id-1": "running"}
+    )[0]
+    clock = iter(range(0, 1000, 10))
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        with patch(
+            "trainml.utils.poller.time.monotonic",
+            side_effect=lambda: next(clock),
+        ):
+            with raises(TrainMLException, match="Timeout waiting for"):
+                await specimen.wait_all(collection, jobs, "finished", 60)
+    mock_trainml._query.assert_not_awaited()
+
+
+@mark.asyncio
+async def test_collection_wait_all_delegates(mock_trainml):
+    jobs = Jobs(mock_trainml)
+    job = make_job(mock_trainml, "job-id-1", "finished")
+    assert await jobs.wait_all([job], "finished") == [job]
+    assert await jobs.wait_any([job], "finished") is job
+
+
+def test_poll_schedule_backs_off_to_status_cap():
+    with patch("trainml.utils.poller.random.uniform", return_value=1):
+        schedule = specimen.PollSchedule(3600, "running")
+        intervals = [schedule.next_interval() for _ in range(8)]
+    assert intervals[0] == specimen.POLL_INTERVAL_INITIAL
+    assert intervals == sorted(intervals)
+    assert intervals[-1] == 6
+    assert schedule.polls == 8
+
+
+def test_poll_schedule_caps_unknown_status_by_timeout():
+    schedule = specimen.PollSchedule(3600)
+    assert schedule.max_interval == specimen.POLL_INTERVAL_MAX
+    schedule = specimen.PollSchedule(10, "unknown")
+    assert schedule.max_interval == specimen.POLL_INTERVAL_MIN
+
+
+def test_poll_schedule_jitter_is_bounded():
+    for _ in range(100):
+        interval = specimen.PollSchedule(3600).next_interval()
+        assert 0.8 <= interval <= 1.2
+
+
+def test_poll_schedule_stops_at_deadline():
+    with patch("trainml.utils.poller.time.monotonic", return_value=100):
+        schedule = specimen.PollSchedule(0.5)
+    with patch("trainml.utils.poller.time.monotonic", return_value=100.25):
+        assert schedule.next_interval() == 0.25
+        assert not schedule.expired
+    with patch("trainml.utils.poller.time.monotonic", return_value=101):
+        assert schedule.expired
+        assert schedule.next_interval() == 0
+
+
+@mark.asyncio
+async def test_wait_all_with_identity_map(mock_trainml):
+    from trainml.utils.entity import IdentityMap
+
+    mock_trainml.identity_map = IdentityMap()
+    payload = dict(
+        job_uuid="job-id-1",
+        project_uuid="proj-id-1",
+        name="job",
+        type="training",
+        status="running",
+        workers=[],
+    )
+    job = Job._from_payload(mock_trainml, payload)
+
+    async def query(path, method, params=None, *args, **kwargs):
+        ## listing merges the new status into the job being waited on
+        finished = dict(payload, status="finished")
+        return [finished] if path == "/job" else finished
+
+    mock_trainml._query = AsyncMock(side_effect=query)
+    with patch("trainml.utils.poller.asyncio.sleep", new=AsyncMock()):
+        jobs = await specimen.wait_all(
+            Jobs(mock_trainml), [job], "finished", timeout=60
+        )
+    assert jobs == [job] and job.status == "finished"
+    assert mock_trainml._query.await_count == 2
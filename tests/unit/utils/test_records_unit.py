@@ -0,0 +1,101 @@
+import io
+import csv
+import sys
+from unittest.mock import Mock
+from pytest import mark, fixture, raises
+
+import trainml.utils.records as specimen
+from trainml.jobs import Job
+from trainml.exceptions import TrainMLException
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+@fixture
+def jobs():
+    trainml = Mock()
+    return [
+        Job(
+            trainml,
+            job_uuid="job-id-1",
+            name="first",
+            credits=1.5,
+            nb_token="secret",
+            resources=dict(gpu_count=1, gpu_types=["1060"]),
+        ),
+        Job(
+            trainml,
+            job_uuid="job-id-2",
+            name="second",
+            resources=dict(gpu_count=4),
+        ),
+    ]
+
+
+def test_to_records_selects_nested_fields(jobs):
+    records = specimen.to_records(
+        jobs, ["job_uuid", "resources.gpu_count", "credits", "a.b"]
+    )
+    assert records == [
+        {
+            "job_uuid": "job-id-1",
+            "resources.gpu_count": 1,
+            "credits": 1.5,
+            "a.b": None,
+        },
+        {
+            "job_uuid": "job-id-2",
+            "resources.gpu_count": 4,
+            "credits": None,
+            "a.b": None,
+        },
+    ]
+
+
+def test_to_records_flattens_all_fields(jobs):
+    first = specimen.to_records(jobs)[0]
+    assert first == {
+        "job_uuid": "job-id-1",
+        "name": "first",
+        "credits": 1.5,
+        "resources.gpu_count": 1,
+        "resources.gpu_types": ["1060"],
+    }
+
+
+def test_to_columns(jobs):
+    assert specimen.to_columns(jobs, ["name", "resources.gpu_count"]) == {
+        "name": ["first", "second"],
+        "resources.gpu_count": [1, 4],
+    }
+    columns = specimen.to_columns(iter(jobs))
+    assert list(columns) == [
+        "job_uuid",
+        "name",
+        "credits",
+        "resources.gpu_count",
+        "resources.gpu_types",
+    ]
+    assert columns["credits"] == [1.5, None]
+    assert "nb_token" not in columns
+
+
+def test_write_csv(jobs):
+    file = io.StringIO()
+    specimen.write_csv(jobs, file)
+    rows = list(csv.reader(io.StringIO(file.getvalue())))
+    assert rows[0] == [
+        "job_uuid",
+        "name",
+        "credits",
+        "resources.gpu_count",
+        "resources.gpu_types",
+    ]
+    assert rows[1] == ["job-id-1", "first", "1.5", "1", '["1060"]']
+    assert rows[2] == ["job-id-2", "second", "", "4", ""]
+
+
+def test_to_arrow_requires_pyarrow(jobs, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with raises(TrainMLException):
+        specimen.to_arrow(jobs)
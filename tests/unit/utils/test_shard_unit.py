@@ -0,0 +1,67 @@
+import os
+from pytest import mark, raises
+
+import trainml.utils.shard as specimen
+from trainml.exceptions import SpecificationError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def test_partition_balances_sizes():
+    sizes = dict(a=7, b=5, c=4, d=3, e=1)
+    groups = specimen.partition(sizes, 2)
+    totals = sorted(sum(sizes[item] for item in group) for group in groups)
+    assert totals == [10, 10]
+    assert sorted(item for group in groups for item in group) == list(sizes)
+
+
+def test_partition_drops_empty_shards():
+    assert specimen.partition(dict(a=1, b=2), 4) == [["b"], ["a"]]
+    with raises(SpecificationError):
+        specimen.partition(dict(a=1), 0)
+
+
+def write(path, size):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(b"x" * size)
+
+
+def test_shard_directory(tmp_path):
+    input_dir = tmp_path / "input"
+    write(str(input_dir / "big.bin"), 300)
+    write(str(input_dir / "nested" / "a.bin"), 200)
+    write(str(input_dir / "nested" / "b.bin"), 100)
+    shard_dirs = specimen.shard_directory(
+        str(input_dir), 2, str(tmp_path / "work")
+    )
+    assert [os.path.basename(d) for d in shard_dirs] == ["shard-0", "shard-1"]
+    assert os.listdir(shard_dirs[0]) == ["big.bin"]
+    assert sorted(os.listdir(os.path.join(shard_dirs[1], "nested"))) == [
+        "a.bin",
+        "b.bin",
+    ]
+    ## linked, not symbolic links, so uploads archive the data
+    assert not os.path.islink(os.path.join(shard_dirs[0], "big.bin"))
+
+
+def test_shard_directory_empty(tmp_path):
+    with raises(SpecificationError):
+        specimen.shard_directory(str(tmp_path), 2, str(tmp_path / "work"))
+
+
+def test_merge_outputs(tmp_path):
+    output_dir = tmp_path / "output"
+    shard_output = output_dir / "shard-0"
+    write(str(shard_output / "result-1.json"), 1)
+    write(str(shard_output / "taken.json"), 1)
+    write(str(output_dir / "taken.json"), 2)
+    specimen.merge_outputs(str(shard_output), str(output_dir))
+    assert os.path.exists(output_dir / "result-1.json")
+    assert os.path.getsize(output_dir / "taken.json") == 2
+    assert os.listdir(shard_output) == ["taken.json"]
+
+    os.remove(shard_output / "taken.json")
+    write(str(shard_output / "result-2.json"), 1)
+    specimen.merge_outputs(str(shard_output), str(output_dir))
+    assert not os.path.exists(shard_output)
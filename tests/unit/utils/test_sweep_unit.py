@@ -0,0 +1,56 @@
+from pytest import mark, raises
+
+import trainml.utils.sweep as specimen
+from trainml.exceptions import SpecificationError
+
+pytestmark = [mark.sdk, mark.unit]
+
+
+def test_expand_grid():
+    assert specimen.expand_grid(dict(lr=[0.1, 0.01], bs=32)) == [
+        dict(lr=0.1, bs=32),
+        dict(lr=0.01, bs=32),
+    ]
+
+
+def test_render_keeps_strings():
+    rendered = specimen.render(
+        dict(
+            workers=["train.py --lr {lr} --gpus {gpus}", "echo {{done}}"],
+            env=[dict(key="LR", value="{lr}")],
+            disk_size=10,
+        ),
+        dict(gpus=2, lr=0.1),
+    )
+    assert rendered == dict(
+        workers=["train.py --lr 0.1 --gpus 2", "echo {done}"],
+        env=[dict(key="LR", value="0.1")],
+        disk_size=10,
+    )
+
+
+def test_sweep_specs_numeric_arguments():
+    template = dict(
+        name="lr-{lr}",
+        gpu_count="{gpus}",
+        gpu_type="{gpu}",
+        environment=dict(env=[dict(key="GPUS", value="{gpus}")]),
+    )
+    spec = specimen.sweep_specs(template, dict(lr=0.1, gpus=2, gpu="t4"))[0]
+    assert spec["gpu_count"] == 2
+    assert spec["gpu_type"] == "t4"
+    assert spec["environment"]["env"] == [dict(key="GPUS", value="2")]
+
+
+def test_render_unknown_parameter():
+    with raises(SpecificationError):
+        specimen.render("train.py --lr {learning_rate}", dict(lr=0.1))
+
+
+def test_sweep_specs_names():
+    template = dict(name="sweep", workers=["train.py --lr {lr}"])
+    specs = specimen.sweep_specs(template, dict(lr=[0.1, 0.01]))
+    assert [spec["name"] for spec in specs] == ["sweep-0", "sweep-1"]
+    assert specs[1]["workers"] == ["train.py --lr 0.01"]
+    specs = specimen.sweep_specs(dict(name="lr-{lr}"), dict(lr=[0.1]))
+    assert specs[0]["name"] == "lr-0.1"
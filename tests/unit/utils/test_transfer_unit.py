@@ -593,7 +593,7 @@ class UploadChunkTests:
             def __init__(self):
                 self.release_calls = 0
 
-            async def json(self):
+            async def json(self, **kwargs):
                 return {}
 
             async def release(self):
@@ -634,7 +634,7 @@ class UploadChunkTests:
             def __init__(self):
                 self.release_calls = 0
 
-            async def json(self):
+            async def json(self, **kwargs):
                 return {}
 
             async def release(self):
@@ -1,8 +1,5 @@
 import json
 import logging
-import math
-import asyncio
-from datetime import datetime
 
 from .exceptions import (
     CheckpointError,
@@ -11,6 +8,10 @@ from .exceptions import (
     TrainMLException,
 )
 from trainml.utils.transfer import upload, download
+from trainml.utils.log_sinks import format_log_message
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils import poller
+from trainml.utils.entity import Entity
 
 
 class Checkpoints(object):
@@ -19,18 +20,21 @@ class Checkpoints(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/checkpoint/{id}", "GET", kwargs)
-        return Checkpoint(self.trainml, **resp)
+        return Checkpoint._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/checkpoint", "GET", kwargs)
         checkpoints = [
-            Checkpoint(self.trainml, **checkpoint) for checkpoint in resp
+            Checkpoint._from_payload(self.trainml, checkpoint)
+            for checkpoint in resp
         ]
         return checkpoints
 
     async def list_public(self, **kwargs):
         resp = await self.trainml._query(f"/checkpoint/public", "GET", kwargs)
-        datasets = [Checkpoint(self.trainml, **dataset) for dataset in resp]
+        datasets = [
+            Checkpoint._from_payload(self.trainml, dataset) for dataset in resp
+        ]
         return datasets
 
     async def create(
@@ -55,7 +59,7 @@ class Checkpoints(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Creating Checkpoint {name}")
         resp = await self.trainml._query("/checkpoint", "POST", None, payload)
-        checkpoint = Checkpoint(self.trainml, **resp)
+        checkpoint = Checkpoint._from_payload(self.trainml, resp)
         logging.info(f"Created Checkpoint {name} with id {checkpoint.id}")
 
         return checkpoint
@@ -65,23 +69,31 @@ class Checkpoints(object):
             f"/checkpoint/{id}", "DELETE", dict(**kwargs, force=True)
         )
 
+    async def wait_all(self, checkpoints, status, timeout=300):
+        return await poller.wait_all(self, checkpoints, status, timeout)
+
+    async def wait_any(self, checkpoints, status, timeout=300):
+        return await poller.wait_any(self, checkpoints, status, timeout)
+
+    def as_completed(self, checkpoints, status, timeout=300):
+        return poller.as_completed(self, checkpoints, status, timeout)
+
+
+class Checkpoint(Entity):
+    _payload = "_checkpoint"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("checkpoint_uuid")),
+        _status=lambda d: d.get("status"),
+        _name=lambda d: d.get("name"),
+        _size=lambda d: d.get("size") or d.get("used_size"),
+        _billed_size=lambda d: d.get("billed_size") or d.get("size"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+    )
+    __slots__ = ("_checkpoint", *_fields)
 
-class Checkpoint:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._checkpoint = kwargs
-        self._id = self._checkpoint.get(
-            "id", self._checkpoint.get("checkpoint_uuid")
-        )
-        self._status = self._checkpoint.get("status")
-        self._name = self._checkpoint.get("name")
-        self._size = self._checkpoint.get("size") or self._checkpoint.get(
-            "used_size"
-        )
-        self._billed_size = self._checkpoint.get(
-            "billed_size"
-        ) or self._checkpoint.get("size")
-        self._project_uuid = self._checkpoint.get("project_uuid")
 
     @property
     def id(self) -> str:
@@ -182,7 +194,7 @@ class Checkpoint:
             dict(project_uuid=self._project_uuid),
             dict(name=name),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def export(self, output_type, output_uri, output_options=dict()):
@@ -196,7 +208,7 @@ class Checkpoint:
                 output_options=output_options,
             ),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     def _get_msg_handler(self, msg_handler):
@@ -205,12 +217,7 @@ class Checkpoint:
                 if msg_handler:
                     msg_handler(data)
                 else:
-                    timestamp = datetime.fromtimestamp(
-                        int(data.get("time")) / 1000
-                    )
-                    print(
-                        f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: {data.get('msg').rstrip()}"
-                    )
+                    print(format_log_message(data))
 
         return handler
 
@@ -230,46 +237,50 @@ class Checkpoint:
             "GET",
             dict(project_uuid=self._project_uuid),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
-    async def wait_for(self, status, timeout=300):
-        if self.status == status:
-            return
+    def _validate_wait_for(self, status, timeout):
         valid_statuses = ["downloading", "ready", "exporting", "archived"]
         if not status in valid_statuses:
             raise SpecificationError(
                 "status",
                 f"Invalid wait_for status {status}.  Valid statuses are: {valid_statuses}",
             )
-
         MAX_TIMEOUT = 24 * 60 * 60
         if timeout > MAX_TIMEOUT:
             raise SpecificationError(
                 "timeout",
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(
-            min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
-        )
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status == status:
-                return self
-            elif self.status == "failed":
-                raise CheckpointError(self.status, self)
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+
+    def _reached_status(self, status):
+        if self.status == status:
+            return True
+        elif self.status == "failed":
+            raise CheckpointError(self.status, self)
+        return False
+
+    async def wait_for(self, status, timeout=300):
+        if self.status == status:
+            return
+        self._validate_wait_for(status, timeout)
+
+        schedule = poller.PollSchedule(timeout, status)
+        async with StatusWatch(
+            self.trainml, "checkpoint", self._project_uuid, self.id
+        ) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self._reached_status(status):
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
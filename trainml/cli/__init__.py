@@ -1,16 +1,83 @@
+import re
+import sys
+import time
+import types
 import asyncio
 import click
 import logging
+import importlib
 from os import devnull
 from sys import stderr, stdout
 
 
 from trainml.trainml import TrainML
+from trainml.exceptions import ApiError, TrainMLException
+from trainml.utils.auth import _read_json_file, _write_json_file
+from trainml.utils.lazy import lazy_import
+from trainml.utils import codec
+
+aiohttp = lazy_import("aiohttp")
+
+NAME_INDEX_TTL = 5 * 60  ## seconds a cached name to ID mapping is trusted
+UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", re.I
+)
+
+
+class NameIndex(object):
+    """
+    Short-lived name to ID index for CLI lookups, kept in the config dir.
+
+    Entries are grouped by scope (collection, project and parent IDs) and
+    are only hints, callers must confirm the name of the entity they fetch.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def get(self, scope, name):
+        entry = _read_json_file(self.path).get(scope, {}).get(name)
+        if not entry or entry.get("indexed", 0) + NAME_INDEX_TTL < time.time():
+            return None
+        return entry.get("id")
+
+    def update(self, scope, items):
+        indexed = time.time()
+        index = _read_json_file(self.path)
+        index = {
+            key: entries
+            for key, entries in index.items()
+            if any(
+                entry.get("indexed", 0) + NAME_INDEX_TTL >= indexed
+                for entry in entries.values()
+            )
+        }
+        entries = dict()
+        for item in items:
+            name = getattr(item, "name", None)
+            if isinstance(name, str) and name not in entries:
+                entries[name] = dict(id=item.id, indexed=indexed)
+        index[scope] = entries
+        _write_json_file(self.path, index)
 
 
 class TrainMLRunner(object):
+    """
+    Runs the async SDK calls of a CLI command.
+
+    All calls share one event loop and, once the client is created, one
+    aiohttp session, so connections and token renewals are reused across
+    the steps of a command instead of being set up again for each one.
+    """
+
     def __init__(self):
         self._trainml_client = None
+        self._runner = None
+        self._session = None
+        self._name_index = None
+        self._stats = dict(
+            steps=0, elapsed=0.0, requests=0, connections=0, reused=0
+        )
 
     @property
     def client(self) -> TrainML:
@@ -21,25 +88,121 @@ class TrainMLRunner(object):
                 raise click.UsageError(err)
         return self._trainml_client
 
+    @property
+    def name_index(self) -> NameIndex:
+        if self._name_index is None:
+            self._name_index = NameIndex(
+                f"{self.client.config_dir}/name_index.json"
+            )
+        return self._name_index
+
+    def _name_scope(self, collection, parents):
+        return "/".join(
+            [type(collection).__name__, str(self.client.active_project)]
+            + [str(parents[key]) for key in sorted(parents)]
+        )
+
+    async def _get_by_id(self, collection, id, parents):
+        try:
+            item = await collection.get(id=id, **parents)
+        except ApiError:
+            return None
+        return item if item.id == id else None
+
+    async def _find(self, term, collection, parents):
+        if UUID_PATTERN.match(term):
+            found = await self._get_by_id(collection, term, parents)
+            if found is not None:
+                return found
+        scope = self._name_scope(collection, parents)
+        id = self.name_index.get(scope, term)
+        if id is not None:
+            found = await self._get_by_id(collection, id, parents)
+            if found is not None and found.name == term:
+                return found
+        items = await collection.list(**parents)
+        self.name_index.update(scope, items)
+        return search_by_id_name(term, items)
+
+    def find(self, term, collection, **parents):
+        """
+        Find an entity in collection by ID or name.
+
+        IDs are fetched directly and names are resolved through the name
+        index, so the full collection is only listed when neither works.
+        """
+        return self.run(self._find(term, collection, parents))
+
+    def _trace_config(self):
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, context, params):
+            self._stats["requests"] += 1
+
+        async def on_connection_create_end(session, context, params):
+            self._stats["connections"] += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self._stats["reused"] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
     async def _run(self, *tasks):
+        if self._trainml_client is not None and self._session is None:
+            self._session = aiohttp.ClientSession(
+                trace_configs=[self._trace_config()],
+                json_serialize=codec.dumps,
+            )
+            self._trainml_client.session = self._session
+        if len(tasks) == 1:
+            return await tasks[0]
         return await asyncio.gather(*tasks)
 
     def run(self, *tasks):
+        if self._runner is None:
+            self._runner = asyncio.Runner()
+        start = time.monotonic()
         try:
-            if len(tasks) == 1:
-                return_value = asyncio.run(*tasks)
-            else:
-                return_value = asyncio.run(self._run(*tasks))
+            return_value = self._runner.run(self._run(*tasks))
         except Exception as err:
             raise click.UsageError(err)
+        finally:
+            elapsed = time.monotonic() - start
+            self._stats["steps"] += 1
+            self._stats["elapsed"] += elapsed
+            logging.debug(
+                f"Step {self._stats['steps']} completed in {elapsed:.3f}s"
+            )
         return return_value
 
+    def close(self):
+        if self._runner is None:
+            return
+        try:
+            if self._session is not None:
+                self._runner.run(self._session.close())
+            logging.info(
+                "Completed {steps} steps in {elapsed:.3f}s with {requests} "
+                "API requests over {connections} connections "
+                "({reused} reused)".format(**self._stats)
+            )
+        finally:
+            self._session = None
+            self._runner.close()
+            self._runner = None
+
 
 class Config(object):
     def __init__(self):
         self.stderr = stderr
         self.stdout = stdout
         self.trainml = TrainMLRunner()
+        ctx = click.get_current_context(silent=True)
+        if ctx is not None:
+            ctx.call_on_close(self.trainml.close)
 
 
 def search_by_id_name(term, list):
@@ -59,10 +222,94 @@ def search_by_id_name(term, list):
     return found
 
 
+def export_list(config, entities, format, fields=None):
+    """
+    Write listed entities to the command output as csv or parquet.
+
+    Columns come straight from the raw API payloads, fields selects them,
+    dotted names reaching into nested objects.
+    """
+    from trainml.utils import records
+
+    fields = [field for field in fields or [] if field] or None
+    try:
+        if format == "csv":
+            records.write_csv(entities, config.stdout, fields)
+            return
+        ## binary output only goes to a file given with --output-file
+        buffer = getattr(config.stdout, "buffer", None)
+        if (
+            buffer is None
+            or getattr(config.stdout, "name", "<stdout>") == "<stdout>"
+            or config.stdout.isatty()
+        ):
+            raise click.UsageError(
+                "Parquet output must be written to a file, use --output-file."
+            )
+        config.stdout.flush()
+        records.write_parquet(entities, buffer, fields)
+        buffer.flush()
+    except TrainMLException as err:
+        raise click.UsageError(err.message)
+
+
 pass_config = click.make_pass_decorator(Config, ensure=True)
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules only when they are needed.
+
+    lazy_subcommands maps command names to the module that defines them.
+    Those modules register the command on this group when imported.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(
+            set(super().list_commands(ctx)) | set(self.lazy_subcommands)
+        )
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            importlib.import_module(self.lazy_subcommands[cmd_name])
+        return super().get_command(ctx, cmd_name)
+
+
+class CommandPackage(types.ModuleType):
+    """
+    Package whose command submodules resolve to the command they define,
+    so `from trainml.cli import job` returns the click group, not the module.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and isinstance(
+            getattr(value, name, None), click.Command
+        ):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = CommandPackage
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=dict(
+        dataset="trainml.cli.dataset",
+        model="trainml.cli.model",
+        checkpoint="trainml.cli.checkpoint",
+        volume="trainml.cli.volume",
+        environment="trainml.cli.environment",
+        gpu="trainml.cli.gpu",
+        job="trainml.cli.job",
+        project="trainml.cli.project",
+        cloudbender="trainml.cli.cloudbender",
+    ),
+)
 @click.version_option(package_name="trainml", prog_name="trainML CLI and SDK")
 @click.option(
     "--debug",
@@ -158,14 +405,3 @@ def configure(config):
         project for project in projects if project.name == name
     ]
     config.trainml.client.set_active_project(selected_project[0].id)
-
-
-from trainml.cli.dataset import dataset
-from trainml.cli.model import model
-from trainml.cli.checkpoint import checkpoint
-from trainml.cli.volume import volume
-from trainml.cli.environment import environment
-from trainml.cli.gpu import gpu
-from trainml.cli.job import job
-from trainml.cli.project import project
-from trainml.cli.cloudbender import cloudbender
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 
 
 def pretty_size(num):
@@ -29,9 +29,7 @@ def attach(config, checkpoint):
 
     CHECKPOINT may be specified by name or ID, but ID is preferred.
     """
-    checkpoints = config.trainml.run(config.trainml.client.checkpoints.list())
-
-    found = search_by_id_name(checkpoint, checkpoints)
+    found = config.trainml.find(checkpoint, config.trainml.client.checkpoints)
     if None is found:
         raise click.UsageError("Cannot find specified checkpoint.")
 
@@ -53,9 +51,7 @@ def connect(config, checkpoint, attach):
 
     CHECKPOINT may be specified by name or ID, but ID is preferred.
     """
-    checkpoints = config.trainml.run(config.trainml.client.checkpoints.list())
-
-    found = search_by_id_name(checkpoint, checkpoints)
+    found = config.trainml.find(checkpoint, config.trainml.client.checkpoints)
     if None is found:
         raise click.UsageError("Cannot find specified checkpoint.")
 
@@ -189,9 +185,7 @@ def remove(config, checkpoint, force):
 
     CHECKPOINT may be specified by name or ID, but ID is preferred.
     """
-    checkpoints = config.trainml.run(config.trainml.client.checkpoints.list())
-
-    found = search_by_id_name(checkpoint, checkpoints)
+    found = config.trainml.find(checkpoint, config.trainml.client.checkpoints)
     if None is found:
         if force:
             config.trainml.run(
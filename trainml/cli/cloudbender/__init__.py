@@ -1,6 +1,6 @@
 import click
 from webbrowser import open as browse
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 
 
 @cli.group()
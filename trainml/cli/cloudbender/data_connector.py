@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -146,13 +146,12 @@ def remove(config, provider, region, data_connector):
 
     DATASTORE may be specified by name or ID, but ID is preferred.
     """
-    data_connectors = config.trainml.run(
-        config.trainml.client.cloudbender.data_connectors.list(
-            provider_uuid=provider, region_uuid=region
-        )
+    found = config.trainml.find(
+        data_connector,
+        config.trainml.client.cloudbender.data_connectors,
+        provider_uuid=provider,
+        region_uuid=region,
     )
-
-    found = search_by_id_name(data_connector, data_connectors)
     if None is found:
         raise click.UsageError("Cannot find specified data_connector.")
 
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -142,13 +142,12 @@ def remove(config, provider, region, datastore):
 
     DATASTORE may be specified by name or ID, but ID is preferred.
     """
-    datastores = config.trainml.run(
-        config.trainml.client.cloudbender.datastores.list(
-            provider_uuid=provider, region_uuid=region
-        )
+    found = config.trainml.find(
+        datastore,
+        config.trainml.client.cloudbender.datastores,
+        provider_uuid=provider,
+        region_uuid=region,
     )
-
-    found = search_by_id_name(datastore, datastores)
     if None is found:
         raise click.UsageError("Cannot find specified datastore.")
 
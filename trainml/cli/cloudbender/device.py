@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config, export_list
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -25,8 +25,23 @@ def device(config):
     required=True,
     help="The region ID to list devices for.",
 )
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["text", "csv", "parquet"], case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Choose output format.",
+)
+@click.option(
+    "--field",
+    "-F",
+    "fields",
+    multiple=True,
+    help="Column for csv or parquet output, e.g. resources.gpu_count.",
+)
 @pass_config
-def list(config, provider, region):
+def list(config, provider, region, format, fields):
     """List devices."""
     data = [
         [
@@ -54,6 +69,10 @@ def list(config, provider, region):
         )
     )
 
+    if format in ["csv", "parquet"]:
+        export_list(config, devices, format, fields)
+        return
+
     for device in devices:
         data.append(
             [
@@ -138,19 +157,18 @@ def create(config, provider, region, minion_id, hostname, name):
 )
 @click.argument("device", type=click.STRING)
 @pass_config
-def remove(config, provider, region, node):
+def remove(config, provider, region, device):
     """
     Remove a device.
 
     DEVICE may be specified by name or ID, but ID is preferred.
     """
-    devices = config.trainml.run(
-        config.trainml.client.cloudbender.devices.list(
-            provider_uuid=provider, region_uuid=region
-        )
+    found = config.trainml.find(
+        device,
+        config.trainml.client.cloudbender.devices,
+        provider_uuid=provider,
+        region_uuid=region,
     )
-
-    found = search_by_id_name(device, devices)
     if None is found:
         raise click.UsageError("Cannot find specified device.")
 
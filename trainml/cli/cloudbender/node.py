@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -163,13 +163,12 @@ def remove(config, provider, region, node):
 
     NODE may be specified by name or ID, but ID is preferred.
     """
-    nodes = config.trainml.run(
-        config.trainml.client.cloudbender.nodes.list(
-            provider_uuid=provider, region_uuid=region
-        )
+    found = config.trainml.find(
+        node,
+        config.trainml.client.cloudbender.nodes,
+        provider_uuid=provider,
+        region_uuid=region,
     )
-
-    found = search_by_id_name(node, nodes)
     if None is found:
         raise click.UsageError("Cannot find specified node.")
 
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -69,11 +69,9 @@ def remove(config, provider):
 
     PROVIDER may be specified by name or ID, but ID is preferred.
     """
-    providers = config.trainml.run(
-        config.trainml.client.cloudbender.providers.list()
+    found = config.trainml.find(
+        provider, config.trainml.client.cloudbender.providers
     )
-
-    found = search_by_id_name(provider, providers)
     if None is found:
         raise click.UsageError("Cannot find specified provider.")
 
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -110,11 +110,11 @@ def remove(config, provider, region):
 
     REGION may be specified by name or ID, but ID is preferred.
     """
-    regions = config.trainml.run(
-        config.trainml.client.cloudbender.regions.list(provider_uuid=provider)
+    found = config.trainml.find(
+        region,
+        config.trainml.client.cloudbender.regions,
+        provider_uuid=provider,
     )
-
-    found = search_by_id_name(region, regions)
     if None is found:
         raise click.UsageError("Cannot find specified region.")
 
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 from trainml.cli.cloudbender import cloudbender
 
 
@@ -133,13 +133,12 @@ def remove(config, provider, region, service):
 
     RESERVATION may be specified by name or ID, but ID is preferred.
     """
-    services = config.trainml.run(
-        config.trainml.client.cloudbender.services.list(
-            provider_uuid=provider, region_uuid=region
-        )
+    found = config.trainml.find(
+        service,
+        config.trainml.client.cloudbender.services,
+        provider_uuid=provider,
+        region_uuid=region,
     )
-
-    found = search_by_id_name(service, services)
     if None is found:
         raise click.UsageError("Cannot find specified service.")
 
@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config, export_list
 
 
 def pretty_size(num):
@@ -29,9 +29,7 @@ def attach(config, dataset):
 
     DATASET may be specified by name or ID, but ID is preferred.
     """
-    datasets = config.trainml.run(config.trainml.client.datasets.list())
-
-    found = search_by_id_name(dataset, datasets)
+    found = config.trainml.find(dataset, config.trainml.client.datasets)
     if None is found:
         raise click.UsageError("Cannot find specified dataset.")
 
@@ -53,9 +51,7 @@ def connect(config, dataset, attach):
 
     DATASET may be specified by name or ID, but ID is preferred.
     """
-    datasets = config.trainml.run(config.trainml.client.datasets.list())
-
-    found = search_by_id_name(dataset, datasets)
+    found = config.trainml.find(dataset, config.trainml.client.datasets)
     if None is found:
         raise click.UsageError("Cannot find specified dataset.")
 
@@ -119,8 +115,23 @@ def create(config, attach, connect, source, name, path):
 
 
 @dataset.command()
+@click.option(
+    "--format",
+    "-f",
+    type=click.Choice(["text", "csv", "parquet"], case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Choose output format.",
+)
+@click.option(
+    "--field",
+    "-F",
+    "fields",
+    multiple=True,
+    help="Column for csv or parquet output, e.g. resources.gpu_count.",
+)
 @pass_config
-def list(config):
+def list(config, format, fields):
     """List datasets."""
     data = [
         ["ID", "STATUS", "NAME", "SIZE"],
@@ -129,6 +140,10 @@ def list(config):
 
     datasets = config.trainml.run(config.trainml.client.datasets.list())
 
+    if format in ["csv", "parquet"]:
+        export_list(config, datasets, format, fields)
+        return
+
     for dset in datasets:
         data.append(
             [
@@ -187,9 +202,7 @@ def remove(config, dataset, force):
 
     DATASET may be specified by name or ID, but ID is preferred.
     """
-    datasets = config.trainml.run(config.trainml.client.datasets.list())
-
-    found = search_by_id_name(dataset, datasets)
+    found = config.trainml.find(dataset, config.trainml.client.datasets)
     if None is found:
         if force:
             config.trainml.run(config.trainml.client.datasets.remove(dataset))
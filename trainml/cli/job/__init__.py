@@ -1,32 +1,109 @@
+import sys
 import asyncio
 import click
 from webbrowser import open as browse
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import (
+    cli,
+    pass_config,
+    export_list,
+    LazyGroup,
+    CommandPackage,
+)
+from trainml.utils.log_sinks import (
+    StdoutSink,
+    RotatingFileSink,
+    JsonlSink,
+    format_json_message,
+)
+
+sys.modules[__name__].__class__ = CommandPackage
 
+INACTIVE_STATUSES = [
+    "finished",
+    "failed",
+    "canceled",
+    "stopped",
+    "archived",
+    "removed",
+    "removing",
+]
 
-@cli.group()
+
+@cli.group(
+    cls=LazyGroup, lazy_subcommands=dict(create="trainml.cli.job.create")
+)
 @pass_config
 def job(config):
     """trainML job commands."""
     pass
 
 
+def _log_sink(config, log_file, log_format):
+    if log_format == "jsonl":
+        if log_file:
+            return JsonlSink(log_file)
+        return StdoutSink(stream=config.stdout, formatter=format_json_message)
+    if log_file:
+        return RotatingFileSink(log_file)
+    return StdoutSink(stream=config.stdout)
+
+
 @job.command()
-@click.argument("job", type=click.STRING)
+@click.option(
+    "--all",
+    "attach_all",
+    is_flag=True,
+    default=False,
+    help="Attach to all active jobs at once.",
+)
+@click.option(
+    "--log-file",
+    type=click.Path(dir_okay=False, writable=True, resolve_path=True),
+    default=None,
+    help="Write logs to a rotating file instead of the output.",
+)
+@click.option(
+    "--log-format",
+    type=click.Choice(["text", "jsonl"], case_sensitive=False),
+    default="text",
+    show_default=True,
+    help="Write logs as text lines or as JSON messages.",
+)
+@click.argument("job", type=click.STRING, required=False)
 @pass_config
-def attach(config, job):
+def attach(config, job, attach_all, log_file, log_format):
     """
     Attach to job and show logs.
 
     JOB may be specified by name or ID, but ID is preferred.
     """
-    jobs = config.trainml.run(config.trainml.client.jobs.list())
+    if attach_all:
+        jobs = config.trainml.run(config.trainml.client.jobs.list())
+        active = [
+            found
+            for found in jobs
+            if found.type != "notebook"
+            and found.status not in INACTIVE_STATUSES
+        ]
+        if not active:
+            raise click.UsageError("No active jobs to attach to.")
+        with _log_sink(config, log_file, log_format) as sink:
+            config.trainml.run(
+                *[
+                    found.attach(sink.handler(prefix=found.name))
+                    for found in active
+                ]
+            )
+        return
+    if job is None:
+        raise click.UsageError("Specify a job or use --all.")
 
-    found = search_by_id_name(job, jobs)
+    found = config.trainml.find(job, config.trainml.client.jobs)
     if None is found:
         raise click.UsageError("Cannot find specified job.")
 
-    config.trainml.run(found.attach())
+    with _log_sink(config, log_file, log_format) as sink:
+        config.trainml.run(found.attach(sink))
 
 
 async def _connect_job(job, attach, config):
@@ -134,9 +211,7 @@ def connect(config, job, attach):
 
     JOB may be specified by name or ID, but ID is preferred.
     """
-    jobs = config.trainml.run(config.trainml.client.jobs.list())
-
-    found = search_by_id_name(job, jobs)
+    found = config.trainml.find(job, config.trainml.client.jobs)
     if None is found:
         raise click.UsageError("Cannot find specified job.")
 
@@ -158,9 +233,7 @@ def stop(config, job, wait):
 
     JOB may be specified by name or ID, but ID is preferred.
     """
-    jobs = config.trainml.run(config.trainml.client.jobs.list())
-
-    found = search_by_id_name(job, jobs)
+    found = config.trainml.find(job, config.trainml.client.jobs)
     if None is found:
         raise click.UsageError("Cannot find specified job.")
 
@@ -187,9 +260,7 @@ def start(config, job, connect):
 
     JOB may be specified by name or ID, but ID is preferred.
     """
-    jobs = config.trainml.run(config.trainml.client.jobs.list())
-
-    found = search_by_id_name(job, jobs)
+    found = config.trainml.find(job, config.trainml.client.jobs)
     if None is found:
         raise click.UsageError("Cannot find specified job.")
 
@@ -218,9 +289,7 @@ def remove(config, job, force):
 
     JOB may be specified by name or ID, but ID is preferred.
     """
-    jobs = config.trainml.run(config.trainml.client.jobs.list())
-
-    found = search_by_id_name(job, jobs)
+    found = config.trainml.find(job, config.trainml.client.jobs)
     if None is found:
         if force:
             config.trainml.run(config.trainml.client.jobs.remove(job))
@@ -234,16 +303,29 @@ def remove(config, job, force):
 @click.option(
     "--format",
     "-f",
-    type=click.Choice(["text", "json"], case_sensitive=False),
+    type=click.Choice(
+        ["text", "json", "csv", "parquet"], case_sensitive=False
+    ),
     default="text",
     show_default=True,
     help="Choose output format.",
 )
+@click.option(
+    "--field",
+    "-F",
+    "fields",
+    multiple=True,
+    help="Column for csv or parquet output, e.g. resources.gpu_count.",
+)
 @pass_config
-def list(config, format):
+def list(config, format, fields):
     """List trainML jobs."""
     jobs = config.trainml.run(config.trainml.client.jobs.list())
 
+    if format in ["csv", "parquet"]:
+        export_list(config, jobs, format, fields)
+        return
+
     if format == "text":
         data = [
             ["ID", "NAME", "STATUS", "TYPE"],
@@ -262,6 +344,3 @@ def list(config, format):
         for job in jobs:
             output.append(job.dict)
         click.echo(output, file=config.stdout)
-
-
-from trainml.cli.job.create import create
@@ -18,6 +18,26 @@ def validate_cpu_count(ctx, param, value):
     return count
 
 
+def _select_gpu_types(config, gpu_type, max_price, budget, profile):
+    if "auto" not in gpu_type:
+        return gpu_type, max_price
+    if len(gpu_type) > 1:
+        raise click.UsageError(
+            "--gpu-type auto cannot be combined with others."
+        )
+    selection = config.trainml.run(
+        config.trainml.client.gpu_types.select(
+            budget=max_price if budget is None else budget, profile=profile
+        )
+    )
+    click.echo(
+        f"Selected GPU types {', '.join(selection['gpu_types'])} "
+        f"up to {selection['max_price']:.2f} credits per hour.",
+        file=config.stdout,
+    )
+    return selection["gpu_types"], selection["max_price"]
+
+
 @job.group()
 @pass_config
 def create(config):
@@ -73,6 +93,7 @@ def create(config):
             "a6000",
             "a4000",
             "cpu",
+            "auto",
         ],
         case_sensitive=False,
     ),
@@ -96,10 +117,15 @@ def create(config):
     show_default=True,
     help="Max Price (per GPU).",
 )
+@click.option(
+    "--budget",
+    type=click.FLOAT,
+    help="Max credits per GPU hour for --gpu-type auto, defaults to --max-price.",
+)
 @click.option(
     "--data-dir",
     type=click.Path(exists=True, file_okay=False, resolve_path=True),
-    help="Local file path to copy as the input data",
+    help="Local file path to upload as the input data while the job starts",
 )
 @click.option(
     "--dataset",
@@ -219,6 +245,7 @@ def notebook(
     gpu_type,
     cpu_count,
     max_price,
+    budget,
     data_dir,
     dataset,
     public_dataset,
@@ -256,6 +283,10 @@ def notebook(
         for item in checkpoint
     ] + [dict(id=item, public=True) for item in public_checkpoint]
 
+    gpu_type, max_price = _select_gpu_types(
+        config, gpu_type, max_price, budget, "training"
+    )
+
     options = dict(
         max_price=max_price,
         data=dict(datasets=datasets),
@@ -296,20 +327,10 @@ def notebook(
             )
 
     if data_dir:
-        click.echo("Creating Dataset..", file=config.stdout)
-        new_dataset = config.trainml.run(
-            config.trainml.client.datasets.create(
-                f"Job - {name}", "local", data_dir
-            )
-        )
-        if attach:
-            config.trainml.run(new_dataset.attach(), new_dataset.connect())
-        else:
-            config.trainml.run(new_dataset.connect())
-            config.trainml.run(new_dataset.wait_for("ready"))
-        options["data"]["datasets"].append(
-            dict(id=new_dataset.id, type="existing")
-        )
+        ## uploaded by connect() once the job is created, so the transfer
+        ## overlaps provisioning instead of delaying job creation
+        options["data"]["input_type"] = "local"
+        options["data"]["input_uri"] = data_dir
 
     if git_uri:
         options["model"]["source_type"] = "git"
@@ -332,7 +353,7 @@ def notebook(
         )
     )
     click.echo("Created Job.", file=config.stdout)
-    if model_dir:
+    if model_dir or data_dir:
         config.trainml.run(job.wait_for("waiting for data/model download"))
         if attach or connect:
             click.echo("Waiting for job to start...", file=config.stdout)
@@ -397,6 +418,7 @@ def notebook(
             "a6000",
             "a4000",
             "cpu",
+            "auto",
         ],
         case_sensitive=False,
     ),
@@ -420,10 +442,15 @@ def notebook(
     show_default=True,
     help="Max Price (per GPU).",
 )
+@click.option(
+    "--budget",
+    type=click.FLOAT,
+    help="Max credits per GPU hour for --gpu-type auto, defaults to --max-price.",
+)
 @click.option(
     "--data-dir",
     type=click.Path(exists=True, file_okay=False, resolve_path=True),
-    help="Local file path to copy as the input data",
+    help="Local file path to upload as the input data while the job starts",
 )
 @click.option(
     "--dataset",
@@ -567,6 +594,7 @@ def training(
     gpu_type,
     cpu_count,
     max_price,
+    budget,
     data_dir,
     dataset,
     public_dataset,
@@ -609,6 +637,10 @@ def training(
         for item in checkpoint
     ] + [dict(id=item, public=True) for item in public_checkpoint]
 
+    gpu_type, max_price = _select_gpu_types(
+        config, gpu_type, max_price, budget, "training"
+    )
+
     options = dict(
         max_price=max_price,
         data=dict(datasets=datasets),
@@ -663,20 +695,10 @@ def training(
             )
 
     if data_dir:
-        click.echo("Creating Dataset..", file=config.stdout)
-        new_dataset = config.trainml.run(
-            config.trainml.client.datasets.create(
-                f"Job - {name}", "local", data_dir
-            )
-        )
-        if attach:
-            config.trainml.run(new_dataset.attach(), new_dataset.connect())
-        else:
-            config.trainml.run(new_dataset.connect())
-            config.trainml.run(new_dataset.wait_for("ready"))
-        options["data"]["datasets"].append(
-            dict(id=new_dataset.id, type="existing")
-        )
+        ## uploaded by connect() once the job is created, so the transfer
+        ## overlaps provisioning instead of delaying job creation
+        options["data"]["input_type"] = "local"
+        options["data"]["input_uri"] = data_dir
 
     if git_uri:
         options["model"]["source_type"] = "git"
@@ -701,9 +723,9 @@ def training(
     )
     click.echo("Created Job.", file=config.stdout)
 
-    if connect or attach:
+    if connect or attach or data_dir:
         config.trainml.run(job.wait_for("waiting for data/model download"))
-        if connect:
+        if connect or data_dir:
             config.trainml.run(job.connect())
         if attach:
             config.trainml.run(job.attach())
@@ -757,6 +779,7 @@ def training(
             "a6000",
             "a4000",
             "cpu",
+            "auto",
         ],
         case_sensitive=False,
     ),
@@ -780,6 +803,11 @@ def training(
     show_default=True,
     help="Max Price (per GPU).",
 )
+@click.option(
+    "--budget",
+    type=click.FLOAT,
+    help="Max credits per GPU hour for --gpu-type auto, defaults to --max-price.",
+)
 @click.option(
     "--checkpoint",
     type=click.STRING,
@@ -797,6 +825,21 @@ def training(
     type=click.Path(exists=True, file_okay=False, resolve_path=True),
     help="Local file path to copy as the input data",
 )
+@click.option(
+    "--shards",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Split --input-dir into this many jobs of similar input size.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.INT,
+    default=4,
+    show_default=True,
+    help="Number of shards created and uploaded at once.",
+)
 @click.option(
     "--input-type",
     type=click.Choice(
@@ -928,9 +971,12 @@ def inference(
     gpu_type,
     cpu_count,
     max_price,
+    budget,
     checkpoint,
     public_checkpoint,
     input_dir,
+    shards,
+    concurrency,
     input_type,
     input_uri,
     output_dir,
@@ -963,6 +1009,10 @@ def inference(
         for item in checkpoint
     ] + [dict(id=item, public=True) for item in public_checkpoint]
 
+    gpu_type, max_price = _select_gpu_types(
+        config, gpu_type, max_price, budget, "inference"
+    )
+
     options = dict(
         max_price=max_price,
         data=dict(datasets=[]),
@@ -1035,6 +1085,40 @@ def inference(
         options["model"]["source_type"] = "local"
         options["model"]["source_uri"] = model_dir
 
+    if shards > 1:
+        if not input_dir or not output_dir:
+            raise click.UsageError(
+                "--shards requires --input-dir and --output-dir."
+            )
+        click.echo(f"Running {name} in {shards} shards..", file=config.stdout)
+        batch = config.trainml.run(
+            config.trainml.client.jobs.fan_out(
+                name,
+                input_dir,
+                output_dir,
+                shards,
+                concurrency=concurrency,
+                gpu_types=gpu_type,
+                cpu_count=cpu_count,
+                disk_size=disk_size,
+                workers=[command],
+                **options,
+            )
+        )
+        failed = {spec.get("name") for spec, _ in batch.failures}
+        for job in batch:
+            if job.name not in failed:
+                click.echo(f"Finished Job {job.name}", file=config.stdout)
+        for spec, err in batch.failures:
+            click.echo(
+                f"Job {spec.get('name')} failed: {err}", file=config.stderr
+            )
+        if batch.failures:
+            raise click.ClickException(
+                f"{len(batch.failures)} shards did not complete."
+            )
+        return
+
     job = config.trainml.run(
         config.trainml.client.jobs.create(
             name=name,
@@ -1140,6 +1224,7 @@ def from_json(config, attach, connect, file):
             "a6000",
             "a4000",
             "cpu",
+            "auto",
         ],
         case_sensitive=False,
     ),
@@ -1163,6 +1248,11 @@ def from_json(config, attach, connect, file):
     show_default=True,
     help="Max Price (per GPU).",
 )
+@click.option(
+    "--budget",
+    type=click.FLOAT,
+    help="Max credits per GPU hour for --gpu-type auto, defaults to --max-price.",
+)
 @click.option(
     "--checkpoint",
     type=click.STRING,
@@ -1275,6 +1365,7 @@ def endpoint(
     gpu_type,
     cpu_count,
     max_price,
+    budget,
     checkpoint,
     public_checkpoint,
     environment,
@@ -1304,6 +1395,10 @@ def endpoint(
 
     routes = [json.loads(item) for item in route]
 
+    gpu_type, max_price = _select_gpu_types(
+        config, gpu_type, max_price, budget, "inference"
+    )
+
     options = dict(
         max_price=max_price,
         model=dict(checkpoints=checkpoints),
@@ -1385,3 +1480,103 @@ def endpoint(
             click.echo(
                 f"Endpoint is running at:  {job.url}", file=config.stdout
             )
+
+
+def _load_sweep(file):
+    text = file.read()
+    try:
+        return json.loads(text)
+    except ValueError:
+        pass
+    try:
+        import yaml
+    except ImportError:
+        raise click.UsageError(
+            "YAML sweep files require PyYAML, install trainml[sweep] or use JSON."
+        )
+    try:
+        return yaml.safe_load(text)
+    except yaml.YAMLError as err:
+        raise click.UsageError(f"Invalid sweep file: {err}")
+
+
+@create.command()
+@click.option(
+    "--grid",
+    "-g",
+    type=click.File("r"),
+    required=True,
+    help="YAML or JSON file with the job template and its parameter grid.",
+)
+@click.option(
+    "--concurrency",
+    "-c",
+    type=click.INT,
+    default=10,
+    show_default=True,
+    help="Number of jobs submitted at once.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Print the jobs of the sweep without creating them.",
+)
+@pass_config
+def sweep(config, grid, concurrency, dry_run):
+    """
+    Create a job for every combination of parameters.
+
+    The file holds the arguments of the jobs and a grid listing the values
+    of each parameter. {name} placeholders in any string are filled with
+    the parameter values, and {index} with the number of the job.
+
+    \b
+        name: lr-{lr}-bs-{batch_size}
+        type: training
+        gpu_type: rtx3090
+        gpu_count: 1
+        workers:
+          - python train.py --lr {lr} --batch-size {batch_size}
+        environment:
+          type: DEEPLEARNING_PY312
+          env:
+            - key: LEARNING_RATE
+              value: "{lr}"
+        grid:
+          lr: [0.1, 0.01]
+          batch_size: [32, 64]
+    """
+    from trainml.utils.sweep import sweep_specs
+    from trainml.exceptions import SpecificationError
+
+    template = _load_sweep(grid)
+    if not isinstance(template, dict) or not isinstance(
+        template.get("grid"), dict
+    ):
+        raise click.UsageError("The sweep file must define a grid mapping.")
+    grid_values = template.pop("grid")
+    template.setdefault("type", "training")
+    try:
+        specs = sweep_specs(template, grid_values)
+    except SpecificationError as err:
+        raise click.UsageError(err.message)
+
+    if dry_run:
+        click.echo(json.dumps(specs, indent=2), file=config.stdout)
+        return
+
+    batch = config.trainml.run(
+        config.trainml.client.jobs.create_many(specs, concurrency=concurrency)
+    )
+    for job in batch:
+        click.echo(f"Created Job {job.name} ({job.id})", file=config.stdout)
+    for spec, err in batch.failures:
+        click.echo(
+            f"Failed to create Job {spec.get('name')}: {err}",
+            file=config.stderr,
+        )
+    if batch.failures:
+        raise click.ClickException(
+            f"{len(batch.failures)} of {len(specs)} jobs were not created."
+        )
@@ -1,6 +1,6 @@
 import click
 import logging
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 
 
 def pretty_size(num):
@@ -30,9 +30,7 @@ def attach(config, model):
 
     MODEL may be specified by name or ID, but ID is preferred.
     """
-    models = config.trainml.run(config.trainml.client.models.list())
-
-    found = search_by_id_name(model, models)
+    found = config.trainml.find(model, config.trainml.client.models)
     if None is found:
         raise click.UsageError("Cannot find specified model.")
 
@@ -54,9 +52,7 @@ def connect(config, model, attach):
 
     MODEL may be specified by name or ID, but ID is preferred.
     """
-    models = config.trainml.run(config.trainml.client.models.list())
-
-    found = search_by_id_name(model, models)
+    found = config.trainml.find(model, config.trainml.client.models)
     logging.debug(found)
     if None is found:
         raise click.UsageError("Cannot find specified model.")
@@ -162,9 +158,7 @@ def remove(config, model, force):
 
     MODEL may be specified by name or ID, but ID is preferred.
     """
-    models = config.trainml.run(config.trainml.client.models.list())
-
-    found = search_by_id_name(model, models)
+    found = config.trainml.find(model, config.trainml.client.models)
     if None is found:
         if force:
             config.trainml.run(found.client.models.remove(model))
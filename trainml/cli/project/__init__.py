@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 
 
 @cli.group()
@@ -68,9 +68,7 @@ def remove(config, project):
 
     PROJECT may be specified by name or ID, but ID is preferred.
     """
-    projects = config.trainml.run(config.trainml.client.projects.list())
-
-    found = search_by_id_name(project, projects)
+    found = config.trainml.find(project, config.trainml.client.projects)
     if None is found:
         raise click.UsageError("Cannot find specified project.")
 
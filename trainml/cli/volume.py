@@ -1,5 +1,5 @@
 import click
-from trainml.cli import cli, pass_config, search_by_id_name
+from trainml.cli import cli, pass_config
 
 
 def pretty_size(num):
@@ -29,9 +29,7 @@ def attach(config, volume):
 
     VOLUME may be specified by name or ID, but ID is preferred.
     """
-    volumes = config.trainml.run(config.trainml.client.volumes.list())
-
-    found = search_by_id_name(volume, volumes)
+    found = config.trainml.find(volume, config.trainml.client.volumes)
     if None is found:
         raise click.UsageError("Cannot find specified volume.")
 
@@ -53,9 +51,7 @@ def connect(config, volume, attach):
 
     VOLUME may be specified by name or ID, but ID is preferred.
     """
-    volumes = config.trainml.run(config.trainml.client.volumes.list())
-
-    found = search_by_id_name(volume, volumes)
+    found = config.trainml.find(volume, config.trainml.client.volumes)
     if None is found:
         raise click.UsageError("Cannot find specified volume.")
 
@@ -164,9 +160,7 @@ def remove(config, volume, force):
 
     VOLUME may be specified by name or ID, but ID is preferred.
     """
-    volumes = config.trainml.run(config.trainml.client.volumes.list())
-
-    found = search_by_id_name(volume, volumes)
+    found = config.trainml.find(volume, config.trainml.client.volumes)
     if None is found:
         if force:
             config.trainml.run(found.client.volumes.remove(volume))
@@ -8,6 +8,7 @@ from trainml.exceptions import (
     SpecificationError,
     TrainMLException,
 )
+from trainml.utils.entity import Entity
 
 
 class DataConnectors(object):
@@ -20,7 +21,7 @@ class DataConnectors(object):
             "GET",
             kwargs,
         )
-        return DataConnector(self.trainml, **resp)
+        return DataConnector._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -29,7 +30,8 @@ class DataConnectors(object):
             kwargs,
         )
         data_connectors = [
-            DataConnector(self.trainml, **data_connector) for data_connector in resp
+            DataConnector._from_payload(self.trainml, data_connector)
+            for data_connector in resp
         ]
         return data_connectors
 
@@ -54,7 +56,7 @@ class DataConnectors(object):
             None,
             payload,
         )
-        data_connector = DataConnector(self.trainml, **resp)
+        data_connector = DataConnector._from_payload(self.trainml, resp)
         logging.info(f"Created Data Connector {name} with id {data_connector.id}")
         return data_connector
 
@@ -66,15 +68,20 @@ class DataConnectors(object):
         )
 
 
-class DataConnector:
+class DataConnector(Entity):
+    _payload = "_data_connector"
+    _fields = dict(
+        _id=lambda d: d.get("connector_id"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _type=lambda d: d.get("type"),
+        _name=lambda d: d.get("name"),
+    )
+    __slots__ = ("_data_connector", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._data_connector = kwargs
-        self._id = self._data_connector.get("connector_id")
-        self._provider_uuid = self._data_connector.get("provider_uuid")
-        self._region_uuid = self._data_connector.get("region_uuid")
-        self._type = self._data_connector.get("type")
-        self._name = self._data_connector.get("name")
 
     @property
     def id(self) -> str:
@@ -116,5 +123,5 @@ class DataConnector:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/data_connector/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
@@ -8,6 +8,7 @@ from trainml.exceptions import (
     SpecificationError,
     TrainMLException,
 )
+from trainml.utils.entity import Entity
 
 
 class Datastores(object):
@@ -20,7 +21,7 @@ class Datastores(object):
             "GET",
             kwargs,
         )
-        return Datastore(self.trainml, **resp)
+        return Datastore._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -28,7 +29,9 @@ class Datastores(object):
             "GET",
             kwargs,
         )
-        datastores = [Datastore(self.trainml, **datastore) for datastore in resp]
+        datastores = [
+            Datastore._from_payload(self.trainml, datastore) for datastore in resp
+        ]
         return datastores
 
     async def create(
@@ -52,7 +55,7 @@ class Datastores(object):
             None,
             payload,
         )
-        datastore = Datastore(self.trainml, **resp)
+        datastore = Datastore._from_payload(self.trainml, resp)
         logging.info(f"Created Datastore {name} with id {datastore.id}")
         return datastore
 
@@ -64,15 +67,20 @@ class Datastores(object):
         )
 
 
-class Datastore:
+class Datastore(Entity):
+    _payload = "_datastore"
+    _fields = dict(
+        _id=lambda d: d.get("store_id"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _type=lambda d: d.get("type"),
+        _name=lambda d: d.get("name"),
+    )
+    __slots__ = ("_datastore", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._datastore = kwargs
-        self._id = self._datastore.get("store_id")
-        self._provider_uuid = self._datastore.get("provider_uuid")
-        self._region_uuid = self._datastore.get("region_uuid")
-        self._type = self._datastore.get("type")
-        self._name = self._datastore.get("name")
 
     @property
     def id(self) -> str:
@@ -114,5 +122,5 @@ class Datastore:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/datastore/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
@@ -1,6 +1,8 @@
 import json
 import logging
 
+from trainml.utils.entity import Entity
+
 
 class DeviceConfigs(object):
     def __init__(self, trainml):
@@ -12,7 +14,7 @@ class DeviceConfigs(object):
             "GET",
             kwargs,
         )
-        return DeviceConfig(self.trainml, **resp)
+        return DeviceConfig._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -21,7 +23,7 @@ class DeviceConfigs(object):
             kwargs,
         )
         device_configs = [
-            DeviceConfig(self.trainml, **device_config)
+            DeviceConfig._from_payload(self.trainml, device_config)
             for device_config in resp
         ]
         return device_configs
@@ -54,7 +56,7 @@ class DeviceConfigs(object):
             None,
             payload,
         )
-        device_config = DeviceConfig(self.trainml, **resp)
+        device_config = DeviceConfig._from_payload(self.trainml, resp)
         logging.info(
             f"Created Device Config {name} with id {device_config.id}"
         )
@@ -68,14 +70,19 @@ class DeviceConfigs(object):
         )
 
 
-class DeviceConfig:
+class DeviceConfig(Entity):
+    _payload = "_device_config"
+    _fields = dict(
+        _id=lambda d: d.get("config_id"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _name=lambda d: d.get("name"),
+    )
+    __slots__ = ("_device_config", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._device_config = kwargs
-        self._id = self._device_config.get("config_id")
-        self._provider_uuid = self._device_config.get("provider_uuid")
-        self._region_uuid = self._device_config.get("region_uuid")
-        self._name = self._device_config.get("name")
 
     @property
     def id(self) -> str:
@@ -113,5 +120,5 @@ class DeviceConfig:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/device/config/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
@@ -1,6 +1,8 @@
 import json
 import logging
 
+from trainml.utils.entity import Entity
+
 
 class Devices(object):
     def __init__(self, trainml):
@@ -12,7 +14,7 @@ class Devices(object):
             "GET",
             kwargs,
         )
-        return Device(self.trainml, **resp)
+        return Device._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -20,7 +22,9 @@ class Devices(object):
             "GET",
             kwargs,
         )
-        devices = [Device(self.trainml, **device) for device in resp]
+        devices = [
+            Device._from_payload(self.trainml, device) for device in resp
+        ]
         return devices
 
     async def create(
@@ -48,7 +52,7 @@ class Devices(object):
             None,
             payload,
         )
-        device = Device(self.trainml, **resp)
+        device = Device._from_payload(self.trainml, resp)
         logging.info(f"Created Device {friendly_name} with id {device.id}")
         return device
 
@@ -60,23 +64,28 @@ class Devices(object):
         )
 
 
-class Device:
+class Device(Entity):
+    _payload = "_device"
+    _fields = dict(
+        _id=lambda d: d.get("device_id"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _name=lambda d: d.get("friendly_name"),
+        _hostname=lambda d: d.get("hostname"),
+        _status=lambda d: d.get("status"),
+        _online=lambda d: d.get("online"),
+        _maintenance_mode=lambda d: d.get("maintenance_mode"),
+        _device_config_id=lambda d: d.get("device_config_id"),
+        _job_status=lambda d: d.get("job_status"),
+        _job_last_deployed=lambda d: d.get("job_last_deployed"),
+        _job_config_id=lambda d: d.get("job_config_id"),
+        _job_config_revision=lambda d: d.get("job_config_revision"),
+    )
+    __slots__ = ("_device", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._device = kwargs
-        self._id = self._device.get("device_id")
-        self._provider_uuid = self._device.get("provider_uuid")
-        self._region_uuid = self._device.get("region_uuid")
-        self._name = self._device.get("friendly_name")
-        self._hostname = self._device.get("hostname")
-        self._status = self._device.get("status")
-        self._online = self._device.get("online")
-        self._maintenance_mode = self._device.get("maintenance_mode")
-        self._device_config_id = self._device.get("device_config_id")
-        self._job_status = self._device.get("job_status")
-        self._job_last_deployed = self._device.get("job_last_deployed")
-        self._job_config_id = self._device.get("job_config_id")
-        self._job_config_revision = self._device.get("job_config_revision")
 
     @property
     def id(self) -> str:
@@ -150,7 +159,7 @@ class Device:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/device/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def toggle_maintenance(self):
@@ -174,7 +183,7 @@ class Device:
             None,
             dict(device_config_id=device_config_id),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def deploy_endpoint(self):
@@ -1,9 +1,10 @@
 import json
 import logging
-import asyncio
-import math
 
 from trainml.exceptions import ApiError, SpecificationError, TrainMLException, NodeError
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils.poller import PollSchedule
+from trainml.utils.entity import Entity
 
 
 class Nodes(object):
@@ -16,7 +17,7 @@ class Nodes(object):
             "GET",
             kwargs,
         )
-        return Node(self.trainml, **resp)
+        return Node._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -24,7 +25,7 @@ class Nodes(object):
             "GET",
             kwargs,
         )
-        nodes = [Node(self.trainml, **node) for node in resp]
+        nodes = [Node._from_payload(self.trainml, node) for node in resp]
         return nodes
 
     async def create(
@@ -54,7 +55,7 @@ class Nodes(object):
             None,
             payload,
         )
-        node = Node(self.trainml, **resp)
+        node = Node._from_payload(self.trainml, resp)
         logging.info(f"Created Node {friendly_name} with id {node.id}")
         return node
 
@@ -66,20 +67,25 @@ class Nodes(object):
         )
 
 
-class Node:
+class Node(Entity):
+    _payload = "_node"
+    _fields = dict(
+        _id=lambda d: d.get("rig_uuid"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _type=lambda d: d.get("type"),
+        _service=lambda d: d.get("service"),
+        _name=lambda d: d.get("friendly_name"),
+        _hostname=lambda d: d.get("hostname"),
+        _status=lambda d: d.get("status"),
+        _online=lambda d: d.get("online"),
+        _maintenance_mode=lambda d: d.get("maintenance_mode"),
+    )
+    __slots__ = ("_node", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._node = kwargs
-        self._id = self._node.get("rig_uuid")
-        self._provider_uuid = self._node.get("provider_uuid")
-        self._region_uuid = self._node.get("region_uuid")
-        self._type = self._node.get("type")
-        self._service = self._node.get("service")
-        self._name = self._node.get("friendly_name")
-        self._hostname = self._node.get("hostname")
-        self._status = self._node.get("status")
-        self._online = self._node.get("online")
-        self._maintenance_mode = self._node.get("maintenance_mode")
 
     @property
     def id(self) -> str:
@@ -141,7 +147,7 @@ class Node:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/node/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def toggle_maintenance(self):
@@ -174,25 +180,21 @@ class Node:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN)
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status in ["errored", "failed"]:
-                raise NodeError(self.status, self)
-            if self.status == status:
-                return self
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+        schedule = PollSchedule(timeout, status)
+        async with StatusWatch(self.trainml, "node", None, self.id) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self.status in ["errored", "failed"]:
+                    raise NodeError(self.status, self)
+                if self.status == status:
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
@@ -1,7 +1,5 @@
 import json
 import logging
-import asyncio
-import math
 from datetime import datetime
 
 from trainml.exceptions import (
@@ -10,6 +8,9 @@ from trainml.exceptions import (
     TrainMLException,
     ProviderError,
 )
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils.poller import PollSchedule
+from trainml.utils.entity import Entity
 
 
 class Providers(object):
@@ -18,11 +19,13 @@ class Providers(object):
 
     async def get(self, id):
         resp = await self.trainml._query(f"/provider/{id}", "GET")
-        return Provider(self.trainml, **resp)
+        return Provider._from_payload(self.trainml, resp)
 
     async def list(self):
         resp = await self.trainml._query(f"/provider", "GET")
-        providers = [Provider(self.trainml, **provider) for provider in resp]
+        providers = [
+            Provider._from_payload(self.trainml, provider) for provider in resp
+        ]
         return providers
 
     async def enable(self, type, **kwargs):
@@ -30,7 +33,7 @@ class Providers(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Enabling Provider {type}")
         resp = await self.trainml._query("/provider", "POST", None, payload)
-        provider = Provider(self.trainml, **resp)
+        provider = Provider._from_payload(self.trainml, resp)
         logging.info(f"Enabled Provider {type} with id {provider.id}")
 
         return provider
@@ -39,14 +42,19 @@ class Providers(object):
         await self.trainml._query(f"/provider/{id}", "DELETE")
 
 
-class Provider:
+class Provider(Entity):
+    _payload = "_provider"
+    _fields = dict(
+        _id=lambda d: d.get("provider_uuid"),
+        _type=lambda d: d.get("type"),
+        _status=lambda d: d.get("status"),
+        _credits=lambda d: d.get("credits"),
+    )
+    __slots__ = ("_provider", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._provider = kwargs
-        self._id = self._provider.get("provider_uuid")
-        self._type = self._provider.get("type")
-        self._status = self._provider.get("status")
-        self._credits = self._provider.get("credits")
 
     @property
     def id(self) -> str:
@@ -81,7 +89,7 @@ class Provider:
             f"/provider/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def wait_for(self, status, timeout=300):
@@ -100,25 +108,21 @@ class Provider:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN)
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status in ["errored", "failed"]:
-                raise ProviderError(self.status, self)
-            if self.status == status:
-                return self
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+        schedule = PollSchedule(timeout, status)
+        async with StatusWatch(self.trainml, "provider", None, self.id) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self.status in ["errored", "failed"]:
+                    raise ProviderError(self.status, self)
+                if self.status == status:
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
@@ -1,7 +1,5 @@
 import json
 import logging
-import asyncio
-import math
 
 from trainml.exceptions import (
     ApiError,
@@ -9,6 +7,9 @@ from trainml.exceptions import (
     TrainMLException,
     RegionError,
 )
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils.poller import PollSchedule
+from trainml.utils.entity import Entity
 
 
 class Regions(object):
@@ -19,13 +20,15 @@ class Regions(object):
         resp = await self.trainml._query(
             f"/provider/{provider_uuid}/region/{id}", "GET", kwargs
         )
-        return Region(self.trainml, **resp)
+        return Region._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, **kwargs):
         resp = await self.trainml._query(
             f"/provider/{provider_uuid}/region", "GET", kwargs
         )
-        regions = [Region(self.trainml, **region) for region in resp]
+        regions = [
+            Region._from_payload(self.trainml, region) for region in resp
+        ]
         return regions
 
     async def create(self, provider_uuid, name, public, storage, **kwargs):
@@ -35,7 +38,7 @@ class Regions(object):
         resp = await self.trainml._query(
             f"/provider/{provider_uuid}/region", "POST", None, payload
         )
-        region = Region(self.trainml, **resp)
+        region = Region._from_payload(self.trainml, resp)
         logging.info(f"Created Region {name} with id {region.id}")
         return region
 
@@ -45,15 +48,20 @@ class Regions(object):
         )
 
 
-class Region:
+class Region(Entity):
+    _payload = "_region"
+    _fields = dict(
+        _id=lambda d: d.get("region_uuid"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _type=lambda d: d.get("provider_type"),
+        _name=lambda d: d.get("name"),
+        _status=lambda d: d.get("status"),
+    )
+    __slots__ = ("_region", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._region = kwargs
-        self._id = self._region.get("region_uuid")
-        self._provider_uuid = self._region.get("provider_uuid")
-        self._type = self._region.get("provider_type")
-        self._name = self._region.get("name")
-        self._status = self._region.get("status")
 
     @property
     def id(self) -> str:
@@ -94,7 +102,7 @@ class Region:
             f"/provider/{self._provider_uuid}/region/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def add_dataset(self, project_uuid, dataset_uuid, **kwargs):
@@ -137,25 +145,21 @@ class Region:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN)
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status in ["errored", "failed"]:
-                raise RegionError(self.status, self)
-            if self.status == status:
-                return self
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+        schedule = PollSchedule(timeout, status)
+        async with StatusWatch(self.trainml, "region", None, self.id) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self.status in ["errored", "failed"]:
+                    raise RegionError(self.status, self)
+                if self.status == status:
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
@@ -1,7 +1,5 @@
 import json
 import logging
-import asyncio
-import math
 from enum import Enum
 
 from trainml.exceptions import (
@@ -9,6 +7,9 @@ from trainml.exceptions import (
     SpecificationError,
     TrainMLException,
 )
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils.poller import PollSchedule
+from trainml.utils.entity import Entity
 
 class SERVICE_CERT_ALGORITHMS(str, Enum):
     RSA_2048 = 'rsa2048'
@@ -29,7 +30,7 @@ class Services(object):
             "GET",
             kwargs,
         )
-        return Service(self.trainml, **resp)
+        return Service._from_payload(self.trainml, resp)
 
     async def list(self, provider_uuid, region_uuid, **kwargs):
         resp = await self.trainml._query(
@@ -37,7 +38,9 @@ class Services(object):
             "GET",
             kwargs,
         )
-        services = [Service(self.trainml, **service) for service in resp]
+        services = [
+            Service._from_payload(self.trainml, service) for service in resp
+        ]
         return services
 
     async def create(
@@ -63,7 +66,7 @@ class Services(object):
             None,
             payload,
         )
-        service = Service(self.trainml, **resp)
+        service = Service._from_payload(self.trainml, resp)
         logging.info(f"Created Service {name} with id {service.id}")
         return service
 
@@ -75,21 +78,24 @@ class Services(object):
         )
 
 
-class Service:
-    def __init__(self, trainml,  **kwargs):
+class Service(Entity):
+    _payload = "_service"
+    _fields = dict(
+        _id=lambda d: d.get("service_id"),
+        _provider_uuid=lambda d: d.get("provider_uuid"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+        _public=lambda d: d.get("public"),
+        _name=lambda d: d.get("name"),
+        _type=lambda d: d.get("type"),
+        _hostname=lambda d: d.get("custom_hostname") or d.get("hostname"),
+        _status=lambda d: d.get("status"),
+        _port=lambda d: d.get("port"),
+    )
+    __slots__ = ("_service", *_fields)
+
+    def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._service = kwargs
-        self._id = self._service.get("service_id")
-        self._provider_uuid = self._service.get("provider_uuid")
-        self._region_uuid = self._service.get("region_uuid")
-        self._public = self._service.get("public")
-        self._name = self._service.get("name")
-        self._type = self._service.get("type")
-        self._hostname = self._service.get("custom_hostname") or self._service.get(
-            "hostname"
-        )
-        self._status = self._service.get("status")
-        self._port = self._service.get("port")
 
     @property
     def id(self) -> str:
@@ -147,7 +153,7 @@ class Service:
             f"/provider/{self._provider_uuid}/region/{self._region_uuid}/service/{self._id}",
             "GET",
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def wait_for(self, status, timeout=300):
@@ -166,24 +172,20 @@ class Service:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN)
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status == status:
-                return self
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+        schedule = PollSchedule(timeout, status)
+        async with StatusWatch(self.trainml, "service", None, self.id) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self.status == status:
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
     
@@ -194,7 +196,7 @@ class Service:
             kwargs,
             dict(algorithm=algorithm)
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
     
     async def sign_client_certificate(self, csr, **kwargs):
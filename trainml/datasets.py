@@ -1,8 +1,5 @@
 import json
 import logging
-import math
-import asyncio
-from datetime import datetime
 
 from .exceptions import (
     DatasetError,
@@ -11,6 +8,10 @@ from .exceptions import (
     TrainMLException,
 )
 from trainml.utils.transfer import upload, download
+from trainml.utils.log_sinks import format_log_message
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils import poller
+from trainml.utils.entity import Entity
 
 
 class Datasets(object):
@@ -19,16 +20,20 @@ class Datasets(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/dataset/{id}", "GET", kwargs)
-        return Dataset(self.trainml, **resp)
+        return Dataset._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/dataset", "GET", kwargs)
-        datasets = [Dataset(self.trainml, **dataset) for dataset in resp]
+        datasets = [
+            Dataset._from_payload(self.trainml, dataset) for dataset in resp
+        ]
         return datasets
 
     async def list_public(self, **kwargs):
         resp = await self.trainml._query(f"/dataset/public", "GET", kwargs)
-        datasets = [Dataset(self.trainml, **dataset) for dataset in resp]
+        datasets = [
+            Dataset._from_payload(self.trainml, dataset) for dataset in resp
+        ]
         return datasets
 
     async def create(
@@ -53,7 +58,7 @@ class Datasets(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Creating Dataset {name}")
         resp = await self.trainml._query("/dataset", "POST", None, payload)
-        dataset = Dataset(self.trainml, **resp)
+        dataset = Dataset._from_payload(self.trainml, resp)
         logging.info(f"Created Dataset {name} with id {dataset.id}")
 
         return dataset
@@ -63,21 +68,31 @@ class Datasets(object):
             f"/dataset/{id}", "DELETE", dict(**kwargs, force=True)
         )
 
+    async def wait_all(self, datasets, status, timeout=300):
+        return await poller.wait_all(self, datasets, status, timeout)
+
+    async def wait_any(self, datasets, status, timeout=300):
+        return await poller.wait_any(self, datasets, status, timeout)
+
+    def as_completed(self, datasets, status, timeout=300):
+        return poller.as_completed(self, datasets, status, timeout)
+
+
+class Dataset(Entity):
+    _payload = "_dataset"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("dataset_uuid")),
+        _status=lambda d: d.get("status"),
+        _name=lambda d: d.get("name"),
+        _size=lambda d: d.get("size") or d.get("used_size"),
+        _billed_size=lambda d: d.get("billed_size") or d.get("size"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+    )
+    __slots__ = ("_dataset", *_fields)
 
-class Dataset:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._dataset = kwargs
-        self._id = self._dataset.get("id", self._dataset.get("dataset_uuid"))
-        self._status = self._dataset.get("status")
-        self._name = self._dataset.get("name")
-        self._size = self._dataset.get("size") or self._dataset.get(
-            "used_size"
-        )
-        self._billed_size = self._dataset.get(
-            "billed_size"
-        ) or self._dataset.get("size")
-        self._project_uuid = self._dataset.get("project_uuid")
 
     @property
     def id(self) -> str:
@@ -178,7 +193,7 @@ class Dataset:
             None,
             dict(name=name),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def export(self, output_type, output_uri, output_options=dict()):
@@ -192,7 +207,7 @@ class Dataset:
                 output_options=output_options,
             ),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     def _get_msg_handler(self, msg_handler):
@@ -201,12 +216,7 @@ class Dataset:
                 if msg_handler:
                     msg_handler(data)
                 else:
-                    timestamp = datetime.fromtimestamp(
-                        int(data.get("time")) / 1000
-                    )
-                    print(
-                        f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: {data.get('msg').rstrip()}"
-                    )
+                    print(format_log_message(data))
 
         return handler
 
@@ -226,12 +236,10 @@ class Dataset:
             "GET",
             dict(project_uuid=self._project_uuid),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
-    async def wait_for(self, status, timeout=300):
-        if self.status == status:
-            return
+    def _validate_wait_for(self, status, timeout):
         valid_statuses = ["downloading", "ready", "exporting", "archived"]
         if not status in valid_statuses:
             raise SpecificationError(
@@ -245,27 +253,33 @@ class Dataset:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(
-            min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
-        )
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status == status:
-                return self
-            elif self.status == "failed":
-                raise DatasetError(self.status, self)
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+    def _reached_status(self, status):
+        if self.status == status:
+            return True
+        elif self.status == "failed":
+            raise DatasetError(self.status, self)
+        return False
+
+    async def wait_for(self, status, timeout=300):
+        if self.status == status:
+            return
+        self._validate_wait_for(status, timeout)
+
+        schedule = poller.PollSchedule(timeout, status)
+        async with StatusWatch(
+            self.trainml, "dataset", self._project_uuid, self.id
+        ) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self._reached_status(status):
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
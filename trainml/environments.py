@@ -1,5 +1,7 @@
 import json
 
+from trainml.utils.entity import Entity
+
 
 class Environments(object):
     def __init__(self, trainml):
@@ -8,21 +10,27 @@ class Environments(object):
     async def list(self):
         resp = await self.trainml._query(f"/job/environments", "GET")
         environments = [
-            Environment(self.trainml, **environment) for environment in resp
+            Environment._from_payload(self.trainml, environment)
+            for environment in resp
         ]
         return environments
 
 
-class Environment:
+class Environment(Entity):
+    _payload = "_environment"
+    _fields = dict(
+        _id=lambda d: d.get("id"),
+        _name=lambda d: d.get("name"),
+        _py_version=lambda d: d.get("py_version"),
+        _framework=lambda d: d.get("framework"),
+        _version=lambda d: d.get("version"),
+        _cuda_version=lambda d: d.get("cuda_version"),
+    )
+    __slots__ = ("_environment", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._environment = kwargs
-        self._id = self._environment.get("id")
-        self._name = self._environment.get("name")
-        self._py_version = self._environment.get("py_version")
-        self._framework = self._environment.get("framework")
-        self._version = self._environment.get("version")
-        self._cuda_version = self._environment.get("cuda_version")
 
     @property
     def id(self) -> str:
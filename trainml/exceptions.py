@@ -198,3 +198,20 @@ class RegionError(TrainMLException):
 
     def __str__(self):
         return "RegionError({self.status}, {self.message})".format(self=self)
+
+
+class PipelineError(TrainMLException):
+    def __init__(self, stage, message, *args):
+        super().__init__(message, *args)
+        self._stage = stage
+        self._message = message
+
+    @property
+    def stage(self) -> str:
+        return self._stage
+
+    def __repr__(self):
+        return "PipelineError({self.stage}, {self.message})".format(self=self)
+
+    def __str__(self):
+        return "PipelineError({self.stage}, {self.message})".format(self=self)
@@ -1,10 +1,67 @@
 import json
-from trainml.exceptions import TrainMLException
+import time
+from trainml.exceptions import TrainMLException, SpecificationError
+from trainml.utils.entity import Entity
+
+GPU_TYPES_TTL = 5 * 60  ## seconds a snapshot of the project's types is used
+
+## Expected throughput of each type relative to an rtx3090, by workload.
+## training follows mixed precision compute, inference memory bandwidth.
+PROFILES = dict(
+    training=dict(
+        gtx1060=0.1,
+        gtx1080ti=0.3,
+        rtx2060s=0.35,
+        rtx2070s=0.4,
+        rtx2080ti=0.55,
+        rtx3090=1.0,
+        p100=0.3,
+        t4=0.3,
+        v100=0.8,
+        a100=2.0,
+        a100xl=2.2,
+        a6000=1.3,
+        a4000=0.6,
+    ),
+    inference=dict(
+        gtx1060=0.2,
+        gtx1080ti=0.5,
+        rtx2060s=0.5,
+        rtx2070s=0.5,
+        rtx2080ti=0.65,
+        rtx3090=1.0,
+        p100=0.8,
+        t4=0.35,
+        v100=0.95,
+        a100=1.65,
+        a100xl=2.2,
+        a6000=0.8,
+        a4000=0.5,
+    ),
+)
+
+## GPU memory of each type in GB
+GPU_MEMORY = dict(
+    gtx1060=6,
+    gtx1080ti=11,
+    rtx2060s=8,
+    rtx2070s=8,
+    rtx2080ti=11,
+    rtx3090=24,
+    p100=16,
+    t4=16,
+    v100=16,
+    a100=40,
+    a100xl=80,
+    a6000=48,
+    a4000=16,
+)
 
 
 class GpuTypes(object):
     def __init__(self, trainml):
         self.trainml = trainml
+        self._snapshots = dict()
 
     async def list(self):
         if not self.trainml.project:
@@ -14,24 +71,103 @@ class GpuTypes(object):
         resp = await self.trainml._query(
             f"/project/{self.trainml.project}/gputypes", "GET"
         )
-        gpu_types = [GpuType(self.trainml, **gpu_type) for gpu_type in resp]
+        gpu_types = [
+            GpuType._from_payload(self.trainml, gpu_type) for gpu_type in resp
+        ]
+        self._snapshots[self.trainml.project] = (time.monotonic(), gpu_types)
+        return gpu_types
+
+    async def snapshot(self, max_age=GPU_TYPES_TTL):
+        """
+        The project's GPU types as last listed, listing them again when
+        the last list is older than max_age seconds.
+        """
+        fetched, gpu_types = self._snapshots.get(
+            self.trainml.project, (None, None)
+        )
+        if fetched is None or time.monotonic() - fetched > max_age:
+            gpu_types = await self.list()
         return gpu_types
 
+    async def select(
+        self,
+        budget=None,
+        profile="training",
+        min_memory=None,
+        max_types=3,
+        max_age=GPU_TYPES_TTL,
+    ):
+        """
+        Choose the GPU types giving the most throughput per credit.
+
+        Types are ranked by their expected throughput for the workload
+        profile, a key of PROFILES or a dict of relative throughputs by
+        abbreviation, divided by their minimum credits per hour. Types
+        whose minimum price exceeds budget, with less than min_memory GB,
+        or without a known throughput are skipped. The best max_types are
+        returned as Jobs.create() arguments, with max_price the highest
+        price any of them can cost, capped at budget, so the job can start
+        on whichever is available first.
+        """
+        if isinstance(profile, str):
+            if profile not in PROFILES:
+                raise SpecificationError(
+                    "profile",
+                    f"Unknown workload profile {profile}, choose from {', '.join(PROFILES)}",
+                )
+            profile = PROFILES[profile]
+        candidates = []
+        for gpu_type in await self.snapshot(max_age):
+            throughput = profile.get(gpu_type.abbrv)
+            price = gpu_type.credits_per_hour_min
+            if not throughput or price is None:
+                continue
+            if budget is not None and price > budget:
+                continue
+            if min_memory and GPU_MEMORY.get(gpu_type.abbrv, 0) < min_memory:
+                continue
+            ## free types rank first, cheapest throughput after them
+            cost = price / throughput
+            candidates.append((cost, -throughput, gpu_type))
+        if not candidates:
+            raise SpecificationError(
+                "gpu_types",
+                "No GPU type matches the budget and workload requirements.",
+            )
+        candidates.sort(key=lambda candidate: candidate[:2])
+        selected = [gpu_type for _, _, gpu_type in candidates[:max_types]]
+        max_price = max(
+            gpu_type.credits_per_hour_max or gpu_type.credits_per_hour_min
+            for gpu_type in selected
+        )
+        if budget is not None:
+            max_price = min(max_price, budget)
+        return dict(
+            gpu_types=[gpu_type.abbrv for gpu_type in selected],
+            max_price=max_price,
+        )
+
     async def refresh_gpu_types(self):
         await self.trainml._query(
             f"/project/{self.trainml.project}/gputypes", "PATCH"
         )
+        self._snapshots.pop(self.trainml.project, None)
+
 
+class GpuType(Entity):
+    _payload = "_gpu_type"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("gpu_type_id")),
+        _name=lambda d: d.get("name"),
+        _abbrv=lambda d: d.get("abbrv"),
+        _credits_per_hour_min=lambda d: d.get("price").get("min"),
+        _credits_per_hour_max=lambda d: d.get("price").get("max"),
+    )
+    __slots__ = ("_gpu_type", *_fields)
 
-class GpuType:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._gpu_type = kwargs
-        self._id = self._gpu_type.get("id", self._gpu_type.get("gpu_type_id"))
-        self._name = self._gpu_type.get("name")
-        self._abbrv = self._gpu_type.get("abbrv")
-        self._credits_per_hour_min = self._gpu_type.get("price").get("min")
-        self._credits_per_hour_max = self._gpu_type.get("price").get("max")
 
     @property
     def id(self) -> str:
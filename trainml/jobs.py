@@ -1,10 +1,11 @@
+import os
 import json
+import uuid
 import asyncio
-import math
+import tempfile
 import logging
 import warnings
 import webbrowser
-from datetime import datetime
 
 from trainml.exceptions import (
     ApiError,
@@ -13,6 +14,16 @@ from trainml.exceptions import (
     TrainMLException,
 )
 from trainml.utils.transfer import upload, download
+from trainml.utils.log_sinks import format_log_message
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils import poller, shard
+from trainml.utils.entity import Entity
+from trainml.utils.lazy import lazy_import
+
+aiohttp = lazy_import("aiohttp")
+
+## API statuses worth retrying, the request may not have been processed
+TRANSIENT_STATUSES = [429, 500, 502, 503, 504]
 
 
 class Jobs(object):
@@ -21,11 +32,11 @@ class Jobs(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/job/{id}", "GET", kwargs)
-        return Job(self.trainml, **resp)
+        return Job._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/job", "GET", kwargs)
-        jobs = [Job(self.trainml, **job) for job in resp]
+        jobs = [Job._from_payload(self.trainml, job) for job in resp]
         return jobs
 
     async def create(
@@ -92,37 +103,232 @@ class Jobs(object):
         ):
             payload["worker_commands"] = []
         logging.info(f"Creating Job {name}")
-        job = await self.create_json(payload)
+        job = await self.create_json(
+            payload, idempotency_key=kwargs.get("idempotency_key")
+        )
         logging.info(f"Created Job {name} with id {job.id}")
         return job
 
-    async def create_json(self, payload):
+    async def create_json(self, payload, idempotency_key=None):
         logging.debug(f"Job payload: {payload}")
-        resp = await self.trainml._query("/job", "POST", None, payload)
-        job = Job(self.trainml, **resp)
+        if idempotency_key:
+            resp = await self.trainml._query(
+                "/job",
+                "POST",
+                None,
+                payload,
+                headers={"Idempotency-Key": idempotency_key},
+            )
+        else:
+            resp = await self.trainml._query("/job", "POST", None, payload)
+        job = Job._from_payload(self.trainml, resp)
         return job
 
+    async def _create_once(self, spec, key, max_retries):
+        for attempt in range(max_retries + 1):
+            try:
+                return await self.create(**spec, idempotency_key=key)
+            except (ApiError, aiohttp.ClientError, asyncio.TimeoutError) as e:
+                transient = not isinstance(e, ApiError) or (
+                    e.status in TRANSIENT_STATUSES
+                )
+                if not transient or attempt == max_retries:
+                    raise e
+                logging.debug(f"Retrying Job {spec.get('name')}: {e}")
+            await asyncio.sleep(2**attempt)
+
+    async def create_many(self, specs, concurrency=10, max_retries=3):
+        """
+        Create one job per spec, a dict of create() arguments.
+
+        At most concurrency jobs are submitted at once. Each spec is sent
+        with its own idempotency key, and transient failures are retried up
+        to max_retries times with the same key, so the server returns the
+        job that a failed request still created instead of making a
+        duplicate. Job names must be unique within the specs.
+
+        Returns a JobBatch of the created jobs. Specs that still fail do not
+        stop the others and are listed in the batch's failures.
+        """
+        specs = [dict(spec) for spec in specs]
+        names = [spec.get("name") for spec in specs]
+        if len(set(names)) != len(names):
+            raise SpecificationError(
+                "name", "Job names must be unique within a batch."
+            )
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def submit(spec):
+            async with semaphore:
+                return await self._create_once(
+                    spec, uuid.uuid4().hex, max_retries
+                )
+
+        results = await asyncio.gather(
+            *[submit(spec) for spec in specs], return_exceptions=True
+        )
+        batch = JobBatch(self)
+        for spec, result in zip(specs, results):
+            if isinstance(result, Exception):
+                logging.warning(f"Failed to create Job {spec.get('name')}")
+                batch.failures.append((spec, result))
+            else:
+                batch.jobs.append(result)
+        return batch
+
+    async def fan_out(
+        self,
+        name,
+        input_dir,
+        output_dir,
+        shards,
+        concurrency=4,
+        work_dir=None,
+        timeout=24 * 60 * 60,
+        **kwargs,
+    ):
+        """
+        Run one inference job per shard of a local input directory.
+
+        The files of input_dir are split into at most shards parts of
+        similar total size, and a job named {name}-shard-{index} is created
+        for each with the other create() arguments. The shards are uploaded
+        in parallel, at most concurrency at once, and each job's output is
+        downloaded and moved into output_dir as soon as it finishes.
+
+        Shards are staged under work_dir, a temporary directory by default.
+        Returns a JobBatch whose failures list the shards that could not be
+        created, uploaded or downloaded.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=work_dir) as staging:
+            shard_dirs = shard.shard_directory(input_dir, shards, staging)
+            specs = []
+            for index, shard_dir in enumerate(shard_dirs):
+                data = dict(kwargs.get("data") or dict())
+                data.update(
+                    input_type="local",
+                    input_uri=shard_dir,
+                    output_type="local",
+                    output_uri=os.path.join(output_dir, f"shard-{index}"),
+                )
+                specs.append(
+                    dict(
+                        kwargs,
+                        name=f"{name}-shard-{index}",
+                        type=kwargs.get("type", "inference"),
+                        data=data,
+                    )
+                )
+            specs = {spec["name"]: spec for spec in specs}
+            batch = await self.create_many(
+                specs.values(), concurrency=concurrency
+            )
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def run(job):
+                ## upload while holding a slot, then wait and download freely
+                async with semaphore:
+                    await job.connect()
+                await job.wait_for("running", timeout)
+                await job.connect()
+                shard_output = specs[job.name]["data"]["output_uri"]
+                if os.path.isdir(shard_output):
+                    shard.merge_outputs(shard_output, output_dir)
+                return job
+
+            results = await asyncio.gather(
+                *[run(job) for job in batch.jobs], return_exceptions=True
+            )
+        for job, result in zip(batch.jobs, results):
+            if isinstance(result, Exception):
+                logging.warning(f"Shard Job {job.name} failed: {result!r}")
+                batch.failures.append((specs[job.name], result))
+        return batch
+
     async def remove(self, id, **kwargs):
         await self.trainml._query(
             f"/job/{id}", "DELETE", dict(**kwargs, force=True)
         )
 
+    async def wait_all(self, jobs, status, timeout=300):
+        return await poller.wait_all(self, jobs, status, timeout)
+
+    async def wait_any(self, jobs, status, timeout=300):
+        return await poller.wait_any(self, jobs, status, timeout)
+
+    def as_completed(self, jobs, status, timeout=300):
+        return poller.as_completed(self, jobs, status, timeout)
+
+
+class JobBatch(object):
+    """
+    The jobs created together by Jobs.create_many().
+
+    Iterating the batch yields the created jobs. failures lists a
+    (spec, exception) pair for each spec that could not be created.
+    """
+
+    def __init__(self, collection, jobs=None):
+        self.collection = collection
+        self.jobs = list(jobs or [])
+        self.failures = []
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __iter__(self):
+        return iter(self.jobs)
+
+    async def _each(self, action, concurrency):
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(job):
+            async with semaphore:
+                return await action(job)
+
+        results = await asyncio.gather(
+            *[run(job) for job in self.jobs], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+    async def wait_all(self, status, timeout=300):
+        return await self.collection.wait_all(self.jobs, status, timeout)
+
+    async def stop(self, concurrency=10):
+        """Stop every job, at most concurrency at once."""
+        return await self._each(lambda job: job.stop(), concurrency)
+
+    async def remove(self, force=False, concurrency=10):
+        """Remove every job, at most concurrency at once."""
+        await self._each(lambda job: job.remove(force=force), concurrency)
+
+
+class Job(Entity):
+    _payload = "_job"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("job_uuid")),
+        _name=lambda d: d.get("name"),
+        _status=lambda d: d.get("status"),
+        _type=lambda d: d.get("type"),
+        _workers=lambda d: d.get("workers"),
+        _credits=lambda d: d.get("credits"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+    )
+    __slots__ = ("_job", *_fields)
+    _watched = ("status", "workers", "credits")
+    _hidden = ("nb_token",)
 
-class Job:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._job = kwargs
-        self._id = self._job.get("id", self._job.get("job_uuid"))
-        self._name = self._job.get("name")
-        self._status = self._job.get("status")
-        self._type = self._job.get("type")
-        self._workers = self._job.get("workers")
-        self._credits = self._job.get("credits")
-        self._project_uuid = self._job.get("project_uuid")
 
     @property
     def dict(self) -> dict:
-        return {k: v for k, v in self._job.items() if k not in ["nb_token"]}
+        return {k: v for k, v in self._job.items() if k not in self._hidden}
 
     @property
     def id(self) -> str:
@@ -259,7 +465,7 @@ class Job:
             dict(project_uuid=self._project_uuid),
             dict(command="start"),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def stop(self):
@@ -269,7 +475,7 @@ class Job:
             dict(project_uuid=self._project_uuid),
             dict(command="stop"),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def update(self, data):
@@ -284,7 +490,7 @@ class Job:
             dict(project_uuid=self._project_uuid),
             data,
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def get_worker_log_url(self, job_worker_uuid):
@@ -459,127 +665,104 @@ class Job:
                     f"Job data missing output_uri for local output download.",
                 )
 
-            # Track which workers we've already started downloading
-            downloading_workers = set()
-            download_tasks = []
-
-            # Poll until all workers are finished
-            while True:
-                # Refresh job to get latest worker statuses
-                await self.refresh()
+            await self._download_worker_outputs(output_uri)
 
-                # Get fresh workers list
-                workers = self._job.get("workers", [])
-                if not workers:
-                    raise SpecificationError(
-                        "status",
-                        f"Job has no workers.",
-                    )
-
-                # Check if job is in a terminal state AND all workers are finished
-                # Allow "finished" status if workers are still uploading
-                all_workers_finished = all(
-                    worker.get("status") in ["finished", "removed"]
-                    for worker in workers
-                )
-                if self.status in ["canceled", "failed"]:
-                    break
-                if self.status == "finished" and all_workers_finished:
-                    break
-
-                # Check all workers for uploading status
-                for worker in workers:
-                    worker_id = worker.get("job_worker_uuid") or worker.get(
-                        "id"
-                    )
-                    worker_status = worker.get("status")
-
-                    # Start download for any worker that enters uploading status
-                    # This handles both new connections and reconnections where some workers are already uploading
-                    if (
-                        worker_status == "uploading"
-                        and worker_id not in downloading_workers
-                    ):
-                        output_auth_token = worker.get("output_auth_token")
-                        output_hostname = worker.get("output_hostname")
-
-                        if not output_auth_token or not output_hostname:
-                            logging.warning(
-                                f"Worker {worker_id} in uploading status missing output_auth_token or output_hostname, skipping."
-                            )
-                            # Mark as downloading to avoid retrying
-                            downloading_workers.add(worker_id)
-                            continue
-
-                        downloading_workers.add(worker_id)
-                        # Create and start download task (runs in parallel)
-                        logging.info(
-                            f"Starting download for worker {worker_id} from {output_hostname} to {output_uri}"
+    def _start_worker_download(self, worker, output_uri):
+        worker_id = worker.get("job_worker_uuid") or worker.get("id")
+        output_auth_token = worker.get("output_auth_token")
+        output_hostname = worker.get("output_hostname")
+        if not output_auth_token or not output_hostname:
+            logging.warning(
+                f"Worker {worker_id} in uploading status missing output_auth_token or output_hostname, skipping."
+            )
+            return None
+        logging.info(
+            f"Starting download for worker {worker_id} from {output_hostname} to {output_uri}"
+        )
+        task = asyncio.create_task(
+            download(output_hostname, output_auth_token, output_uri)
+        )
+        logging.debug(
+            f"Download task created for worker {worker_id}, task: {task}"
+        )
+        return task
+
+    async def _download_worker_outputs(self, output_uri):
+        ## worker downloads run as tasks owned by this call, the loop wakes on
+        ## job status events and on any download finishing, so failures are
+        ## raised as soon as they happen. Only the first uploading worker
+        ## changes the job's status, the others are found by polling, so
+        ## polls stay POLL_INTERVAL_MIN apart while downloads are running
+        downloading_workers = set()
+        download_tasks = set()
+        schedule = poller.PollSchedule(status="uploading")
+        try:
+            async with StatusWatch(
+                self.trainml, "job", self._project_uuid, self.id
+            ) as watch:
+                while True:
+                    await self.refresh()
+                    workers = self._job.get("workers", [])
+                    if not workers:
+                        raise SpecificationError(
+                            "status",
+                            f"Job has no workers.",
                         )
-                        try:
-                            download_task = asyncio.create_task(
-                                download(
-                                    output_hostname,
-                                    output_auth_token,
-                                    output_uri,
-                                )
-                            )
-                            download_tasks.append(download_task)
-                            logging.debug(
-                                f"Download task created for worker {worker_id}, task: {download_task}"
-                            )
-                        except Exception as e:
-                            logging.error(
-                                f"Failed to create download task for worker {worker_id}: {e}",
-                                exc_info=True,
+                    if self.status in ["canceled", "failed"]:
+                        break
+
+                    for worker in workers:
+                        worker_id = worker.get(
+                            "job_worker_uuid"
+                        ) or worker.get("id")
+                        if (
+                            worker.get("status") == "uploading"
+                            and worker_id not in downloading_workers
+                        ):
+                            downloading_workers.add(worker_id)
+                            task = self._start_worker_download(
+                                worker, output_uri
                             )
-                            raise
+                            if task is not None:
+                                download_tasks.add(task)
 
-                # Check if any download tasks have completed or failed
-                if download_tasks:
-                    completed_tasks = [
-                        task for task in download_tasks if task.done()
-                    ]
-                    for task in completed_tasks:
+                    if all(
+                        worker.get("status") in ["finished", "removed"]
+                        for worker in workers
+                    ):
+                        break
+
+                    interval = schedule.next_interval()
+                    if download_tasks:
+                        interval = min(interval, poller.POLL_INTERVAL_MIN)
+                    sleep = asyncio.ensure_future(watch.sleep(interval))
+                    try:
+                        done, _ = await asyncio.wait(
+                            [sleep, *download_tasks],
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                    finally:
+                        sleep.cancel()
+                    for task in done & download_tasks:
+                        download_tasks.discard(task)
                         try:
-                            await task  # This will raise if the task failed
-                            logging.info(
-                                f"Download task completed successfully"
-                            )
+                            task.result()
                         except Exception as e:
                             logging.error(
                                 f"Download task failed: {e}", exc_info=True
                             )
                             raise
-                    # Remove completed tasks
-                    download_tasks = [
-                        task for task in download_tasks if not task.done()
-                    ]
-
-                # Check if all workers are finished
-                all_finished = all(
-                    worker.get("status") in ["finished", "removed"]
-                    for worker in workers
-                )
-
-                if all_finished:
-                    break
-
-                # If we have active download tasks, wait a bit for them to make progress
-                # but don't wait the full 30 seconds - check more frequently
-                if download_tasks:
-                    await asyncio.sleep(5)
-                else:
-                    # Wait 30 seconds before next poll if no downloads in progress
-                    await asyncio.sleep(30)
+                        logging.info(f"Download task completed successfully")
 
-            # Wait for all download tasks to complete
             if download_tasks:
                 logging.info(
                     f"Waiting for {len(download_tasks)} download task(s) to complete"
                 )
                 await asyncio.gather(*download_tasks)
                 logging.info("All downloads completed")
+        finally:
+            for task in download_tasks:
+                task.cancel()
 
     async def remove(self, force=False):
         await self.trainml._query(
@@ -592,7 +775,7 @@ class Job:
         resp = await self.trainml._query(
             f"/job/{self.id}", "GET", dict(project_uuid=self._project_uuid)
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     def _get_msg_handler(self, msg_handler):
@@ -605,20 +788,11 @@ class Job:
         def handler(data):
             if data.get("type") == "subscription":
                 data["worker_number"] = worker_numbers.get(data.get("stream"))
+                data["worker_count"] = len(self._workers)
                 if msg_handler:
                     msg_handler(data)
                 else:
-                    timestamp = datetime.fromtimestamp(
-                        int(data.get("time")) / 1000
-                    )
-                    if len(self._workers) > 1:
-                        print(
-                            f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: Worker {data.get('worker_number')} - {data.get('msg').rstrip()}"
-                        )
-                    else:
-                        print(
-                            f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: {data.get('msg').rstrip()}"
-                        )
+                    print(format_log_message(data))
 
         return handler
 
@@ -671,13 +845,7 @@ class Job:
         logging.debug(f"copy result: {job}")
         return job
 
-    async def wait_for(self, status, timeout=300):
-        if self.status == status or (
-            self.type == "training"
-            and status == "finished"
-            and self.status == "stopped"
-        ):
-            return
+    def _validate_wait_for(self, status, timeout):
         valid_statuses = [
             "waiting for data/model download",
             "waiting for resources",
@@ -704,49 +872,60 @@ class Job:
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
 
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(
-            min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
-        )
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if (
-                self.status == status
-                or (
-                    status
-                    == "waiting for resources"  ## this status could be very short and the polling could miss it
-                    and self.status not in ["new", "waiting for resources"]
-                )
-                or (
-                    status
-                    == "waiting for data/model download"  ## this status could be very short and the polling could miss it
-                    and self.status
-                    not in [
-                        "new",
-                        "waiting for resources",
-                        "waiting for data/model download",
-                    ]
-                )
-                or (
-                    status
-                    == "running"  ## this status could be too short for polling could miss it
-                    and self.status in ["uploading", "finished"]
-                )
-            ):
-                return self
-            elif self.status == "failed":
-                raise JobError(self.status, self)
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+    def _reached_status(self, status):
+        if (
+            self.status == status
+            or (
+                status
+                == "waiting for resources"  ## this status could be very short and the polling could miss it
+                and self.status not in ["new", "waiting for resources"]
+            )
+            or (
+                status
+                == "waiting for data/model download"  ## this status could be very short and the polling could miss it
+                and self.status
+                not in [
+                    "new",
+                    "waiting for resources",
+                    "waiting for data/model download",
+                ]
+            )
+            or (
+                status
+                == "running"  ## this status could be too short for polling could miss it
+                and self.status in ["uploading", "finished"]
+            )
+            or (
+                status == "finished"  ## training jobs that stop are done
+                and self.type == "training"
+                and self.status == "stopped"
+            )
+        ):
+            return True
+        elif self.status == "failed":
+            raise JobError(self.status, self)
+        return False
+
+    async def wait_for(self, status, timeout=300):
+        if self._reached_status(status):
+            return
+        self._validate_wait_for(status, timeout)
+
+        schedule = poller.PollSchedule(timeout, status)
+        async with StatusWatch(
+            self.trainml, "job", self._project_uuid, self.id
+        ) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self._reached_status(status):
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
@@ -1,8 +1,5 @@
 import json
 import logging
-import math
-import asyncio
-from datetime import datetime
 
 from .exceptions import (
     ModelError,
@@ -11,6 +8,10 @@ from .exceptions import (
     TrainMLException,
 )
 from trainml.utils.transfer import upload, download
+from trainml.utils.log_sinks import format_log_message
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils import poller
+from trainml.utils.entity import Entity
 
 
 class Models(object):
@@ -19,11 +20,11 @@ class Models(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/model/{id}", "GET", kwargs)
-        return Model(self.trainml, **resp)
+        return Model._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/model", "GET", kwargs)
-        models = [Model(self.trainml, **model) for model in resp]
+        models = [Model._from_payload(self.trainml, model) for model in resp]
         return models
 
     async def create(
@@ -48,7 +49,7 @@ class Models(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Creating Model {name}")
         resp = await self.trainml._query("/model", "POST", None, payload)
-        model = Model(self.trainml, **resp)
+        model = Model._from_payload(self.trainml, resp)
         logging.info(f"Created Model {name} with id {model.id}")
 
         return model
@@ -58,19 +59,31 @@ class Models(object):
             f"/model/{id}", "DELETE", dict(**kwargs, force=True)
         )
 
+    async def wait_all(self, models, status, timeout=300):
+        return await poller.wait_all(self, models, status, timeout)
+
+    async def wait_any(self, models, status, timeout=300):
+        return await poller.wait_any(self, models, status, timeout)
+
+    def as_completed(self, models, status, timeout=300):
+        return poller.as_completed(self, models, status, timeout)
+
+
+class Model(Entity):
+    _payload = "_model"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("model_uuid")),
+        _status=lambda d: d.get("status"),
+        _name=lambda d: d.get("name"),
+        _size=lambda d: d.get("size") or d.get("used_size"),
+        _billed_size=lambda d: d.get("billed_size") or d.get("size"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+    )
+    __slots__ = ("_model", *_fields)
 
-class Model:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._model = kwargs
-        self._id = self._model.get("id", self._model.get("model_uuid"))
-        self._status = self._model.get("status")
-        self._name = self._model.get("name")
-        self._size = self._model.get("size") or self._model.get("used_size")
-        self._billed_size = self._model.get("billed_size") or self._model.get(
-            "size"
-        )
-        self._project_uuid = self._model.get("project_uuid")
 
     @property
     def id(self) -> str:
@@ -171,7 +184,7 @@ class Model:
             None,
             dict(name=name),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def export(self, output_type, output_uri, output_options=dict()):
@@ -185,7 +198,7 @@ class Model:
                 output_options=output_options,
             ),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     def _get_msg_handler(self, msg_handler):
@@ -194,12 +207,7 @@ class Model:
                 if msg_handler:
                     msg_handler(data)
                 else:
-                    timestamp = datetime.fromtimestamp(
-                        int(data.get("time")) / 1000
-                    )
-                    print(
-                        f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: {data.get('msg').rstrip()}"
-                    )
+                    print(format_log_message(data))
 
         return handler
 
@@ -219,13 +227,11 @@ class Model:
             "GET",
             dict(project_uuid=self._project_uuid),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
-    async def wait_for(self, status, timeout=300):
-        if self.status == status:
-            return
-        valid_statuses = ["downloading", "ready","exporting", "archived"]
+    def _validate_wait_for(self, status, timeout):
+        valid_statuses = ["downloading", "ready", "exporting", "archived"]
         if not status in valid_statuses:
             raise SpecificationError(
                 "status",
@@ -237,27 +243,33 @@ class Model:
                 "timeout",
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(
-            min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
-        )
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status == status:
-                return self
-            elif self.status == "failed":
-                raise ModelError(self.status, self)
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+
+    def _reached_status(self, status):
+        if self.status == status:
+            return True
+        elif self.status == "failed":
+            raise ModelError(self.status, self)
+        return False
+
+    async def wait_for(self, status, timeout=300):
+        if self.status == status:
+            return
+        self._validate_wait_for(status, timeout)
+        schedule = poller.PollSchedule(timeout, status)
+        async with StatusWatch(
+            self.trainml, "model", self._project_uuid, self.id
+        ) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self._reached_status(status):
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")
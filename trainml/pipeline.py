@@ -0,0 +1,167 @@
+"""Dependency-driven pipelines of SDK calls, resumable across runs."""
+
+import os
+import json
+import asyncio
+import logging
+
+from trainml.exceptions import PipelineError, SpecificationError
+
+
+class Stage(object):
+    def __init__(self, name, fn, depends):
+        self.name = name
+        self.fn = fn
+        self.depends = list(depends)
+
+
+class Pipeline(object):
+    """
+    Runs stages, async functions of the client and the outputs of the
+    stages they depend on, as soon as those outputs are ready.
+
+        pipeline = Pipeline(trainml, state_file="pipeline.json")
+
+        @pipeline.stage()
+        async def dataset(trainml):
+            dataset = await trainml.datasets.create(...)
+            await dataset.wait_for("ready")
+            return dataset.id
+
+        @pipeline.stage(depends=["dataset"])
+        async def training(trainml, dataset):
+            ...
+
+        outputs = await pipeline.run()
+
+    Stages without a path between them run concurrently on one loop. With
+    a state_file, the output of every completed stage is saved, so a
+    re-run skips them and resumes from the first incomplete stages. Stage
+    outputs must therefore be JSON serializable, e.g. entity IDs.
+    """
+
+    def __init__(self, trainml, state_file=None):
+        self.trainml = trainml
+        self.state_file = state_file
+        self.stages = dict()
+
+    def add(self, name, fn, depends=()):
+        if name in self.stages:
+            raise SpecificationError("name", f"Stage {name} already exists.")
+        self.stages[name] = Stage(name, fn, depends)
+        return fn
+
+    def stage(self, name=None, depends=()):
+        """Decorator adding the function as a stage, named after it."""
+
+        def decorator(fn):
+            return self.add(name or fn.__name__, fn, depends)
+
+        return decorator
+
+    def _order(self):
+        ## depth first topological sort, rejecting unknown and cyclic inputs
+        order, visiting, done = [], set(), set()
+
+        def visit(name, path):
+            if name in done:
+                return
+            if name in visiting:
+                raise SpecificationError(
+                    "depends",
+                    f"Stages depend on each other: {' -> '.join(path)}",
+                )
+            visiting.add(name)
+            for dependency in self.stages[name].depends:
+                if dependency not in self.stages:
+                    raise SpecificationError(
+                        "depends",
+                        f"Stage {name} depends on unknown stage {dependency}",
+                    )
+                visit(dependency, path + [dependency])
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name, [name])
+        return order
+
+    def load(self):
+        """The outputs of the stages completed by previous runs."""
+        if not self.state_file or not os.path.exists(self.state_file):
+            return dict()
+        with open(self.state_file, "r", encoding="utf-8") as file:
+            return json.load(file).get("completed", dict())
+
+    def _save(self, completed):
+        if not self.state_file:
+            return
+        temp_file = f"{self.state_file}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as file:
+            json.dump(dict(completed=completed), file)
+        os.replace(temp_file, self.state_file)
+
+    def reset(self, *names):
+        """
+        Forget the saved outputs of the named stages, all stages when none
+        are named, and of every stage downstream of them.
+        """
+        completed = self.load()
+        if names:
+            stale = set(names)
+            for name in self._order():
+                if stale.intersection(self.stages[name].depends):
+                    stale.add(name)
+            completed = {k: v for k, v in completed.items() if k not in stale}
+        else:
+            completed = dict()
+        self._save(completed)
+
+    async def _run_stage(self, stage, results, completed):
+        if stage.name in completed:
+            logging.info(f"Stage {stage.name} already completed, skipping")
+            return completed[stage.name]
+        inputs = dict()
+        for dependency in stage.depends:
+            inputs[dependency] = await results[dependency]
+        logging.info(f"Starting stage {stage.name}")
+        output = await stage.fn(self.trainml, **inputs)
+        completed[stage.name] = output
+        self._save(completed)
+        logging.info(f"Completed stage {stage.name}")
+        return output
+
+    async def run(self):
+        """
+        Run every stage not completed yet, returning all stage outputs.
+
+        When a stage fails, the stages depending on it do not run, the
+        others run to completion, then PipelineError is raised for the
+        first failed stage. Completed stages stay saved for the next run.
+        """
+        order = self._order()
+        if not order:
+            return dict()
+        completed = self.load()
+        results = dict()
+        for name in order:
+            results[name] = asyncio.ensure_future(
+                self._run_stage(self.stages[name], results, completed)
+            )
+        try:
+            await asyncio.wait(results.values())
+        finally:
+            for task in results.values():
+                task.cancel()
+
+        ## stages run after their inputs, so the first failure in order is
+        ## not just a dependent of another failed stage
+        errors = {name: results[name].exception() for name in order}
+        for name in order:
+            error = errors[name]
+            if error is not None:
+                raise PipelineError(
+                    name, f"Stage {name} failed: {error!r}"
+                ) from error
+        return {name: results[name].result() for name in order}
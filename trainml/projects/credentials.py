@@ -1,7 +1,12 @@
 import json
 import logging
 from datetime import datetime
-from dateutil import parser, tz
+
+from trainml.utils.lazy import lazy_import
+from trainml.utils.entity import Entity
+
+parser = lazy_import("dateutil.parser")
+tz = lazy_import("dateutil.tz")
 
 
 class ProjectCredentials(object):
@@ -14,7 +19,8 @@ class ProjectCredentials(object):
             f"/project/{self.project_id}/credentials", "GET", kwargs
         )
         credentials = [
-            ProjectCredential(self.trainml, **service) for service in resp
+            ProjectCredential._from_payload(self.trainml, service)
+            for service in resp
         ]
         return credentials
 
@@ -28,7 +34,7 @@ class ProjectCredentials(object):
             None,
             payload,
         )
-        credential = ProjectCredential(self.trainml, **resp)
+        credential = ProjectCredential._from_payload(self.trainml, resp)
         logging.info(
             f"Created Project Credential {type} in project {self.project_id}"
         )
@@ -41,14 +47,19 @@ class ProjectCredentials(object):
         )
 
 
-class ProjectCredential:
+class ProjectCredential(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _type=lambda d: d.get("type"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+        _key_id=lambda d: d.get("key_id"),
+        _updated_at=lambda d: d.get("updatedAt"),
+    )
+    __slots__ = ("_entity", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._type = self._entity.get("type")
-        self._project_uuid = self._entity.get("project_uuid")
-        self._key_id = self._entity.get("key_id")
-        self._updated_at = self._entity.get("updatedAt")
 
     @property
     def type(self) -> str:
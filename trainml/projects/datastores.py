@@ -1,6 +1,8 @@
 import json
 import logging
 
+from trainml.utils.entity import Entity
+
 
 class ProjectDatastores(object):
     def __init__(self, trainml, project_id):
@@ -11,28 +13,36 @@ class ProjectDatastores(object):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/datastores/{id}", "GET", kwargs
         )
-        return ProjectDatastore(self.trainml, **resp)
+        return ProjectDatastore._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/datastores", "GET", kwargs
         )
-        datastores = [ProjectDatastore(self.trainml, **datastore) for datastore in resp]
+        datastores = [
+            ProjectDatastore._from_payload(self.trainml, datastore) for datastore in resp
+        ]
         return datastores
 
     async def refresh(self):
         await self.trainml._query(f"/project/{self.project_id}/datastores", "PATCH")
 
 
-class ProjectDatastore:
+class ProjectDatastore(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _id=lambda d: d.get("id"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+        _name=lambda d: d.get("name"),
+        _type=lambda d: d.get("type"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+    )
+    __slots__ = ("_entity", *_fields)
+    _identity = False  ## IDs are only unique within a project
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._id = self._entity.get("id")
-        self._project_uuid = self._entity.get("project_uuid")
-        self._name = self._entity.get("name")
-        self._type = self._entity.get("type")
-        self._region_uuid = self._entity.get("region_uuid")
 
     @property
     def id(self) -> str:
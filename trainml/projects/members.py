@@ -2,6 +2,8 @@ import json
 import logging
 from typing import Literal
 
+from trainml.utils.entity import Entity
+
 class ProjectMembers(object):
     def __init__(self, trainml, project_id):
         self.trainml = trainml
@@ -11,7 +13,9 @@ class ProjectMembers(object):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/access", "GET", kwargs
         )
-        members = [ProjectMember(self.trainml, **member) for member in resp]
+        members = [
+            ProjectMember._from_payload(self.trainml, member) for member in resp
+        ]
         return members
     
     async def add(self, email: str, job: Literal["all", "read"], dataset: Literal["all", "read"], model: Literal["all", "read"], checkpoint: Literal["all", "read"], volume: Literal["all", "read"],  **kwargs):
@@ -26,7 +30,7 @@ class ProjectMembers(object):
         payload = {k: v for k, v in data.items() if v is not None}
         resp = await self.trainml._query(
             f"/project/{self.project_id}/access", "POST",kwargs, payload)
-        member = ProjectMember(self.trainml, **resp)
+        member = ProjectMember._from_payload(self.trainml, resp)
         logging.info(f"Added Project Member {email} to project {self.project_id}")
         return member
 
@@ -37,18 +41,24 @@ class ProjectMembers(object):
         )
 
 
-class ProjectMember:
+class ProjectMember(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _id=lambda d: d.get("email"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+        _owner=lambda d: d.get("owner"),
+        _job=lambda d: d.get("job"),
+        _dataset=lambda d: d.get("dataset"),
+        _model=lambda d: d.get("model"),
+        _checkpoint=lambda d: d.get("checkpoint"),
+        _volume=lambda d: d.get("volume"),
+    )
+    __slots__ = ("_entity", *_fields)
+    _identity = False  ## IDs are only unique within a project
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._id = self._entity.get("email")
-        self._project_uuid = self._entity.get("project_uuid")
-        self._owner = self._entity.get("owner")
-        self._job = self._entity.get("job")
-        self._dataset = self._entity.get("dataset")
-        self._model = self._entity.get("model")
-        self._checkpoint = self._entity.get("checkpoint")
-        self._volume = self._entity.get("volume")
 
     @property
     def id(self) -> str:
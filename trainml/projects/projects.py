@@ -6,6 +6,7 @@ from .services import ProjectServices
 from .credentials import ProjectCredentials
 from .secrets import ProjectSecrets
 from .members import ProjectMembers
+from trainml.utils.entity import Entity
 
 
 class Projects(object):
@@ -14,17 +15,19 @@ class Projects(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/project/{id}", "GET", kwargs)
-        return Project(self.trainml, **resp)
+        return Project._from_payload(self.trainml, resp)
 
     async def get_current(self, **kwargs):
         resp = await self.trainml._query(
             f"/project/{self.trainml.project}", "GET", kwargs
         )
-        return Project(self.trainml, **resp)
+        return Project._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/project", "GET", kwargs)
-        projects = [Project(self.trainml, **project) for project in resp]
+        projects = [
+            Project._from_payload(self.trainml, project) for project in resp
+        ]
         return projects
 
     async def create(self, name, **kwargs):
@@ -35,7 +38,7 @@ class Projects(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Creating Project {name}")
         resp = await self.trainml._query("/project", "POST", None, payload)
-        project = Project(self.trainml, **resp)
+        project = Project._from_payload(self.trainml, resp)
         logging.info(f"Created Project {name} with id {project.id}")
 
         return project
@@ -44,20 +47,36 @@ class Projects(object):
         await self.trainml._query(f"/project/{id}", "DELETE", kwargs)
 
 
-class Project:
+class Project(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _id=lambda d: d.get("id"),
+        _name=lambda d: d.get("name"),
+        _is_owner=lambda d: d.get("owner"),
+        _owner_name=lambda d: d.get("owner_name"),
+    )
+    _collections = dict(
+        datastores=ProjectDatastores,
+        data_connectors=ProjectDataConnectors,
+        services=ProjectServices,
+        credentials=ProjectCredentials,
+        secrets=ProjectSecrets,
+        members=ProjectMembers,
+    )
+    __slots__ = ("_entity", *_fields, *_collections)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._id = self._entity.get("id")
-        self._name = self._entity.get("name")
-        self._is_owner = self._entity.get("owner")
-        self._owner_name = self._entity.get("owner_name")
-        self.datastores = ProjectDatastores(self.trainml, self._id)
-        self.data_connectors = ProjectDataConnectors(self.trainml, self._id)
-        self.services = ProjectServices(self.trainml, self._id)
-        self.credentials = ProjectCredentials(self.trainml, self._id)
-        self.secrets = ProjectSecrets(self.trainml, self._id)
-        self.members = ProjectMembers(self.trainml, self._id)
+
+    def __getattr__(self, name):
+        ## sub-collections are only created when first used
+        collection = type(self)._collections.get(name)
+        if collection is None:
+            return super().__getattr__(name)
+        value = collection(self.trainml, self._id)
+        setattr(self, name, value)
+        return value
 
     @property
     def id(self) -> str:
@@ -1,7 +1,12 @@
 import json
 import logging
 from datetime import datetime
-from dateutil import parser, tz
+
+from trainml.utils.lazy import lazy_import
+from trainml.utils.entity import Entity
+
+parser = lazy_import("dateutil.parser")
+tz = lazy_import("dateutil.tz")
 
 
 class ProjectSecrets(object):
@@ -13,7 +18,10 @@ class ProjectSecrets(object):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/secrets", "GET", kwargs
         )
-        secrets = [ProjectSecret(self.trainml, **service) for service in resp]
+        secrets = [
+            ProjectSecret._from_payload(self.trainml, service)
+            for service in resp
+        ]
         return secrets
 
     async def put(self, name, value, **kwargs):
@@ -23,7 +31,7 @@ class ProjectSecrets(object):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/secrets/{name}", "PUT", None, payload
         )
-        secret = ProjectSecret(self.trainml, **resp)
+        secret = ProjectSecret._from_payload(self.trainml, resp)
         logging.info(
             f"Created Project Secret {name} in project {self.project_id}"
         )
@@ -35,14 +43,19 @@ class ProjectSecrets(object):
         )
 
 
-class ProjectSecret:
+class ProjectSecret(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _name=lambda d: d.get("name"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+        _created_by=lambda d: d.get("created_by"),
+        _updated_at=lambda d: d.get("updatedAt"),
+    )
+    __slots__ = ("_entity", *_fields)
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._name = self._entity.get("name")
-        self._project_uuid = self._entity.get("project_uuid")
-        self._created_by = self._entity.get("created_by")
-        self._updated_at = self._entity.get("updatedAt")
 
     @property
     def name(self) -> str:
@@ -1,6 +1,8 @@
 import json
 import logging
 
+from trainml.utils.entity import Entity
+
 
 class ProjectServices(object):
     def __init__(self, trainml, project_id):
@@ -11,29 +13,37 @@ class ProjectServices(object):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/services/{id}", "GET", kwargs
         )
-        return ProjectService(self.trainml, **resp)
+        return ProjectService._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(
             f"/project/{self.project_id}/services", "GET", kwargs
         )
-        services = [ProjectService(self.trainml, **service) for service in resp]
+        services = [
+            ProjectService._from_payload(self.trainml, service) for service in resp
+        ]
         return services
 
     async def refresh(self):
         await self.trainml._query(f"/project/{self.project_id}/services", "PATCH")
 
 
-class ProjectService:
+class ProjectService(Entity):
+    _payload = "_entity"
+    _fields = dict(
+        _id=lambda d: d.get("id"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+        _name=lambda d: d.get("name"),
+        _hostname=lambda d: d.get("hostname"),
+        _public=lambda d: d.get("public"),
+        _region_uuid=lambda d: d.get("region_uuid"),
+    )
+    __slots__ = ("_entity", *_fields)
+    _identity = False  ## IDs are only unique within a project
+
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._entity = kwargs
-        self._id = self._entity.get("id")
-        self._project_uuid = self._entity.get("project_uuid")
-        self._name = self._entity.get("name")
-        self._hostname = self._entity.get("hostname")
-        self._public = self._entity.get("public")
-        self._region_uuid = self._entity.get("region_uuid")
 
     @property
     def id(self) -> str:
@@ -1,13 +1,18 @@
 import json
 import os
 import asyncio
-import aiohttp
 import logging
 import traceback
 import random
+from contextlib import asynccontextmanager
 from importlib.metadata import version
 
 from trainml.utils.auth import Auth
+from trainml.utils.lazy import lazy_import
+from trainml.utils import codec
+from trainml.utils.log_stream import LogStream
+from trainml.utils.entity import IdentityMap
+from trainml.utils.conditional import ValidatorCache
 from trainml.datasets import Datasets
 from trainml.models import Models
 from trainml.checkpoints import Checkpoints
@@ -19,11 +24,7 @@ from trainml.exceptions import ApiError, TrainMLException
 from trainml.projects import Projects
 from trainml.cloudbender import Cloudbender
 
-
-async def delayed_close(ws):
-    await asyncio.sleep(15)
-    if not ws.closed:
-        await ws.close()
+aiohttp = lazy_import("aiohttp")
 
 
 class TrainML(object):
@@ -40,6 +41,7 @@ class TrainML(object):
             env = json.loads(env_str)
         except OSError:
             env = dict()
+        self.config_dir = CONFIG_DIR
         try:
             with open(
                 f"{CONFIG_DIR}/config.json", "r", encoding="utf-8"
@@ -62,6 +64,7 @@ class TrainML(object):
             region=kwargs.get("region"),
             client_id=kwargs.get("client_id"),
             pool_id=kwargs.get("pool_id"),
+            auto_renew=kwargs.get("auto_renew", True),
         )
         self.active_project = (
             kwargs.get("project")
@@ -89,11 +92,41 @@ class TrainML(object):
             or env.get("ws_url")
             or f"api-ws.{self.domain_suffix}"
         )
+        ## optional aiohttp.ClientSession to reuse across calls, owned and
+        ## closed by the caller (e.g. the CLI runner)
+        self.session = None
+        self._log_stream = None
+        ## with identity_map=True, every response for the same entity updates
+        ## one shared object instead of creating a new copy
+        self.identity_map = (
+            IdentityMap() if kwargs.get("identity_map") else None
+        )
+        self._validators = ValidatorCache()
+        ## with status_events=True, wait_for loops also wake on the status
+        ## events of a websocket subscription, see StatusWatch
+        self.status_events = kwargs.get("status_events", False)
 
     @property
     def project(self) -> str:
         return self.active_project
 
+    @property
+    def log_stream(self) -> LogStream:
+        ## runs the log subscriptions of this client
+        if self._log_stream is None:
+            self._log_stream = LogStream(self)
+        return self._log_stream
+
+    @asynccontextmanager
+    async def _client_session(self):
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession(
+                json_serialize=codec.dumps
+            ) as session:
+                yield session
+
     async def _query(
         self,
         path,
@@ -105,7 +138,7 @@ class TrainML(object):
         backoff_factor=0.5,
     ):
         try:
-            tokens = self.auth.get_tokens()
+            tokens = await self.auth.get_tokens_async()
         except TrainMLException as e:
             raise e
         except Exception:
@@ -152,17 +185,24 @@ class TrainML(object):
         if "Content-Type" not in headers:
             headers["Content-Type"] = "application/json"
         url = f"https://{self.api_url}{path}"
+        conditional = dict()
+        if method == "GET":
+            ## unchanged resources are answered with 304 Not Modified and
+            ## served from the response remembered with their validators
+            validated = self._validators.key(url, params)
+            conditional = self._validators.headers(validated)
+            headers.update(conditional)
 
         logging.debug(
             f"Request - Url: {url}, Method: {method}, Params: {params}, Body: {data}, Headers: {headers}"
         )
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
+                async with self._client_session() as session:
                     async with session.request(
                         method,
                         url,
-                        data=json.dumps(data),
+                        data=codec.encode(data),
                         headers=headers,
                         params=params,
                     ) as resp:
@@ -187,14 +227,20 @@ class TrainML(object):
                                 if content_type == "application/json":
                                     raise ApiError(
                                         resp.status,
-                                        json.loads(what.decode("utf8")),
+                                        codec.loads(what),
                                     )
                                 else:
                                     raise ApiError(
                                         resp.status,
                                         {"message": what.decode("utf8")},
                                     )
-                        results = await resp.json()
+                        if resp.status == 304 and conditional:
+                            return self._validators.get(validated)
+                        results = await resp.json(loads=codec.loads)
+                        if method == "GET":
+                            self._validators.store(
+                                validated, resp.headers, results
+                            )
                         return results
             except aiohttp.ClientResponseError as e:
                 if e.status == 502 and attempt < max_retries - 1:
@@ -209,124 +255,10 @@ class TrainML(object):
         raise TrainMLException("Unexpected API failure")
 
     async def _ws_subscribe(self, entity, project_uuid, id, msg_handler):
-        headers = {
-            "User-Agent": f"trainML-sdk/{self._version}",
-            "Content-Type": "application/json",
-        }
         try:
-            try:
-                tokens = self.auth.get_tokens()
-            except TrainMLException as e:
-                raise e
-            except Exception:
-                raise TrainMLException(
-                    f"Error getting authorization tokens.  Verify configured credentials. Error: {traceback.format_exc()}"
-                )
-            async with aiohttp.ClientSession() as session:
-                done = False
-                async with session.ws_connect(
-                    f"wss://{self.ws_url}?Authorization={tokens.get('id_token')}",
-                    headers=headers,
-                    heartbeat=30,
-                ) as ws:
-                    asyncio.create_task(
-                        ws.send_json(
-                            dict(
-                                action="getlogs",
-                                data=dict(
-                                    type="init",
-                                    entity=entity,
-                                    id=id,
-                                    project_uuid=project_uuid,
-                                ),
-                            )
-                        )
-                    )
-                    asyncio.create_task(
-                        ws.send_json(
-                            dict(
-                                action="subscribe",
-                                data=dict(
-                                    type="logs",
-                                    entity=entity,
-                                    id=id,
-                                    project_uuid=project_uuid,
-                                ),
-                            )
-                        )
-                    )
-                    async for msg in ws:
-                        if msg.type in (
-                            aiohttp.WSMsgType.CLOSED,
-                            aiohttp.WSMsgType.ERROR,
-                            aiohttp.WSMsgType.CLOSE,
-                        ):
-                            logging.debug(
-                                f"Websocket Received Closed Message.  Done? {done}"
-                            )
-                            await ws.close()
-                            break
-                        data = json.loads(msg.data)
-                        if data.get("type") == "end":
-                            done = True
-                            asyncio.create_task(delayed_close(ws))
-                        else:
-                            msg_handler(data)
-                logging.debug(f"Websocket Disconnected.  Done? {done}")
-
-                connection_tries = 0
-                while not done:
-                    tokens = self.auth.get_tokens()
-                    try:
-                        async with session.ws_connect(
-                            f"wss://{self.ws_url}?Authorization={tokens.get('id_token')}",
-                            headers=headers,
-                            heartbeat=30,
-                        ) as ws:
-                            asyncio.create_task(
-                                ws.send_json(
-                                    dict(
-                                        action="subscribe",
-                                        data=dict(
-                                            type="logs",
-                                            entity=entity,
-                                            id=id,
-                                            project_uuid=project_uuid,
-                                        ),
-                                    )
-                                )
-                            )
-                            async for msg in ws:
-                                if msg.type in (
-                                    aiohttp.WSMsgType.CLOSED,
-                                    aiohttp.WSMsgType.ERROR,
-                                    aiohttp.WSMsgType.CLOSE,
-                                ):
-                                    logging.debug(
-                                        f"Websocket Received Closed Message.  Done? {done}"
-                                    )
-                                    await ws.close()
-                                    break
-                                data = json.loads(msg.data)
-                                if data.get("type") == "end":
-                                    done = True
-                                    asyncio.create_task(delayed_close(ws))
-                                else:
-                                    msg_handler(data)
-                        connection_tries = 0
-                        logging.debug(f"Websocket Disconnected.  Done? {done}")
-                    except Exception as e:
-                        connection_tries += 1
-                        logging.debug(
-                            f"Connection error: {traceback.format_exc()}"
-                        )
-                        if connection_tries == 5:
-                            raise ApiError(
-                                500,
-                                {
-                                    "message": f"Connection error: {traceback.format_exc()}"
-                                },
-                            )
+            await self.log_stream.subscribe(
+                entity, project_uuid, id, msg_handler
+            )
         except GeneratorExit:
             # Handle graceful shutdown - GeneratorExit is raised during
             # event loop cleanup. Don't re-raise to avoid "coroutine ignored"
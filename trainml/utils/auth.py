@@ -180,24 +180,40 @@
 #    END OF TERMS AND CONDITIONS
 ##
 ##
+import asyncio
 import base64
-import binascii
 import datetime
 import hashlib
 import hmac
 import re
 import json
-import requests
 import logging
+import threading
 import time
+import traceback
+from contextlib import contextmanager
 from datetime import datetime
 
-import boto3
 import os
 import six
-from jose import jwt
+
+try:
+    import fcntl
+except ImportError:  ## Windows
+    fcntl = None
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
 
 from trainml.exceptions import TrainMLException
+from trainml.utils.lazy import lazy_import
+
+boto3 = lazy_import("boto3")
+botocore = lazy_import("botocore")
+requests = lazy_import("requests")
+jwt = lazy_import("jose.jwt")
 
 # https://github.com/aws/amazon-cognito-identity-js/blob/master/src/AuthenticationHelper.js#L22
 n_hex = (
@@ -222,6 +238,43 @@ n_hex = (
 g_hex = "2"
 info_bits = bytearray("Caldera Derived Key", "utf-8")
 
+TOKEN_EXPIRY_MARGIN = 300  ## seconds before exp that tokens stop being used
+TOKEN_RENEWAL_MARGIN = 300  ## seconds before expiry to renew in background
+AUTH_CACHE_TTL = 24 * 60 * 60  ## auth-config.json by domain suffix
+JWKS_CACHE_TTL = 24 * 60 * 60  ## user pool signing keys by kid
+
+## process wide copy of auth_cache.json, shared by all Auth instances
+_auth_cache = dict(auth_config={}, jwks={})
+
+
+def _read_json_file(path):
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_json_file(path, data):
+    ## write to a private temp file first so readers never see partial data
+    tmp_file = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(tmp_file, path)
+    except OSError:
+        logging.debug("Unable to write %s", path)
+
+
+## SRP group constants, computed once per process
+big_n = int(n_hex, 16)
+g_value = int(g_hex, 16)
+k_value = int(
+    hashlib.sha256(bytes.fromhex("00" + n_hex + "0" + g_hex)).hexdigest(), 16
+)
+
 
 def hash_sha256(buf):
     """AuthenticationHelper.hash"""
@@ -242,8 +295,7 @@ def long_to_hex(long_num):
 
 
 def get_random(nbytes):
-    random_hex = binascii.hexlify(os.urandom(nbytes))
-    return hex_to_long(random_hex)
+    return int.from_bytes(os.urandom(nbytes), "big")
 
 
 def pad_hex(long_int):
@@ -263,6 +315,24 @@ def pad_hex(long_int):
     return hash_str
 
 
+def long_to_padded_bytes(long_int):
+    """
+    Byte equivalent of bytearray.fromhex(pad_hex(long_int)) for integers
+    :param {Long integer} long_int Non-negative number to convert.
+    :return {Bytes} Big endian bytes with a leading zero byte when the high bit is set.
+    """
+    return long_int.to_bytes(long_int.bit_length() // 8 + 1, "big")
+
+
+def mod_pow(base, exponent, modulus):
+    """
+    Modular exponentiation, using gmpy2 when it is installed
+    """
+    if gmpy2 is not None:
+        return int(gmpy2.powmod(base, exponent, modulus))
+    return pow(base, exponent, modulus)
+
+
 def compute_hkdf(ikm, salt):
     """
     Standard hkdf algorithm
@@ -284,8 +354,10 @@ def calculate_u(big_a, big_b):
     :param {Long integer} big_b Server B value.
     :return {Long integer} Computed U value.
     """
-    u_hex_hash = hex_hash(pad_hex(big_a) + pad_hex(big_b))
-    return hex_to_long(u_hex_hash)
+    u_hash = hashlib.sha256(
+        long_to_padded_bytes(big_a) + long_to_padded_bytes(big_b)
+    ).digest()
+    return int.from_bytes(u_hash, "big")
 
 
 class AWSSRP(object):
@@ -318,9 +390,9 @@ class AWSSRP(object):
             if client
             else boto3.client("cognito-idp", region_name=pool_region)
         )
-        self.big_n = hex_to_long(n_hex)
-        self.g = hex_to_long(g_hex)
-        self.k = hex_to_long(hex_hash("00" + n_hex + "0" + g_hex))
+        self.big_n = big_n
+        self.g = g_value
+        self.k = k_value
         self.small_a_value = self.generate_random_small_a()
         self.large_a_value = self.calculate_a()
 
@@ -339,7 +411,7 @@ class AWSSRP(object):
         :param {Long integer} a Randomly generated small A.
         :return {Long integer} Computed large A.
         """
-        big_a = pow(self.g, self.small_a_value, self.big_n)
+        big_a = mod_pow(self.g, self.small_a_value, self.big_n)
         # safety check
         if (big_a % self.big_n) == 0:
             raise ValueError("Safety check for A failed")
@@ -364,17 +436,24 @@ class AWSSRP(object):
             username,
             password,
         )
-        username_password_hash = hash_sha256(username_password.encode("utf-8"))
-
-        x_value = hex_to_long(hex_hash(pad_hex(salt) + username_password_hash))
-        g_mod_pow_xn = pow(self.g, x_value, self.big_n)
-        int_value2 = server_b_value - self.k * g_mod_pow_xn
-        s_value = pow(
+        username_password_hash = hashlib.sha256(
+            username_password.encode("utf-8")
+        ).digest()
+
+        x_value = int.from_bytes(
+            hashlib.sha256(
+                bytes.fromhex(pad_hex(salt)) + username_password_hash
+            ).digest(),
+            "big",
+        )
+        g_mod_pow_xn = mod_pow(self.g, x_value, self.big_n)
+        int_value2 = (server_b_value - self.k * g_mod_pow_xn) % self.big_n
+        s_value = mod_pow(
             int_value2, self.small_a_value + u_value * x_value, self.big_n
         )
         hkdf = compute_hkdf(
-            bytearray.fromhex(pad_hex(s_value)),
-            bytearray.fromhex(pad_hex(long_to_hex(u_value))),
+            long_to_padded_bytes(s_value),
+            long_to_padded_bytes(u_value),
         )
         return hkdf
 
@@ -518,29 +597,31 @@ class Auth(object):
         except (OSError, json.JSONDecodeError):
             env = {}
 
-        auth_defaults = requests.get(
-            "https://app.{}/.well-known/auth-config.json".format(domain_suffix),
-            timeout=30,
-        ).json()
-
+        self.config_dir = config_dir
+        self.domain_suffix = domain_suffix
+        self.auth_cache_file = f"{config_dir}/auth_cache.json"
         self.region = (
             kwargs.get("region")
             or os.environ.get("TRAINML_REGION")
             or env.get("region")
-            or auth_defaults.get("region")
         )
         self.client_id = (
             kwargs.get("client_id")
             or os.environ.get("TRAINML_CLIENT_ID")
             or env.get("client_id")
-            or auth_defaults.get("userPoolSDKClientId")
         )
         self.pool_id = (
             kwargs.get("pool_id")
             or os.environ.get("TRAINML_POOL_ID")
             or env.get("pool_id")
-            or auth_defaults.get("userPoolId")
         )
+        if not self.region or not self.client_id or not self.pool_id:
+            auth_defaults = self.get_auth_config()
+            self.region = self.region or auth_defaults.get("region")
+            self.client_id = self.client_id or auth_defaults.get(
+                "userPoolSDKClientId"
+            )
+            self.pool_id = self.pool_id or auth_defaults.get("userPoolId")
 
         try:
             with open(
@@ -564,10 +645,111 @@ class Auth(object):
         if not self.username or not self.password:
             raise TrainMLException("trainML credentials not found.")
         self.client = boto3.client("cognito-idp", region_name=self.region)
+        self.token_cache_file = f"{config_dir}/tokens.json"
         self.id_token = None
         self.access_token = None
         self.refresh_token = None
         self.expires = 0
+        self.auto_renew = kwargs.get("auto_renew", True)
+        self._lock = threading.RLock()
+        self._renewal_timer = None
+        self._pending_tokens = None
+
+    @property
+    def _token_cache_key(self):
+        return hashlib.sha256(
+            f"{self.pool_id}:{self.client_id}:{self.username}".encode("utf-8")
+        ).hexdigest()
+
+    def _read_token_cache(self):
+        return _read_json_file(self.token_cache_file)
+
+    @contextmanager
+    def _token_cache_lock(self):
+        ## Serializes logins across CLI processes sharing the config dir
+        try:
+            lock_file = open(f"{self.token_cache_file}.lock", "a")
+        except OSError:
+            yield
+            return
+        try:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def load_cached_tokens(self):
+        cached = self._read_token_cache().get(self._token_cache_key)
+        if not cached or not cached.get("id_token"):
+            return False
+        if cached.get("expires", 0) < time.time():
+            ## expired id tokens can still be renewed with the refresh token
+            self.refresh_token = (
+                cached.get("refresh_token") or self.refresh_token
+            )
+            return False
+        self.id_token = cached.get("id_token")
+        self.access_token = cached.get("access_token")
+        self.refresh_token = cached.get("refresh_token")
+        self.expires = cached.get("expires")
+        logging.debug("Using cached tokens expiring: %s", self.expires)
+        self._schedule_renewal()
+        return True
+
+    def save_cached_tokens(self):
+        cache = self._read_token_cache()
+        cache[self._token_cache_key] = dict(
+            id_token=self.id_token,
+            access_token=self.access_token,
+            refresh_token=self.refresh_token,
+            expires=self.expires,
+        )
+        _write_json_file(self.token_cache_file, cache)
+
+    def _read_auth_cache(self, section, key, ttl):
+        cached = _auth_cache[section].get(key)
+        if not cached:
+            cached = _read_json_file(self.auth_cache_file).get(section, {})
+            cached = cached.get(key)
+        if not cached or cached.get("fetched", 0) + ttl < time.time():
+            return None
+        _auth_cache[section][key] = cached
+        return cached.get("value")
+
+    def _write_auth_cache(self, section, values):
+        fetched = time.time()
+        entries = {
+            key: dict(fetched=fetched, value=value)
+            for key, value in values.items()
+        }
+        _auth_cache[section].update(entries)
+        cache = _read_json_file(self.auth_cache_file)
+        cache[section] = {
+            key: entry
+            for key, entry in cache.get(section, {}).items()
+            if entry.get("fetched", 0) + AUTH_CACHE_TTL >= fetched
+        }
+        cache[section].update(entries)
+        _write_json_file(self.auth_cache_file, cache)
+
+    def get_auth_config(self):
+        auth_config = self._read_auth_cache(
+            "auth_config", self.domain_suffix, AUTH_CACHE_TTL
+        )
+        if auth_config is None:
+            auth_config = requests.get(
+                "https://app.{}/.well-known/auth-config.json".format(
+                    self.domain_suffix
+                ),
+                timeout=30,
+            ).json()
+            self._write_auth_cache(
+                "auth_config", {self.domain_suffix: auth_config}
+            )
+        return auth_config
 
     def get_keys(self):
         pool_jwk = requests.get(
@@ -579,9 +761,15 @@ class Auth(object):
         return pool_jwk
 
     def get_key(self, kid):
-        keys = self.get_keys().get("keys")
-        key = list(filter(lambda x: x.get("kid") == kid, keys))
-        return key[0]
+        key = self._read_auth_cache("jwks", kid, JWKS_CACHE_TTL)
+        if key is None:
+            ## unknown kids mean the pool keys rotated, so always refetch
+            keys = self.get_keys().get("keys", [])
+            self._write_auth_cache("jwks", {k.get("kid"): k for k in keys})
+            key = next((k for k in keys if k.get("kid") == kid), None)
+        if key is None:
+            raise TrainMLException(f"Token signing key {kid} not found.")
+        return key
 
     def verify_token(self, token, _id_name):
         kid = jwt.get_unverified_header(token).get("kid")
@@ -599,46 +787,128 @@ class Auth(object):
             return False
         return verified
 
-    def get_new_tokens(self):
-        aws = AWSSRP(
-            username=self.username,
-            password=self.password,
-            pool_id=self.pool_id,
-            client_id=self.client_id,
-            client=self.client,
-        )
-        tokens = aws.authenticate_user()
-        refresh_token = tokens["AuthenticationResult"]["RefreshToken"]
+    def _set_tokens(self, authentication_result):
         id_verify = self.verify_token(
-            tokens["AuthenticationResult"]["IdToken"], "id_token"
+            authentication_result["IdToken"], "id_token"
         )
         logging.debug("ID Token Verification: %s", id_verify)
         if id_verify:
-            id_token = tokens["AuthenticationResult"]["IdToken"]
-            self.id_token = id_token
+            self.id_token = authentication_result["IdToken"]
 
         access_verify = self.verify_token(
-            tokens["AuthenticationResult"]["AccessToken"], "access_token"
+            authentication_result["AccessToken"], "access_token"
         )
         logging.debug("Access Token Verification: %s", access_verify)
         if access_verify:
-            access_token = tokens["AuthenticationResult"]["AccessToken"]
-            self.access_token = access_token
+            self.access_token = authentication_result["AccessToken"]
 
-        self.refresh_token = refresh_token
+        ## REFRESH_TOKEN_AUTH responses do not rotate the refresh token
+        self.refresh_token = (
+            authentication_result.get("RefreshToken") or self.refresh_token
+        )
         self.expires = (
-            id_verify.get("exp") - 300
+            id_verify.get("exp") - TOKEN_EXPIRY_MARGIN
         )  ## prevent just about to expire tokens from being used
+        self._schedule_renewal()
+
+    def get_new_tokens(self):
+        aws = AWSSRP(
+            username=self.username,
+            password=self.password,
+            pool_id=self.pool_id,
+            client_id=self.client_id,
+            client=self.client,
+        )
+        tokens = aws.authenticate_user()
+        self._set_tokens(tokens["AuthenticationResult"])
+
+    def refresh_tokens(self):
+        if not self.refresh_token:
+            return self.get_new_tokens()
+        try:
+            tokens = self.client.initiate_auth(
+                AuthFlow="REFRESH_TOKEN_AUTH",
+                AuthParameters={"REFRESH_TOKEN": self.refresh_token},
+                ClientId=self.client_id,
+            )
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in [
+                "NotAuthorizedException",
+                "InvalidParameterException",
+            ]:
+                raise e
+            logging.debug("Refresh token rejected, re-authenticating")
+            self.refresh_token = None
+            return self.get_new_tokens()
+        self._set_tokens(tokens["AuthenticationResult"])
+
+    def _renew_tokens(self, force=False):
+        with self._token_cache_lock():
+            ## another process may have renewed while we waited
+            if not self.load_cached_tokens() or (
+                force and self.expires < self._renewal_time
+            ):
+                self.refresh_tokens()
+                self.save_cached_tokens()
+
+    @property
+    def _renewal_time(self):
+        return time.time() + TOKEN_RENEWAL_MARGIN
+
+    def _schedule_renewal(self):
+        if not self.auto_renew:
+            return
+        self.cancel_renewal()
+        delay = self.expires - TOKEN_RENEWAL_MARGIN - time.time()
+        if delay <= 0:
+            return
+        self._renewal_timer = threading.Timer(delay, self._background_renew)
+        self._renewal_timer.daemon = True
+        self._renewal_timer.start()
+
+    def _background_renew(self):
+        try:
+            with self._lock:
+                self._renew_tokens(force=True)
+        except Exception:
+            ## get_tokens will retry when the tokens actually expire
+            logging.debug(
+                "Background token renewal failed: %s", traceback.format_exc()
+            )
+
+    def cancel_renewal(self):
+        if self._renewal_timer:
+            self._renewal_timer.cancel()
+            self._renewal_timer = None
 
     def get_tokens(self):
         logging.debug("Token expires: %s", self.expires)
         logging.debug("Token is expired: %s", self.expires < time.time())
-        if not self.id_token:
-            self.get_new_tokens()
-        elif self.expires < time.time():
-            self.get_new_tokens()
+        with self._lock:
+            if (
+                not self.id_token or self.expires < time.time()
+            ) and not self.load_cached_tokens():
+                self._renew_tokens()
         logging.debug("New token expires: %s", self.expires)
-
+        return self._token_dict()
+
+    async def get_tokens_async(self):
+        if self.id_token and self.expires >= time.time():
+            return self._token_dict()
+        ## renewal does blocking file, boto3 and requests I/O, so it runs in
+        ## the default executor and concurrent callers share one renewal
+        loop = asyncio.get_running_loop()
+        if not self._pending_tokens or self._pending_tokens[0] is not loop:
+            future = loop.run_in_executor(None, self.get_tokens)
+            future.add_done_callback(self._clear_pending_tokens)
+            self._pending_tokens = (loop, future)
+        return await asyncio.shield(self._pending_tokens[1])
+
+    def _clear_pending_tokens(self, future):
+        if self._pending_tokens and self._pending_tokens[1] is future:
+            self._pending_tokens = None
+
+    def _token_dict(self):
         return dict(
             id_token=self.id_token,
             access_token=self.access_token,
@@ -0,0 +1,119 @@
+"""
+JSON encoding and decoding, using a fast codec when one is installed.
+
+orjson or msgspec is used when installed, the json module otherwise. Set
+TRAINML_JSON_CODEC to orjson, msgspec or json to choose one.
+"""
+
+import os
+import json
+import logging
+
+
+class JsonCodec(object):
+    """The standard library json module, always available."""
+
+    name = "json"
+
+    def dumps(self, obj) -> str:
+        return json.dumps(obj)
+
+    def encode(self, obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._dumps(obj, option=self._options)
+        except TypeError:
+            ## e.g. integers beyond 64 bits, which json handles
+            return super().encode(obj)
+
+    def dumps(self, obj) -> str:
+        return self.encode(obj).decode("utf-8")
+
+    def loads(self, data):
+        ## orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._encode = msgspec.json.Encoder().encode
+        self._decode = msgspec.json.Decoder().decode
+        self._errors = (msgspec.EncodeError, TypeError, OverflowError)
+        self._decode_error = msgspec.DecodeError
+
+    def encode(self, obj) -> bytes:
+        try:
+            return self._encode(obj)
+        except self._errors:
+            return super().encode(obj)
+
+    def dumps(self, obj) -> str:
+        return self.encode(obj).decode("utf-8")
+
+    def loads(self, data):
+        try:
+            return self._decode(data)
+        except self._decode_error as e:
+            ## callers expect the errors json raises
+            raise json.JSONDecodeError(str(e), str(data), 0) from e
+
+
+CODECS = dict(orjson=OrjsonCodec, msgspec=MsgspecCodec, json=JsonCodec)
+
+
+def get_codec(name=None):
+    """Return the codec called name, or the first installed of CODECS."""
+    if name is not None:
+        if name not in CODECS:
+            raise ValueError(
+                f"Unknown JSON codec {name}, choose from {', '.join(CODECS)}"
+            )
+        return CODECS[name]()
+    for cls in CODECS.values():
+        try:
+            return cls()
+        except ImportError:
+            continue
+
+
+def use(name=None):
+    """
+    Switch the codec behind this module's dumps, encode and loads.
+
+    Callers look the functions up on the module when calling them, e.g.
+    codec.loads, so a switch applies everywhere.
+    """
+    global active, dumps, encode, loads
+    active = get_codec(name)
+    dumps = active.dumps
+    encode = active.encode
+    loads = active.loads
+    return active
+
+
+active = dumps = encode = loads = None
+try:
+    use(os.environ.get("TRAINML_JSON_CODEC"))
+except (ValueError, ImportError) as e:
+    logging.warning(f"Ignoring TRAINML_JSON_CODEC: {e}")
+    use()
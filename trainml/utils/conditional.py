@@ -0,0 +1,71 @@
+"""Validators of GET responses, so unchanged resources are not re-sent."""
+
+import copy
+import json
+import collections
+
+MAX_VALIDATED_RESPONSES = 256
+
+
+class ValidatorCache(object):
+    """
+    Remembers the last response of each GET request that carried an ETag or
+    Last-Modified validator.
+
+    Repeating the request sends the validators back as If-None-Match and
+    If-Modified-Since, and a 304 Not Modified answer is served from the
+    remembered response without downloading or parsing the payload again.
+    Callers get their own copy of the response, since the entities built
+    from it may be modified. The least recently used responses are dropped
+    beyond max_entries.
+    """
+
+    def __init__(self, max_entries=MAX_VALIDATED_RESPONSES):
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def key(url, params):
+        return (url, json.dumps(params, sort_keys=True, default=str))
+
+    def headers(self, key):
+        """Conditional request headers for key, empty if nothing is known."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return dict()
+        etag, last_modified, _ = entry
+        headers = dict()
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, key):
+        """The remembered response for key, after a 304 Not Modified."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def store(self, key, headers, results):
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not isinstance(etag, str):
+            etag = None
+        if not isinstance(last_modified, str):
+            last_modified = None
+        if not (etag or last_modified):
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = (etag, last_modified, copy.deepcopy(results))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,144 @@
+"""Base class for API entities that extract their fields on first use."""
+
+import time
+import weakref
+
+
+class IdentityMap(object):
+    """
+    Keeps one live object per entity for a client.
+
+    Entities are keyed by class and ID and held weakly, so the map never
+    keeps an entity alive on its own. A get(), list() or create() response
+    for an entity that is already mapped returns the mapped object with
+    the new payload merged into it. Enable it with
+    TrainML(identity_map=True).
+    """
+
+    def __init__(self):
+        self._entities = weakref.WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._entities)
+
+    def get(self, cls, id):
+        """Return the live cls entity with id, or None."""
+        return self._entities.get((cls, id))
+
+    def clear(self):
+        self._entities.clear()
+
+    def _merge(self, cls, trainml, payload):
+        id = cls._fields["_id"](payload)
+        entity = self._entities.get((cls, id))
+        if entity is None:
+            entity = cls(trainml, **payload)
+            if id is not None:
+                self._entities[(cls, id)] = entity
+        else:
+            ## fields missing from a partial response, e.g. a list, are kept
+            entity._reload({**getattr(entity, cls._payload), **payload})
+        entity._fetched_at = time.monotonic()
+        return entity
+
+
+class Entity(object):
+    """
+    An API entity backed by its raw payload.
+
+    Subclasses name the slot holding the payload in _payload and map each
+    private field to the function extracting it from the payload in
+    _fields, declaring both in __slots__. A field is only extracted the
+    first time it is read and then kept in its slot, so listing thousands
+    of entities does not pay for fields that are never used. Assigning a
+    field overrides it, _reload replaces the payload and drops the fields
+    extracted from the previous one unless both are equal. age tells how
+    long ago the payload was received, so callers can skip a refresh() of
+    recent data, and on_change() reports the fields a reload changed.
+    """
+
+    __slots__ = ("trainml", "_fetched_at", "_listeners", "__weakref__")
+    _payload = None
+    _fields = {}
+    _identity = True  ## whether the client's identity map tracks this class
+    _watched = ("status",)  ## payload keys on_change() watches by default
+    _hidden = ()  ## payload keys left out of exports, e.g. secrets
+
+    @classmethod
+    def _from_payload(cls, trainml, payload):
+        identity_map = getattr(trainml, "identity_map", None)
+        if (
+            isinstance(identity_map, IdentityMap)
+            and cls._identity
+            and "_id" in cls._fields
+        ):
+            return identity_map._merge(cls, trainml, payload)
+        return cls(trainml, **payload)
+
+    def __getattr__(self, name):
+        extract = type(self)._fields.get(name)
+        if extract is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        value = extract(getattr(self, self._payload))
+        setattr(self, name, value)
+        return value
+
+    @property
+    def age(self) -> float:
+        """
+        Seconds since the payload was received, None if unknown.
+
+        Known for entities of a client with an identity map and for
+        entities that were refreshed.
+        """
+        fetched_at = getattr(self, "_fetched_at", None)
+        return None if fetched_at is None else time.monotonic() - fetched_at
+
+    def is_fresh(self, max_age):
+        """Whether the payload is known to be at most max_age seconds old."""
+        age = self.age
+        return age is not None and age <= max_age
+
+    def on_change(self, callback, fields=None):
+        """
+        Call callback(entity, changes) when the entity is reloaded with a
+        different value for any of fields, payload keys that default to the
+        class' _watched keys. changes maps each changed key to its
+        (old, new) values. Returns a function that removes the callback.
+        """
+        listener = (callback, tuple(fields or self._watched))
+        listeners = getattr(self, "_listeners", None)
+        if listeners is None:
+            listeners = self._listeners = []
+        listeners.append(listener)
+        return lambda: listeners.remove(listener)
+
+    def _notify(self, previous, payload):
+        for callback, fields in list(self._listeners):
+            changes = {
+                field: (previous.get(field), payload.get(field))
+                for field in fields
+                if previous.get(field) != payload.get(field)
+            }
+            if changes:
+                callback(self, changes)
+
+    def _drop_fields(self):
+        for name in self._fields:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
+    def _reload(self, payload):
+        self._fetched_at = time.monotonic()
+        previous = getattr(self, self._payload)
+        if payload == previous:
+            ## e.g. a 304 Not Modified, the extracted fields are still valid
+            return
+        self._drop_fields()
+        self.__init__(self.trainml, **payload)
+        if getattr(self, "_listeners", None):
+            self._notify(previous, payload)
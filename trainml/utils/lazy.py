@@ -0,0 +1,24 @@
+"""Deferred imports for heavy dependencies."""
+
+import sys
+import importlib.util
+
+
+def lazy_import(name):
+    """
+    Return module `name`, deferring its execution until first attribute access.
+
+    Modules that are already imported are returned as is. Only the named
+    module is deferred; parent packages of dotted names are imported eagerly.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
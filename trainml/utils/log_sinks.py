@@ -0,0 +1,242 @@
+"""Buffered destinations for entity log messages."""
+
+import os
+import abc
+import sys
+import json
+import time
+import queue
+import logging
+import threading
+from datetime import datetime
+
+_timestamp_cache = (None, None)
+
+
+def format_timestamp(time_ms):
+    ## messages arrive in time order, so the last second formatted is
+    ## almost always the one needed next
+    global _timestamp_cache
+    second = int(time_ms) // 1000
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = datetime.fromtimestamp(second).strftime("%m/%d/%Y, %H:%M:%S")
+        _timestamp_cache = (second, text)
+    return text
+
+
+def format_log_message(data, prefix=None):
+    """
+    Format a log message the way attach() prints it.
+
+    The worker number is included for multi-worker jobs and prefix, when
+    given, identifies the entity the message belongs to.
+    """
+    labels = [prefix] if prefix else []
+    if data.get("worker_count", 0) > 1:
+        labels.append(f"Worker {data.get('worker_number')}")
+    label = f"{' '.join(labels)} - " if labels else ""
+    return f"{format_timestamp(data.get('time'))}: {label}{data.get('msg').rstrip()}"
+
+
+class LogSink(abc.ABC):
+    """
+    Receives log messages on the websocket loop and writes them in batches.
+
+    Messages are only queued by the handler, formatting and writing happen
+    on a writer thread that flushes every flush_interval seconds or once
+    batch_size messages are waiting. A warning is logged the first time
+    more than max_pending messages are queued, and metrics reports how far
+    the writer fell behind.
+    """
+
+    def __init__(
+        self,
+        formatter=format_log_message,
+        batch_size=500,
+        flush_interval=0.2,
+        max_pending=10000,
+    ):
+        self.formatter = formatter
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._queue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._closed = False
+        self._metrics = dict(
+            received=0,
+            written=0,
+            batches=0,
+            max_pending=0,
+            max_lag=0.0,
+        )
+
+    @property
+    def metrics(self) -> dict:
+        return dict(self._metrics, pending=self._queue.qsize())
+
+    def __call__(self, data):
+        self._put(data, None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def handler(self, prefix=None):
+        """Return a message handler that labels its messages with prefix."""
+
+        def handler(data):
+            self._put(data, prefix)
+
+        return handler
+
+    def _put(self, data, prefix):
+        if self._closed:
+            raise ValueError("Log sink is closed.")
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, daemon=True
+                    )
+                    self._thread.start()
+        self._queue.put((data, prefix, time.monotonic()))
+        self._metrics["received"] += 1
+
+    def _run(self):
+        done = False
+        while not done:
+            batch = []
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=timeout)
+                        if timeout > 0
+                        else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+            if batch:
+                self._flush(batch)
+
+    def _flush(self, batch):
+        pending = self._queue.qsize()
+        if pending > self._metrics["max_pending"]:
+            if (
+                pending > self.max_pending
+                and self._metrics["max_pending"] <= self.max_pending
+            ):
+                logging.warning(
+                    f"Log output is falling behind, {pending} messages pending"
+                )
+            self._metrics["max_pending"] = pending
+        try:
+            self.write(
+                [self.formatter(data, prefix) for data, prefix, _ in batch]
+            )
+        except Exception:
+            logging.exception("Unable to write log messages")
+        lag = time.monotonic() - batch[0][2]
+        self._metrics["max_lag"] = max(self._metrics["max_lag"], lag)
+        self._metrics["written"] += len(batch)
+        self._metrics["batches"] += 1
+
+    @abc.abstractmethod
+    def write(self, lines):
+        """Write a batch of formatted lines, called on the writer thread."""
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+        logging.debug(f"Log sink metrics: {self.metrics}")
+
+
+class StdoutSink(LogSink):
+    """Writes formatted log lines to stdout, or another text stream."""
+
+    def __init__(self, stream=None, **kwargs):
+        super().__init__(**kwargs)
+        self.stream = stream
+
+    def write(self, lines):
+        stream = self.stream or sys.stdout
+        stream.write("".join(f"{line}\n" for line in lines))
+        stream.flush()
+
+
+class RotatingFileSink(LogSink):
+    """
+    Appends formatted log lines to a file, rotating it at max_bytes.
+
+    Rotated files are renamed path.1 through path.backup_count, with the
+    oldest removed, the same scheme as logging's RotatingFileHandler.
+    """
+
+    def __init__(
+        self, path, max_bytes=10 * 1024 * 1024, backup_count=5, **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self._file = None
+
+    def _rotate(self):
+        self._file.close()
+        self._file = None
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def write(self, lines):
+        for line in lines:
+            if self._file is None:
+                self._file = open(self.path, "a", encoding="utf-8")
+            data = f"{line}\n"
+            if (
+                self.max_bytes > 0
+                and self._file.tell() > 0
+                and self._file.tell() + len(data.encode("utf-8"))
+                > self.max_bytes
+            ):
+                self._rotate()
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(data)
+        self._file.flush()
+
+    def close(self):
+        super().close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def format_json_message(data, prefix=None):
+    return json.dumps(dict(data, source=prefix) if prefix else data)
+
+
+class JsonlSink(RotatingFileSink):
+    """Appends each raw log message to a file as one JSON object per line."""
+
+    def __init__(self, path, **kwargs):
+        kwargs.setdefault("formatter", format_json_message)
+        super().__init__(path, **kwargs)
@@ -0,0 +1,360 @@
+"""Websocket connections for entity log and status subscriptions."""
+
+import asyncio
+import collections
+import logging
+import random
+import traceback
+
+from trainml.exceptions import ApiError, TrainMLException
+from trainml.utils.lazy import lazy_import
+from trainml.utils import codec
+
+aiohttp = lazy_import("aiohttp")
+
+END_GRACE_PERIOD = 15  ## seconds to keep delivering messages after an end
+MAX_CONNECTION_TRIES = 5
+RECONNECT_DELAY = 1  ## seconds before reconnecting, doubled each time
+RECONNECT_DELAY_MAX = 60
+DEDUP_WINDOW = 1000  ## recent messages remembered per subscription
+
+
+class LogSubscription(object):
+    def __init__(
+        self, entity, project_uuid, id, msg_handler, done, kind="logs"
+    ):
+        self.kind = kind
+        self.entity = entity
+        self.project_uuid = project_uuid
+        self.id = id
+        self.msg_handler = msg_handler
+        self.done = done
+        self.initialized = False
+        self.ended = False
+        self.last_times = dict()
+        self.watermarks = dict()
+        self._recent = collections.deque(maxlen=DEDUP_WINDOW)
+        self._recent_keys = set()
+        self._timer = None
+
+    @property
+    def key(self) -> tuple:
+        return (self.kind, self.id)
+
+    @property
+    def resume_time(self) -> int:
+        ## the oldest per stream position, so no stream misses messages
+        return min(self.last_times.values()) if self.last_times else None
+
+    def request(self, action, type, **kwargs):
+        return dict(
+            action=action,
+            data=dict(
+                type=type,
+                entity=self.entity,
+                id=self.id,
+                project_uuid=self.project_uuid,
+                **kwargs,
+            ),
+        )
+
+    def seen(self, data):
+        """
+        Record a delivered message, returning True if it is a duplicate.
+
+        Only messages at or before the stream's watermark, its last delivered
+        time when the backfill was requested, can repeat what was already
+        delivered. They are compared against a bounded window of recent
+        messages. Later messages are always delivered, even when live ones
+        arrive ahead of the backfill.
+        """
+        try:
+            time = int(data.get("time"))
+        except (TypeError, ValueError):
+            return False
+        stream = data.get("stream")
+        key = (stream, time, data.get("msg"))
+        watermark = self.watermarks.get(stream)
+        if (
+            watermark is not None
+            and time <= watermark
+            and key in self._recent_keys
+        ):
+            return True
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_keys.discard(self._recent[0])
+        self._recent.append(key)
+        self._recent_keys.add(key)
+        self.last_times[stream] = max(time, self.last_times.get(stream, time))
+        return False
+
+    def backfill(self):
+        """Options of the getlogs request, setting the watermarks."""
+        self.watermarks = dict(self.last_times)
+        if self.initialized and self.resume_time is not None:
+            ## only backfill from the last delivered message, the overlap
+            ## with what was already delivered is dropped as duplicates
+            return dict(start_time=self.resume_time)
+        return dict()
+
+    def end(self):
+        if not self.ended:
+            self.ended = True
+            self._timer = asyncio.get_running_loop().call_later(
+                END_GRACE_PERIOD, self.finish
+            )
+
+    def finish(self, error=None):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self.done.done():
+            return
+        if error is None:
+            self.done.set_result(None)
+        else:
+            self.done.set_exception(error)
+
+
+class LogConnection(object):
+    """
+    The websocket of one subscription, reconnecting until its entity ends.
+
+    Server messages only identify the worker stream they belong to, and end
+    messages identify nothing, so a socket cannot be shared by entities
+    without losing track of which one ended. On reconnect, the backfill
+    resumes from the last delivered message.
+    """
+
+    def __init__(self, trainml, subscription, heartbeat=30):
+        self.trainml = trainml
+        self.subscription = subscription
+        self.heartbeat = heartbeat
+        self._ws = None
+        self._received = False
+
+    async def _start(self):
+        subscription = self.subscription
+        if subscription.kind != "logs":
+            await self._ws.send_json(
+                subscription.request("subscribe", subscription.kind)
+            )
+            return
+        options = subscription.backfill()
+        subscription.initialized = True
+        await self._ws.send_json(
+            subscription.request("getlogs", "init", **options)
+        )
+        await self._ws.send_json(subscription.request("subscribe", "logs"))
+
+    def _dispatch(self, data):
+        self._received = True
+        subscription = self.subscription
+        if subscription.kind != "logs":
+            subscription.msg_handler(data)
+        elif data.get("type") == "end":
+            subscription.end()
+        elif subscription.seen(data):
+            logging.debug(f"Dropping duplicate log message: {data}")
+        else:
+            try:
+                subscription.msg_handler(data)
+            except Exception as e:
+                subscription.finish(e)
+
+    async def _get_tokens(self):
+        try:
+            return await self.trainml.auth.get_tokens_async()
+        except TrainMLException as e:
+            raise e
+        except Exception:
+            raise TrainMLException(
+                f"Error getting authorization tokens.  Verify configured credentials. Error: {traceback.format_exc()}"
+            )
+
+    async def _connect(self, session, tokens):
+        headers = {
+            "User-Agent": f"trainML-sdk/{self.trainml._version}",
+            "Content-Type": "application/json",
+        }
+        async with session.ws_connect(
+            f"wss://{self.trainml.ws_url}?Authorization={tokens.get('id_token')}",
+            headers=headers,
+            heartbeat=self.heartbeat,
+        ) as ws:
+            self._ws = ws
+            await self._start()
+            async for msg in ws:
+                if msg.type in (
+                    aiohttp.WSMsgType.CLOSED,
+                    aiohttp.WSMsgType.ERROR,
+                    aiohttp.WSMsgType.CLOSE,
+                ):
+                    logging.debug("Websocket Received Closed Message.")
+                    await ws.close()
+                    break
+                self._dispatch(codec.loads(msg.data))
+        self._ws = None
+        logging.debug(
+            f"Websocket Disconnected.  Ended? {self.subscription.ended}"
+        )
+
+    def _reconnect_delay(self, reconnects):
+        delay = min(
+            RECONNECT_DELAY * 2 ** (reconnects - 1), RECONNECT_DELAY_MAX
+        )
+        return delay * (random.random() + 0.5)
+
+    async def run(self):
+        subscription = self.subscription
+        connection_tries = 0
+        reconnects = 0
+        try:
+            async with self.trainml._client_session() as session:
+                while not subscription.ended:
+                    if reconnects:
+                        await asyncio.sleep(self._reconnect_delay(reconnects))
+                    tokens = await self._get_tokens()
+                    self._received = False
+                    try:
+                        await self._connect(session, tokens)
+                        connection_tries = 0
+                    except Exception:
+                        self._ws = None
+                        connection_tries += 1
+                        logging.debug(
+                            f"Connection error: {traceback.format_exc()}"
+                        )
+                        if connection_tries == MAX_CONNECTION_TRIES:
+                            raise ApiError(
+                                500,
+                                {
+                                    "message": f"Connection error: {traceback.format_exc()}"
+                                },
+                            )
+                    ## back off until a connection delivers messages again,
+                    ## so a server closing at once isn't reconnected to in a
+                    ## tight loop
+                    reconnects = 1 if self._received else reconnects + 1
+            ## ended subscriptions are done once the connection is gone
+            subscription.finish()
+        except Exception as e:
+            subscription.finish(e)
+
+
+class LogStream(object):
+    """
+    Runs the log subscriptions of a client, one LogConnection each.
+
+    Subscriptions share the client's HTTP session. Subscribing again to the
+    same entity replaces the previous subscription.
+
+    Besides logs, subscriptions of kind "status" receive the status change
+    events of an entity, see StatusWatch.
+    """
+
+    def __init__(self, trainml, heartbeat=30):
+        self.trainml = trainml
+        self.heartbeat = heartbeat
+        self._subscriptions = dict()
+
+    @property
+    def subscriptions(self) -> int:
+        return len(self._subscriptions)
+
+    async def subscribe(
+        self, entity, project_uuid, id, msg_handler, kind="logs"
+    ):
+        subscription = LogSubscription(
+            entity,
+            project_uuid,
+            id,
+            msg_handler,
+            asyncio.get_running_loop().create_future(),
+            kind=kind,
+        )
+        previous = self._subscriptions.get(subscription.key)
+        if previous is not None:
+            previous.finish()
+        self._subscriptions[subscription.key] = subscription
+        task = asyncio.ensure_future(
+            LogConnection(self.trainml, subscription, self.heartbeat).run()
+        )
+        try:
+            await subscription.done
+        finally:
+            if self._subscriptions.get(subscription.key) is subscription:
+                del self._subscriptions[subscription.key]
+            subscription.finish()
+            ## closes the websocket, if still open
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
+class StatusWatch(object):
+    """
+    Wakes a status polling loop as soon as the entity reports a change.
+
+    Status events are opt-in, with TrainML(status_events=True), since each
+    watch opens a websocket. Polling stays the source of truth, sleep()
+    just returns early when an event arrives, so waits still complete if
+    events are disabled or the websocket is unavailable.
+    """
+
+    def __init__(self, trainml, entity, project_uuid, id):
+        self.trainml = trainml
+        self.entity = entity
+        self.project_uuid = project_uuid
+        self.id = id
+        self.status = None
+        self.changed = asyncio.Event()
+        self._task = None
+
+    def _handler(self, data):
+        self.status = data.get("status")
+        self.changed.set()
+
+    async def __aenter__(self):
+        if not getattr(self.trainml, "status_events", False):
+            return self
+        try:
+            self._task = asyncio.ensure_future(
+                self.trainml.log_stream.subscribe(
+                    self.entity,
+                    self.project_uuid,
+                    self.id,
+                    self._handler,
+                    kind="status",
+                )
+            )
+        except Exception:
+            logging.debug(
+                f"Unable to watch {self.entity} {self.id} status, polling only: {traceback.format_exc()}"
+            )
+        return self
+
+    async def __aexit__(self, *args):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logging.debug(f"Status watch failed: {traceback.format_exc()}")
+
+    async def sleep(self, interval):
+        """Sleep for interval seconds or until a status event arrives."""
+        if self._task is None or self._task.done():
+            await asyncio.sleep(interval)
+            return
+        sleep = asyncio.ensure_future(asyncio.sleep(interval))
+        changed = asyncio.ensure_future(self.changed.wait())
+        try:
+            await asyncio.wait(
+                [sleep, changed], return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            sleep.cancel()
+            changed.cancel()
+        self.changed.clear()
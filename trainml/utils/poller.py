@@ -0,0 +1,148 @@
+"""Shared status polling for waiting on many entities at once."""
+
+import time
+import random
+import asyncio
+import logging
+
+from trainml.exceptions import ApiError, TrainMLException
+
+POLL_INTERVAL_INITIAL = 1
+POLL_INTERVAL_MIN = 5
+POLL_INTERVAL_MAX = 60
+POLL_BACKOFF = 1.5
+POLL_JITTER = 0.2
+
+## typical seconds until an entity reaches each status, polling backs off
+## to a tenth of it, so quick transitions keep being polled quickly
+EXPECTED_DURATIONS = {
+    "waiting for resources": 30,
+    "waiting for data/model download": 60,
+    "running": 60,
+    "stopped": 30,
+    "archived": 30,
+    "uploading": 300,
+    "ready": 300,
+    "active": 300,
+    "healthy": 300,
+    "finished": 1800,
+}
+
+
+class PollSchedule(object):
+    """
+    When to poll while waiting up to timeout seconds for status.
+
+    Polls start POLL_INTERVAL_INITIAL seconds apart and grow by POLL_BACKOFF
+    up to a tenth of the status' expected duration, kept between
+    POLL_INTERVAL_MIN and POLL_INTERVAL_MAX. Intervals are jittered so
+    many waiters do not poll in lockstep, and never run past the deadline.
+    """
+
+    def __init__(self, timeout=None, status=None):
+        ## without a timeout the schedule never expires
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        expected = EXPECTED_DURATIONS.get(
+            status, timeout or POLL_INTERVAL_MAX * 10
+        )
+        self.max_interval = max(
+            min(expected / 10, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
+        )
+        self.polls = 0
+        self._interval = POLL_INTERVAL_INITIAL
+
+    @property
+    def remaining(self) -> float:
+        if self.deadline is None:
+            return float("inf")
+        return max(self.deadline - time.monotonic(), 0)
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining <= 0
+
+    def next_interval(self):
+        interval = self._interval * random.uniform(
+            1 - POLL_JITTER, 1 + POLL_JITTER
+        )
+        self._interval = min(self._interval * POLL_BACKOFF, self.max_interval)
+        self.polls += 1
+        return min(interval, self.remaining)
+
+
+async def _list_statuses(collection, entities):
+    ## one list call per project covers every entity waited on in it
+    statuses = dict()
+    for project_uuid in {entity._project_uuid for entity in entities}:
+        if project_uuid:
+            items = await collection.list(project_uuid=project_uuid)
+        else:
+            items = await collection.list()
+        statuses.update({item.id: item.status for item in items})
+    return statuses
+
+
+async def as_completed(collection, entities, status, timeout=300):
+    """
+    Yield entities as they reach status, in the order they reach it.
+
+    All entities are polled together, each tick lists the collection once
+    per project and only the entities whose listed status changed are
+    refreshed, so API calls per tick do not grow with the number of
+    entities. Raises like the entity's wait_for when one fails, and
+    TrainMLException when timeout seconds pass first.
+    """
+    pending = dict()
+    for entity in entities:
+        entity._validate_wait_for(status, timeout)
+        pending[entity.id] = entity
+    ## listed statuses are compared with the previous tick, not with the
+    ## entities, which a client identity map updates while listing
+    last_statuses = {id: entity.status for id, entity in pending.items()}
+    for id, entity in list(pending.items()):
+        if entity._reached_status(status):
+            del pending[id]
+            yield entity
+
+    schedule = PollSchedule(timeout, status)
+    while pending:
+        if schedule.expired:
+            raise TrainMLException(f"Timeout waiting for {status}")
+        await asyncio.sleep(schedule.next_interval())
+        statuses = await _list_statuses(collection, pending.values())
+        for id, entity in list(pending.items()):
+            ## entities missing from the list are refreshed on their own
+            if id in statuses and statuses[id] == last_statuses[id]:
+                continue
+            last_statuses[id] = statuses.get(id)
+            try:
+                await entity.refresh()
+            except ApiError as e:
+                if status == "archived" and e.status == 404:
+                    del pending[id]
+                    yield entity
+                    continue
+                raise e
+            if entity._reached_status(status):
+                del pending[id]
+                yield entity
+        logging.debug(f"Waiting for {len(pending)} entities to be {status}")
+
+
+async def wait_all(collection, entities, status, timeout=300):
+    """Wait until all entities reach status, returning them."""
+    entities = list(entities)
+    async for _ in as_completed(collection, entities, status, timeout):
+        pass
+    return entities
+
+
+async def wait_any(collection, entities, status, timeout=300):
+    """Wait until one of the entities reaches status, returning it."""
+    waiting = as_completed(collection, entities, status, timeout)
+    try:
+        async for entity in waiting:
+            return entity
+    finally:
+        await waiting.aclose()
+    raise TrainMLException(f"No entities to wait for {status}")
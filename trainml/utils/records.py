@@ -0,0 +1,120 @@
+"""Tabular exports of entity listings, built from their raw payloads."""
+
+import csv
+import json
+
+from trainml.exceptions import TrainMLException
+
+
+def _payload(entity):
+    payload = getattr(entity, entity._payload)
+    hidden = entity._hidden
+    if not hidden:
+        return payload
+    return {k: v for k, v in payload.items() if k not in hidden}
+
+
+def _flatten(payload, prefix, row):
+    for key, value in payload.items():
+        if isinstance(value, dict) and value:
+            _flatten(value, f"{prefix}{key}.", row)
+        else:
+            row[f"{prefix}{key}"] = value
+    return row
+
+
+def _getter(field):
+    path = field.split(".")
+    if len(path) == 1:
+        return lambda payload: payload.get(field)
+
+    def get(payload):
+        for key in path:
+            if not isinstance(payload, dict):
+                return None
+            payload = payload.get(key)
+        return payload
+
+    return get
+
+
+def _rows(entities, fields):
+    getters = [_getter(field) for field in fields]
+    for entity in entities:
+        payload = _payload(entity)
+        yield [get(payload) for get in getters]
+
+
+def to_records(entities, fields=None):
+    """
+    Return one dict per entity mapping each field to its value.
+
+    fields are payload keys, with dots reaching into nested objects, e.g.
+    ["id", "status", "resources.gpu_count", "credits"]. Missing values are
+    None. Without fields, all keys are included, nested objects flattened.
+    """
+    if fields is None:
+        return [_flatten(_payload(entity), "", dict()) for entity in entities]
+    fields = list(fields)
+    return [dict(zip(fields, row)) for row in _rows(entities, fields)]
+
+
+def to_columns(entities, fields=None):
+    """
+    Return a dict mapping each field to the list of its values, one per
+    entity, ready for pandas.DataFrame or pyarrow.table. fields are
+    selected as in to_records.
+    """
+    if fields is None:
+        rows = [_flatten(_payload(entity), "", dict()) for entity in entities]
+        fields = dict.fromkeys(key for row in rows for key in row)
+        return {field: [row.get(field) for row in rows] for field in fields}
+    fields = list(fields)
+    columns = [[] for _ in fields]
+    appends = [column.append for column in columns]
+    for row in _rows(entities, fields):
+        for append, value in zip(appends, row):
+            append(value)
+    return dict(zip(fields, columns))
+
+
+def to_arrow(entities, fields=None):
+    """Return the entities as a pyarrow.Table, see to_columns."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise TrainMLException(
+            "Arrow and Parquet exports require pyarrow, install trainml[parquet]."
+        )
+    return pyarrow.table(to_columns(entities, fields))
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def write_csv(entities, file, fields=None):
+    """Write the entities as CSV with a header row to a text file."""
+    writer = csv.writer(file)
+    if fields is None:
+        records = to_records(entities)
+        fields = list(dict.fromkeys(key for row in records for key in row))
+        rows = ([row.get(field) for field in fields] for row in records)
+    else:
+        fields = list(fields)
+        rows = _rows(entities, fields)
+    writer.writerow(fields)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+
+
+def write_parquet(entities, file, fields=None):
+    """Write the entities as Parquet to a path or binary file."""
+    table = to_arrow(entities, fields)
+    import pyarrow.parquet
+
+    pyarrow.parquet.write_table(table, file)
@@ -0,0 +1,88 @@
+"""Partitioning of a local input directory into shards of similar size."""
+
+import os
+import heapq
+import shutil
+import logging
+
+from trainml.exceptions import SpecificationError
+
+
+def partition(sizes, shards):
+    """
+    Split sizes, a dict of item to size, into at most shards lists whose
+    total sizes are as even as possible.
+
+    Items are placed largest first on the currently smallest shard. Empty
+    shards are dropped, so fewer items than shards give one item each.
+    """
+    if shards < 1:
+        raise SpecificationError("shards", "At least one shard is required.")
+    heap = [(0, index) for index in range(shards)]
+    groups = [[] for _ in range(shards)]
+    for item in sorted(sizes, key=lambda item: (-sizes[item], item)):
+        total, index = heapq.heappop(heap)
+        groups[index].append(item)
+        heapq.heappush(heap, (total + sizes[item], index))
+    return [sorted(group) for group in groups if group]
+
+
+def _file_sizes(input_dir):
+    sizes = dict()
+    for root, _, files in os.walk(input_dir):
+        for file in files:
+            path = os.path.join(root, file)
+            sizes[os.path.relpath(path, input_dir)] = os.path.getsize(path)
+    return sizes
+
+
+def _link(source, target):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        ## another filesystem or no hard link support
+        shutil.copy2(source, target)
+
+
+def shard_directory(input_dir, shards, work_dir):
+    """
+    Split the files of input_dir into at most shards directories of
+    similar total size under work_dir, keeping their relative paths.
+
+    Files are hard linked where possible, and copied otherwise, since
+    uploads archive symbolic links rather than the files they point to.
+    Returns the shard directories.
+    """
+    input_dir = os.path.abspath(os.path.expanduser(input_dir))
+    sizes = _file_sizes(input_dir)
+    if not sizes:
+        raise SpecificationError(
+            "input_dir", f"No files to shard in {input_dir}."
+        )
+    shard_dirs = []
+    for index, group in enumerate(partition(sizes, shards)):
+        shard_dir = os.path.join(work_dir, f"shard-{index}")
+        for path in group:
+            _link(os.path.join(input_dir, path), os.path.join(shard_dir, path))
+        shard_dirs.append(shard_dir)
+    return shard_dirs
+
+
+def merge_outputs(shard_output_dir, output_dir):
+    """
+    Move the contents of a shard's output directory into output_dir.
+
+    Entries whose name is already taken in output_dir stay in the shard's
+    directory, which is removed once empty.
+    """
+    for entry in sorted(os.listdir(shard_output_dir)):
+        target = os.path.join(output_dir, entry)
+        if os.path.exists(target):
+            logging.warning(
+                f"{target} already exists, keeping {entry} in {shard_output_dir}"
+            )
+            continue
+        shutil.move(os.path.join(shard_output_dir, entry), target)
+    if not os.listdir(shard_output_dir):
+        os.rmdir(shard_output_dir)
@@ -0,0 +1,85 @@
+"""Expansion of a job template over a grid of parameter values."""
+
+import itertools
+
+from trainml.exceptions import SpecificationError
+
+## create() arguments a lone placeholder substitutes without formatting
+NUMERIC_ARGUMENTS = ("gpu_count", "cpu_count", "disk_size", "max_price")
+
+
+def expand_grid(grid):
+    """
+    Return every combination of the grid's parameter values as dicts.
+
+    grid maps each parameter name to a list of values, a single value is
+    treated as a list of one. Combinations vary the last parameter fastest.
+    """
+    names = list(grid)
+    values = [
+        value if isinstance(value, (list, tuple)) else [value]
+        for value in grid.values()
+    ]
+    return [dict(zip(names, combo)) for combo in itertools.product(*values)]
+
+
+def render(value, params):
+    """
+    Fill the {name} placeholders of every string in value with params.
+
+    Dicts and lists are rendered recursively and strings stay strings, as
+    environment variable values must. Literal braces are written {{ and }}.
+    """
+    if isinstance(value, str):
+        try:
+            return value.format(**params)
+        except (KeyError, IndexError, ValueError) as e:
+            raise SpecificationError(
+                "template", f"Unable to render '{value}': {e!r}"
+            )
+    if isinstance(value, dict):
+        return {k: render(v, params) for k, v in value.items()}
+    if isinstance(value, list):
+        return [render(v, params) for v in value]
+    return value
+
+
+def render_argument(name, value, params):
+    """
+    Render a top level Jobs.create() argument. For the numeric arguments, a
+    string that is exactly one placeholder takes the parameter's value as
+    is, so gpu_count "{gpus}" renders to an integer.
+    """
+    if (
+        name in NUMERIC_ARGUMENTS
+        and isinstance(value, str)
+        and value.startswith("{")
+        and value.endswith("}")
+        and value[1:-1] in params
+    ):
+        return params[value[1:-1]]
+    return render(value, params)
+
+
+def sweep_specs(template, grid):
+    """
+    Render template, a dict of Jobs.create() arguments, once per grid
+    combination. Parameters are also available as {index}, the number of
+    the combination. Names without a placeholder get -{index} appended, so
+    every job of the sweep has its own name.
+    """
+    name = template.get("name")
+    if not name:
+        raise SpecificationError("name", "A sweep template needs a name.")
+    if "{" not in name.replace("{{", ""):
+        template = dict(template, name=f"{name}-{{index}}")
+    specs = []
+    for index, params in enumerate(expand_grid(grid)):
+        params = dict(params, index=index)
+        specs.append(
+            {
+                key: render_argument(key, value, params)
+                for key, value in template.items()
+            }
+        )
+    return specs
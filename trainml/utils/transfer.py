@@ -5,23 +5,17 @@ import sys
 import math
 import time
 import asyncio
-import aiohttp
-import aiofiles
 import hashlib
 import logging
 import uuid
-from aiohttp.client_exceptions import (
-    ClientResponseError,
-    ClientConnectorError,
-    ServerTimeoutError,
-    ServerDisconnectedError,
-    ClientOSError,
-    ClientPayloadError,
-    InvalidURL,
-)
+from trainml.utils.lazy import lazy_import
+from trainml.utils import codec
 from trainml.exceptions import ConnectionError as TrainMLConnectionError
 from trainml.exceptions import TrainMLException
 
+aiohttp = lazy_import("aiohttp")
+aiofiles = lazy_import("aiofiles")
+
 MAX_RETRIES = 5
 RETRY_BACKOFF = 2  # Exponential backoff base (2^attempt)
 PARALLEL_UPLOADS = 10  # Max concurrent uploads
@@ -205,13 +199,13 @@ async def ping_endpoint(
                         return
                     # For any non-200 status, retry
                     text = await response.text()
-                    raise ClientResponseError(
+                    raise aiohttp.ClientResponseError(
                         request_info=response.request_info,
                         history=response.history,
                         status=response.status,
                         message=text,
                     )
-        except ClientResponseError as e:
+        except aiohttp.ClientResponseError as e:
             # Retry on any HTTP error status
             if attempt < effective_max_retries:
                 logging.debug(
@@ -228,7 +222,7 @@ async def ping_endpoint(
                 f"Endpoint {endpoint} ping failed after {effective_max_retries} attempts. "
                 f"Last error: HTTP {e.status} - {str(e)}"
             ) from e
-        except ClientConnectorError as e:
+        except aiohttp.ClientConnectorError as e:
             # DNS resolution errors need more retries and initial delay
             # Use the higher of DNS_MAX_RETRIES or calculated ping retries
             if effective_max_retries == ping_max_retries:
@@ -253,10 +247,10 @@ async def ping_endpoint(
                 f"Endpoint {endpoint} ping failed after {effective_max_retries} attempts due to DNS/connection error: {str(e)}"
             ) from e
         except (
-            ServerDisconnectedError,
-            ClientOSError,
-            ServerTimeoutError,
-            ClientPayloadError,
+            aiohttp.ServerDisconnectedError,
+            aiohttp.ClientOSError,
+            aiohttp.ServerTimeoutError,
+            aiohttp.ClientPayloadError,
             asyncio.TimeoutError,
         ) as e:
             if attempt < effective_max_retries:
@@ -298,7 +292,7 @@ async def retry_request(
     while attempt <= effective_max_retries:
         try:
             return await func(*args, **kwargs)
-        except ClientResponseError as e:
+        except aiohttp.ClientResponseError as e:
             if e.status in RETRY_STATUSES and attempt < max_retries:
                 logging.debug(
                     "Retry %s/%s due to %s: %s",
@@ -311,7 +305,7 @@ async def retry_request(
                 attempt += 1
                 continue
             raise
-        except ClientConnectorError as e:
+        except aiohttp.ClientConnectorError as e:
             # DNS resolution errors need more retries and initial delay
             # Update effective_max_retries if this is the first DNS error
             if effective_max_retries == max_retries:
@@ -334,10 +328,10 @@ async def retry_request(
                 continue
             raise
         except (
-            ServerDisconnectedError,
-            ClientOSError,
-            ServerTimeoutError,
-            ClientPayloadError,
+            aiohttp.ServerDisconnectedError,
+            aiohttp.ClientOSError,
+            aiohttp.ServerTimeoutError,
+            aiohttp.ClientPayloadError,
             asyncio.TimeoutError,
         ) as e:
             if attempt < max_retries:
@@ -374,7 +368,7 @@ async def upload_chunk(
         ) as response:
             if response.status == 200:
                 try:
-                    payload = await response.json()
+                    payload = await response.json(loads=codec.loads)
                 except (aiohttp.ContentTypeError, json.JSONDecodeError):
                     payload = {}
                 await response.release()
@@ -384,7 +378,7 @@ async def upload_chunk(
                 return end + 1
             elif response.status in RETRY_STATUSES:
                 text = await response.text()
-                raise ClientResponseError(
+                raise aiohttp.ClientResponseError(
                     request_info=response.request_info,
                     history=response.history,
                     status=response.status,
@@ -392,7 +386,7 @@ async def upload_chunk(
                 )
             elif response.status == 409:
                 text = await response.text()
-                raise ClientResponseError(
+                raise aiohttp.ClientResponseError(
                     request_info=response.request_info,
                     history=response.history,
                     status=response.status,
@@ -418,13 +412,13 @@ async def get_upload_status(
         ) as response:
             if response.status != 200:
                 text = await response.text()
-                raise ClientResponseError(
+                raise aiohttp.ClientResponseError(
                     request_info=response.request_info,
                     history=response.history,
                     status=response.status,
                     message=text,
                 )
-            return await response.json()
+            return await response.json(loads=codec.loads)
 
     data = await retry_request(_status)
     expected_offset = data.get("expected_offset")
@@ -501,7 +495,9 @@ async def upload(endpoint, auth_token, path, show_progress=True):
         sock_read=10 * 60,
     )
 
-    async with aiohttp.ClientSession(timeout=timeout) as session:
+    async with aiohttp.ClientSession(
+        timeout=timeout, json_serialize=codec.dumps
+    ) as session:
         buffered_chunk = None
         buffered_start = 0
 
@@ -543,7 +539,7 @@ async def upload(endpoint, auth_token, path, show_progress=True):
                     )
                 offset = end + 1
                 buffered_chunk = None
-            except ClientResponseError as e:
+            except aiohttp.ClientResponseError as e:
                 if e.status not in RETRY_STATUSES and e.status != 409:
                     raise
                 server_offset = await get_upload_status(
@@ -560,11 +556,11 @@ async def upload(endpoint, auth_token, path, show_progress=True):
                     "Cannot safely resume tar stream."
                 ) from e
             except (
-                ServerDisconnectedError,
-                ClientConnectorError,
-                ClientOSError,
-                ServerTimeoutError,
-                ClientPayloadError,
+                aiohttp.ServerDisconnectedError,
+                aiohttp.ClientConnectorError,
+                aiohttp.ClientOSError,
+                aiohttp.ServerTimeoutError,
+                aiohttp.ClientPayloadError,
                 asyncio.TimeoutError,
             ) as exc:
                 server_offset = await get_upload_status(
@@ -612,7 +608,7 @@ async def upload(endpoint, auth_token, path, show_progress=True):
                 if response.status != 200:
                     text = await response.text()
                     raise TrainMLConnectionError(f"Finalize failed: {text}")
-                return await response.json()
+                return await response.json(loads=codec.loads)
 
         data = await retry_request(_finalize)
         logging.debug("Upload finalized: %s", data)
@@ -650,7 +646,7 @@ async def download(
 
     # First, check server info to see if ARCHIVE is set
     # If /info endpoint is not available, default to False (TAR stream mode)
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(json_serialize=codec.dumps) as session:
         use_archive = False
         try:
 
@@ -668,37 +664,39 @@ async def download(
                                 f"Unable to read response body "
                                 f"(status: {response.status})"
                             )
-                        raise ClientResponseError(
+                        raise aiohttp.ClientResponseError(
                             request_info=response.request_info,
                             history=response.history,
                             status=response.status,
                             message=error_text,
                         )
-                    return await response.json()
+                    return await response.json(loads=codec.loads)
 
             info = await retry_request(_get_info)
             use_archive = info.get("archive", False)
-        except InvalidURL as e:
+        except aiohttp.InvalidURL as e:
             raise TrainMLConnectionError(
                 f"Invalid endpoint URL: {endpoint}. "
                 f"Please ensure the URL includes a protocol (http:// or https://). "
                 f"Error: {str(e)}"
             ) from e
-        except (TrainMLConnectionError, ClientResponseError) as e:
+        except (TrainMLConnectionError, aiohttp.ClientResponseError) as e:
             # If /info endpoint is not available (404) or other error,
             # default to TAR stream mode and continue
             if isinstance(e, TrainMLConnectionError) and "404" in str(e):
                 logging.debug(
                     "Warning: /info endpoint not available, defaulting to TAR stream mode"
                 )
-            elif isinstance(e, ClientResponseError) and e.status == 404:
+            elif (
+                isinstance(e, aiohttp.ClientResponseError) and e.status == 404
+            ):
                 logging.debug(
                     "Warning: /info endpoint not available, defaulting to TAR stream mode"
                 )
             else:
                 # For other errors, convert ClientResponseError to TrainMLConnectionError
                 # to maintain backward compatibility
-                if isinstance(e, ClientResponseError):
+                if isinstance(e, aiohttp.ClientResponseError):
                     error_msg = getattr(e, "message", str(e))
                     raise TrainMLConnectionError(
                         f"Failed to get server info (status {e.status}): {error_msg}"
@@ -721,7 +719,7 @@ async def download(
                 response.close()
                 # Raise ClientResponseError for non-200 status
                 # Note: 404 and other errors should be rare now since ping_endpoint ensures readiness
-                raise ClientResponseError(
+                raise aiohttp.ClientResponseError(
                     request_info=response.request_info,
                     history=response.history,
                     status=response.status,
@@ -885,7 +883,7 @@ async def download(
                 if response.status != 200:
                     text = await response.text()
                     raise TrainMLConnectionError(f"Finalize failed: {text}")
-                return await response.json()
+                return await response.json(loads=codec.loads)
 
         data = await retry_request(_finalize)
         logging.debug("Download finalized: %s", data)
@@ -1,8 +1,5 @@
 import json
 import logging
-import math
-import asyncio
-from datetime import datetime
 
 from .exceptions import (
     VolumeError,
@@ -11,6 +8,10 @@ from .exceptions import (
     TrainMLException,
 )
 from trainml.utils.transfer import upload, download
+from trainml.utils.log_sinks import format_log_message
+from trainml.utils.log_stream import StatusWatch
+from trainml.utils import poller
+from trainml.utils.entity import Entity
 
 
 class Volumes(object):
@@ -19,11 +20,13 @@ class Volumes(object):
 
     async def get(self, id, **kwargs):
         resp = await self.trainml._query(f"/volume/{id}", "GET", kwargs)
-        return Volume(self.trainml, **resp)
+        return Volume._from_payload(self.trainml, resp)
 
     async def list(self, **kwargs):
         resp = await self.trainml._query(f"/volume", "GET", kwargs)
-        volumes = [Volume(self.trainml, **volume) for volume in resp]
+        volumes = [
+            Volume._from_payload(self.trainml, volume) for volume in resp
+        ]
         return volumes
 
     async def create(
@@ -50,7 +53,7 @@ class Volumes(object):
         payload = {k: v for k, v in data.items() if v is not None}
         logging.info(f"Creating Volume {name}")
         resp = await self.trainml._query("/volume", "POST", None, payload)
-        volume = Volume(self.trainml, **resp)
+        volume = Volume._from_payload(self.trainml, resp)
         logging.info(f"Created Volume {name} with id {volume.id}")
 
         return volume
@@ -60,18 +63,32 @@ class Volumes(object):
             f"/volume/{id}", "DELETE", dict(**kwargs, force=True)
         )
 
+    async def wait_all(self, volumes, status, timeout=300):
+        return await poller.wait_all(self, volumes, status, timeout)
+
+    async def wait_any(self, volumes, status, timeout=300):
+        return await poller.wait_any(self, volumes, status, timeout)
+
+    def as_completed(self, volumes, status, timeout=300):
+        return poller.as_completed(self, volumes, status, timeout)
+
+
+class Volume(Entity):
+    _payload = "_volume"
+    _fields = dict(
+        _id=lambda d: d.get("id", d.get("id")),
+        _status=lambda d: d.get("status"),
+        _name=lambda d: d.get("name"),
+        _capacity=lambda d: d.get("capacity"),
+        _used_size=lambda d: d.get("used_size"),
+        _billed_size=lambda d: d.get("billed_size"),
+        _project_uuid=lambda d: d.get("project_uuid"),
+    )
+    __slots__ = ("_volume", *_fields)
 
-class Volume:
     def __init__(self, trainml, **kwargs):
         self.trainml = trainml
         self._volume = kwargs
-        self._id = self._volume.get("id", self._volume.get("id"))
-        self._status = self._volume.get("status")
-        self._name = self._volume.get("name")
-        self._capacity = self._volume.get("capacity")
-        self._used_size = self._volume.get("used_size")
-        self._billed_size = self._volume.get("billed_size")
-        self._project_uuid = self._volume.get("project_uuid")
 
     @property
     def id(self) -> str:
@@ -176,7 +193,7 @@ class Volume:
             dict(project_uuid=self._project_uuid),
             dict(name=name),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     async def export(self, output_type, output_uri, output_options=dict()):
@@ -190,7 +207,7 @@ class Volume:
                 output_options=output_options,
             ),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
     def _get_msg_handler(self, msg_handler):
@@ -199,12 +216,7 @@ class Volume:
                 if msg_handler:
                     msg_handler(data)
                 else:
-                    timestamp = datetime.fromtimestamp(
-                        int(data.get("time")) / 1000
-                    )
-                    print(
-                        f"{timestamp.strftime('%m/%d/%Y, %H:%M:%S')}: {data.get('msg').rstrip()}"
-                    )
+                    print(format_log_message(data))
 
         return handler
 
@@ -224,46 +236,50 @@ class Volume:
             "GET",
             dict(project_uuid=self._project_uuid),
         )
-        self.__init__(self.trainml, **resp)
+        self._reload(resp)
         return self
 
-    async def wait_for(self, status, timeout=300):
-        if self.status == status:
-            return
+    def _validate_wait_for(self, status, timeout):
         valid_statuses = ["downloading", "ready", "exporting", "archived"]
         if not status in valid_statuses:
             raise SpecificationError(
                 "status",
                 f"Invalid wait_for status {status}.  Valid statuses are: {valid_statuses}",
             )
-
         MAX_TIMEOUT = 24 * 60 * 60
         if timeout > MAX_TIMEOUT:
             raise SpecificationError(
                 "timeout",
                 f"timeout must be less than {MAX_TIMEOUT} seconds.",
             )
-        POLL_INTERVAL_MIN = 5
-        POLL_INTERVAL_MAX = 60
-        POLL_INTERVAL = max(
-            min(timeout / 60, POLL_INTERVAL_MAX), POLL_INTERVAL_MIN
-        )
-        retry_count = math.ceil(timeout / POLL_INTERVAL)
-        count = 0
-        while count < retry_count:
-            await asyncio.sleep(POLL_INTERVAL)
-            try:
-                await self.refresh()
-            except ApiError as e:
-                if status == "archived" and e.status == 404:
-                    return
-                raise e
-            if self.status == status:
-                return self
-            elif self.status == "failed":
-                raise VolumeError(self.status, self)
-            else:
-                count += 1
-                logging.debug(f"self: {self}, retry count {count}")
+
+    def _reached_status(self, status):
+        if self.status == status:
+            return True
+        elif self.status == "failed":
+            raise VolumeError(self.status, self)
+        return False
+
+    async def wait_for(self, status, timeout=300):
+        if self.status == status:
+            return
+        self._validate_wait_for(status, timeout)
+
+        schedule = poller.PollSchedule(timeout, status)
+        async with StatusWatch(
+            self.trainml, "volume", self._project_uuid, self.id
+        ) as watch:
+            while not schedule.expired:
+                await watch.sleep(schedule.next_interval())
+                try:
+                    await self.refresh()
+                except ApiError as e:
+                    if status == "archived" and e.status == 404:
+                        return
+                    raise e
+                if self._reached_status(status):
+                    return self
+                else:
+                    logging.debug(f"self: {self}, poll {schedule.polls}")
 
         raise TrainMLException(f"Timeout waiting for {status}")